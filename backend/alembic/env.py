@@ -1,5 +1,6 @@
 """Alembic 환경 설정."""
 import asyncio
+import re
 from logging.config import fileConfig
 
 from sqlalchemy import pool
@@ -28,6 +29,30 @@ if config.config_file_name is not None:
 # 모델 메타데이터 설정 (autogenerate 지원)
 target_metadata = Base.metadata
 
+# 앱이 직접 관리하는 테이블 (월별 파티션, 파티션 보관 테이블)은 autogenerate 대상에서 제외
+_UNMANAGED_TABLE_PATTERN = re.compile(r"^(?:(?:reservations|payments)_(?:p\d{6}|default)|partition_archives)$")
+
+
+def include_name(name, type_, parent_names) -> bool:
+    """autogenerate 비교 대상 필터."""
+    if type_ == "table":
+        return not _UNMANAGED_TABLE_PATTERN.match(name)
+    return True
+
+
+# PostgreSQL이 파티션마다 복제한 외래 키 (payments_reservation_id_scheduled_date_fkey1 등)
+_PARTITION_FK_PATTERN = re.compile(r"^payments_reservation_id_scheduled_date_fkey\d+$")
+
+
+def include_object(object_, name, type_, reflected, compare_to) -> bool:
+    """autogenerate 비교 대상 필터 (파티션에 복제된 외래 키 제외)."""
+    if type_ == "foreign_key_constraint" and reflected:
+        if name and _PARTITION_FK_PATTERN.match(name):
+            return False
+        if _UNMANAGED_TABLE_PATTERN.match(object_.referred_table.name):
+            return False
+    return True
+
 
 def run_migrations_offline() -> None:
     """오프라인 모드로 마이그레이션 실행.
@@ -38,6 +63,8 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_name=include_name,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -48,7 +75,12 @@ def run_migrations_offline() -> None:
 
 def do_run_migrations(connection: Connection) -> None:
     """마이그레이션 실행."""
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_name=include_name,
+        include_object=include_object,
+    )
 
     with context.begin_transaction():
         context.run_migrations()
@@ -0,0 +1,46 @@
+"""add partial comments listing index
+
+Revision ID: a7d4e6f0c215
+Revises: f3c8d1a92b47
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d4e6f0c215'
+down_revision: Union[str, None] = 'f3c8d1a92b47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 삭제되지 않은 행만 인덱싱 (모든 ORM 조회에 is_deleted = false 조건이 붙음)
+LIVE_ROWS = sa.text('is_deleted = false')
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY는 트랜잭션 밖에서만 실행 가능
+    with op.get_context().autocommit_block():
+        # 게시글별 댓글 목록 (작성순)
+        op.create_index(
+            'ix_comments_post_id_created_at',
+            'comments',
+            ['post_id', 'created_at'],
+            unique=False,
+            postgresql_where=LIVE_ROWS,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_comments_post_id_created_at',
+            table_name='comments',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,190 @@
+"""partition reservations and payments by scheduled_date month
+
+Revision ID: b5c2e8f1d437
+Revises: a7d4e6f0c215
+Create Date: 2026-10-19 16:00:00.000000
+
+기존 테이블을 파티션 테이블로 바꾸려면 데이터를 복사해야 하므로 점검 시간에
+실행해야 합니다 (복사 동안 예약/결제/리뷰 쓰기가 차단됨). 기존 데이터의 예약 월을
+조회해 파티션을 만들므로 오프라인(--sql) 모드는 지원하지 않습니다.
+"""
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5c2e8f1d437'
+down_revision: Union[str, None] = 'a7d4e6f0c215'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LIVE_ROWS = sa.text('is_deleted = false')
+
+# 파티션 테이블 부모에 다시 만들 부분 인덱스 (이름, 테이블, 컬럼)
+INDEXES = [
+    (
+        'ix_reservations_manager_id_scheduled_date_status',
+        'reservations',
+        ['manager_id', 'scheduled_date', 'status'],
+    ),
+    ('ix_reservations_user_id_created_at', 'reservations', ['user_id', sa.text('created_at DESC')]),
+    ('ix_payments_created_at', 'payments', [sa.text('created_at DESC')]),
+]
+
+# 현재 월 이후 미리 만들 파티션 수 (이후에는 PARTITION_MONTHS_AHEAD 설정에 따라 앱이 생성)
+MONTHS_AHEAD = 12
+
+
+def _month_start(value: date) -> date:
+    return value.replace(day=1)
+
+
+def _add_months(value: date, months: int) -> date:
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _create_partitions(table: str, first_month: date, last_month: date) -> None:
+    """first_month부터 last_month까지 월별 파티션과 기본(DEFAULT) 파티션 생성."""
+    month = first_month
+    while month <= last_month:
+        op.execute(
+            f"CREATE TABLE {table}_p{month:%Y%m} PARTITION OF {table} "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{_add_months(month, 1).isoformat()}')"
+        )
+        month = _add_months(month, 1)
+    op.execute(f'CREATE TABLE {table}_default PARTITION OF {table} DEFAULT')
+
+
+def upgrade() -> None:
+    # 1. 결제에 파티션 키(예약일) 추가
+    op.add_column('payments', sa.Column('scheduled_date', sa.Date(), nullable=True))
+    op.execute(
+        'UPDATE payments SET scheduled_date = reservations.scheduled_date '
+        'FROM reservations WHERE reservations.id = payments.reservation_id'
+    )
+    op.alter_column('payments', 'scheduled_date', nullable=False)
+
+    # 2. 기존 테이블을 옆으로 치우고 제약/인덱스 이름을 비움
+    #    리뷰는 보관 후 삭제되는 예약 파티션을 참조할 수 없으므로 외래 키 제거
+    op.drop_constraint('reviews_reservation_id_fkey', 'reviews', type_='foreignkey')
+    op.drop_constraint('payments_reservation_id_fkey', 'payments', type_='foreignkey')
+    for name, table, _ in INDEXES:
+        op.drop_index(name, table_name=table)
+    op.rename_table('reservations', 'reservations_unpartitioned')
+    op.rename_table('payments', 'payments_unpartitioned')
+    op.execute('ALTER INDEX reservations_pkey RENAME TO reservations_unpartitioned_pkey')
+    op.execute('ALTER INDEX payments_pkey RENAME TO payments_unpartitioned_pkey')
+    op.execute('ALTER INDEX payments_reservation_id_key RENAME TO payments_unpartitioned_reservation_id_key')
+
+    # 3. 예약일 기준 RANGE 파티션 테이블 (기본 키/유니크 키에 파티션 키 포함)
+    op.execute(
+        'CREATE TABLE reservations (LIKE reservations_unpartitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS) '
+        'PARTITION BY RANGE (scheduled_date)'
+    )
+    op.create_primary_key('reservations_pkey', 'reservations', ['id', 'scheduled_date'])
+    op.create_foreign_key(
+        'reservations_user_id_fkey', 'reservations', 'users', ['user_id'], ['id'], ondelete='CASCADE'
+    )
+    op.create_foreign_key(
+        'reservations_manager_id_fkey', 'reservations', 'users', ['manager_id'], ['id'], ondelete='SET NULL'
+    )
+
+    op.execute(
+        'CREATE TABLE payments (LIKE payments_unpartitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS) '
+        'PARTITION BY RANGE (scheduled_date)'
+    )
+    op.create_primary_key('payments_pkey', 'payments', ['id', 'scheduled_date'])
+    op.create_unique_constraint(
+        'payments_reservation_id_scheduled_date_key', 'payments', ['reservation_id', 'scheduled_date']
+    )
+    op.create_foreign_key(
+        'payments_reservation_id_scheduled_date_fkey',
+        'payments',
+        'reservations',
+        ['reservation_id', 'scheduled_date'],
+        ['id', 'scheduled_date'],
+        ondelete='CASCADE',
+        onupdate='CASCADE',
+    )
+
+    # 4. 가장 오래된 예약 월부터 MONTHS_AHEAD개월 뒤까지 파티션 생성
+    oldest = op.get_bind().execute(
+        sa.text('SELECT min(scheduled_date) FROM reservations_unpartitioned')
+    ).scalar()
+    current_month = _month_start(date.today())
+    first_month = min(_month_start(oldest), current_month) if oldest else current_month
+    last_month = _add_months(current_month, MONTHS_AHEAD)
+    for table in ('reservations', 'payments'):
+        _create_partitions(table, first_month, last_month)
+
+    # 5. 데이터 복사 후 기존 테이블 삭제
+    op.execute('INSERT INTO reservations SELECT * FROM reservations_unpartitioned')
+    op.execute('INSERT INTO payments SELECT * FROM payments_unpartitioned')
+    op.drop_table('payments_unpartitioned')
+    op.drop_table('reservations_unpartitioned')
+
+    # 부모에 만든 인덱스는 모든 파티션(이후 생성되는 파티션 포함)에 적용됨
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, unique=False, postgresql_where=LIVE_ROWS)
+
+    # 6. 보관된 파티션 (월별 행을 묶음 단위 JSONB로 저장, JSONB는 TOAST로 압축 저장됨)
+    op.create_table(
+        'partition_archives',
+        sa.Column('table_name', sa.String(length=63), nullable=False),
+        sa.Column('month', sa.Date(), nullable=False),
+        sa.Column('chunk', sa.Integer(), nullable=False),
+        sa.Column('row_count', sa.Integer(), nullable=False),
+        sa.Column('rows', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('archived_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('table_name', 'month', 'chunk'),
+    )
+
+
+def downgrade() -> None:
+    # 보관(partition_archives)된 행은 복원하지 않음. 보관된 예약을 참조하는 리뷰가 있으면
+    # 마지막 리뷰 외래 키 생성이 실패하므로 먼저 정리해야 함
+    op.drop_table('partition_archives')
+    for name, table, _ in INDEXES:
+        op.drop_index(name, table_name=table)
+
+    op.rename_table('reservations', 'reservations_partitioned')
+    op.rename_table('payments', 'payments_partitioned')
+    op.execute('ALTER INDEX reservations_pkey RENAME TO reservations_partitioned_pkey')
+    op.execute('ALTER INDEX payments_pkey RENAME TO payments_partitioned_pkey')
+    op.execute(
+        'ALTER INDEX payments_reservation_id_scheduled_date_key '
+        'RENAME TO payments_partitioned_reservation_id_scheduled_date_key'
+    )
+
+    op.execute('CREATE TABLE reservations (LIKE reservations_partitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS)')
+    op.execute('INSERT INTO reservations SELECT * FROM reservations_partitioned')
+    op.create_primary_key('reservations_pkey', 'reservations', ['id'])
+    op.create_foreign_key(
+        'reservations_user_id_fkey', 'reservations', 'users', ['user_id'], ['id'], ondelete='CASCADE'
+    )
+    op.create_foreign_key(
+        'reservations_manager_id_fkey', 'reservations', 'users', ['manager_id'], ['id'], ondelete='SET NULL'
+    )
+
+    op.execute('CREATE TABLE payments (LIKE payments_partitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS)')
+    op.execute('INSERT INTO payments SELECT * FROM payments_partitioned')
+    op.drop_table('payments_partitioned')
+    op.drop_table('reservations_partitioned')
+
+    op.drop_column('payments', 'scheduled_date')
+    op.create_primary_key('payments_pkey', 'payments', ['id'])
+    op.create_unique_constraint('payments_reservation_id_key', 'payments', ['reservation_id'])
+    op.create_foreign_key(
+        'payments_reservation_id_fkey', 'payments', 'reservations', ['reservation_id'], ['id'], ondelete='CASCADE'
+    )
+    op.create_foreign_key(
+        'reviews_reservation_id_fkey', 'reviews', 'reservations', ['reservation_id'], ['id'], ondelete='CASCADE'
+    )
+
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, unique=False, postgresql_where=LIVE_ROWS)
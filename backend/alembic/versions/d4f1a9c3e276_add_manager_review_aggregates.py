@@ -0,0 +1,83 @@
+"""add manager review aggregates
+
+Revision ID: d4f1a9c3e276
+Revises: b5c2e8f1d437
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4f1a9c3e276'
+down_revision: Union[str, None] = 'b5c2e8f1d437'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+AGGREGATE_COLUMNS = [
+    'reviews_count',
+    'rating_sum',
+    'rating_1_count',
+    'rating_2_count',
+    'rating_3_count',
+    'rating_4_count',
+    'rating_5_count',
+]
+
+
+def upgrade() -> None:
+    # 매니저 리뷰 집계 (리뷰 수, 평점 합계, 평점별 리뷰 수)
+    for name in AGGREGATE_COLUMNS:
+        op.add_column('managers', sa.Column(name, sa.Integer(), nullable=False, server_default='0'))
+
+    # 기존 리뷰로 집계 채우기 (rating도 리뷰 평균으로 맞춤)
+    op.execute(
+        """
+        UPDATE managers SET
+            reviews_count = stats.reviews_count,
+            rating_sum = stats.rating_sum,
+            rating_1_count = stats.rating_1_count,
+            rating_2_count = stats.rating_2_count,
+            rating_3_count = stats.rating_3_count,
+            rating_4_count = stats.rating_4_count,
+            rating_5_count = stats.rating_5_count,
+            rating = round(stats.rating_sum::numeric / stats.reviews_count, 1)
+        FROM (
+            SELECT
+                manager_id,
+                count(*) AS reviews_count,
+                sum(rating) AS rating_sum,
+                count(*) FILTER (WHERE rating = 1) AS rating_1_count,
+                count(*) FILTER (WHERE rating = 2) AS rating_2_count,
+                count(*) FILTER (WHERE rating = 3) AS rating_3_count,
+                count(*) FILTER (WHERE rating = 4) AS rating_4_count,
+                count(*) FILTER (WHERE rating = 5) AS rating_5_count
+            FROM reviews
+            WHERE is_deleted = false
+            GROUP BY manager_id
+        ) AS stats
+        WHERE managers.user_id = stats.manager_id
+        """
+    )
+    op.execute(
+        'UPDATE managers SET rating = 0 '
+        'WHERE reviews_count = 0 AND rating <> 0'
+    )
+
+    # 매니저 목록 리뷰 많은 순 정렬
+    op.create_index(
+        'ix_managers_status_reviews_count',
+        'managers',
+        ['status', sa.text('reviews_count DESC')],
+        unique=False,
+        postgresql_where=sa.text('is_deleted = false'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_managers_status_reviews_count', table_name='managers')
+    for name in reversed(AGGREGATE_COLUMNS):
+        op.drop_column('managers', name)
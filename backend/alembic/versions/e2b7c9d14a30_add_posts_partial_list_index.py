@@ -0,0 +1,45 @@
+"""add posts partial list index
+
+Revision ID: e2b7c9d14a30
+Revises: ddb996766686
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b7c9d14a30'
+down_revision: Union[str, None] = 'ddb996766686'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 일반 게시글 목록 (공지 제외, 최신순) 전용 부분 인덱스
+    op.create_index(
+        'ix_posts_board_id_created_at_listing',
+        'posts',
+        ['board_id', sa.text('created_at DESC')],
+        unique=False,
+        postgresql_where=sa.text('is_deleted = false AND is_notice = false'),
+    )
+    # 게시판 상단 고정 공지 (최신순, 게시판별 캐시 미스 시 조회) 부분 인덱스
+    op.create_index(
+        'ix_posts_board_id_created_at_notices',
+        'posts',
+        ['board_id', sa.text('created_at DESC')],
+        unique=False,
+        postgresql_where=sa.text('is_deleted = false AND is_notice = true'),
+    )
+    # 공지 조회는 위 부분 인덱스를 사용하므로 선택도가 낮은 단일 컬럼 인덱스 제거
+    op.drop_index('ix_posts_is_notice', table_name='posts')
+
+
+def downgrade() -> None:
+    op.create_index('ix_posts_is_notice', 'posts', ['is_notice'], unique=False)
+    op.drop_index('ix_posts_board_id_created_at_notices', table_name='posts')
+    op.drop_index('ix_posts_board_id_created_at_listing', table_name='posts')
@@ -0,0 +1,45 @@
+"""add moderation jobs
+
+Revision ID: e6a3c8b1f952
+Revises: d4f1a9c3e276
+Create Date: 2026-10-19 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6a3c8b1f952'
+down_revision: Union[str, None] = 'd4f1a9c3e276'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 작성자 단위 일괄 관리 작업 (배치 진행 위치를 기록하여 다른 워커에서도 재개 가능)
+    op.create_table('moderation_jobs',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('target', sa.String(length=20), nullable=False),
+        sa.Column('action', sa.String(length=20), nullable=False),
+        sa.Column('author_id', sa.UUID(), nullable=False),
+        sa.Column('category_id', sa.UUID(), nullable=True),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('processed', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('affected', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('last_id', sa.UUID(), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('created_by', sa.UUID(), nullable=True),
+        sa.Column('updated_by', sa.UUID(), nullable=True),
+        sa.Column('is_active', sa.Boolean(), nullable=False, server_default='true'),
+        sa.Column('is_deleted', sa.Boolean(), nullable=False, server_default='false'),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('moderation_jobs')
@@ -0,0 +1,69 @@
+"""add hot query composite indexes
+
+Revision ID: f3c8d1a92b47
+Revises: e2b7c9d14a30
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3c8d1a92b47'
+down_revision: Union[str, None] = 'e2b7c9d14a30'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 삭제되지 않은 행만 인덱싱 (모든 ORM 조회에 is_deleted = false 조건이 붙음, app.db.session)
+LIVE_ROWS = sa.text('is_deleted = false')
+
+# (인덱스 이름, 테이블, 컬럼) - 모두 LIVE_ROWS 부분 인덱스
+# reviews.reservation_id, payments.reservation_id는 UNIQUE 제약 인덱스가 이미 있음
+INDEXES = [
+    # 매니저 중복 예약 확인 (manager_id, scheduled_date, status IN (...))
+    (
+        'ix_reservations_manager_id_scheduled_date_status',
+        'reservations',
+        ['manager_id', 'scheduled_date', 'status'],
+    ),
+    # 내 예약 목록 (최신순)
+    ('ix_reservations_user_id_created_at', 'reservations', ['user_id', sa.text('created_at DESC')]),
+    # 매니저 날짜별 스케줄
+    ('ix_manager_schedules_manager_id_date', 'manager_schedules', ['manager_id', 'date']),
+    # 매니저 리뷰 목록 (최신순)
+    ('ix_reviews_manager_id_created_at', 'reviews', ['manager_id', sa.text('created_at DESC')]),
+    # 관리자 결제 목록 (최신순)
+    ('ix_payments_created_at', 'payments', [sa.text('created_at DESC')]),
+    # 매니저 목록 (상태 필터, 평점순)
+    ('ix_managers_status_rating', 'managers', ['status', sa.text('rating DESC')]),
+]
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY는 트랜잭션 밖에서만 실행 가능 (쓰기를 막지 않음)
+    # 중단된 빌드가 남긴 INVALID 인덱스는 DROP 후 다시 실행
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                postgresql_where=LIVE_ROWS,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
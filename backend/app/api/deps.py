@@ -2,12 +2,22 @@
 from typing import Annotated, Optional
 from uuid import UUID
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.principal import (
+    AccessTokenClaims,
+    UserPrincipal,
+    cache_principal,
+    get_cached_principal,
+    verified_tokens,
+)
+from app.core.rate_limit import RateLimiter, get_rate_limiter
+from app.core.revocation import get_token_revocation
 from app.core.security import decode_token
+from app.db.replica import get_read_db
 from app.db.session import get_db
 from app.models.user import User, UserRole
 
@@ -15,11 +25,14 @@ from app.models.user import User, UserRole
 security = HTTPBearer(auto_error=False)
 
 
-async def get_current_user(
+async def get_access_token_claims(
     credentials: Annotated[Optional[HTTPAuthorizationCredentials], Depends(security)],
-    db: Annotated[AsyncSession, Depends(get_db)],
-) -> User:
-    """현재 인증된 사용자를 반환."""
+) -> AccessTokenClaims:
+    """액세스 토큰 검증 후 클레임 반환.
+
+    검증된 토큰은 캐시하므로 정상 상태에서는 JWT 디코딩 없이 통과하며,
+    폐기 여부는 매 요청 메모리 필터로 확인합니다.
+    """
     if not credentials:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -28,40 +41,72 @@ async def get_current_user(
         )
 
     token = credentials.credentials
-    payload = decode_token(token)
-
-    if not payload:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="유효하지 않은 토큰입니다.",
-            headers={"WWW-Authenticate": "Bearer"},
+    claims = verified_tokens.get(token)
+
+    if claims is None:
+        payload = decode_token(token)
+
+        if not payload:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="유효하지 않은 토큰입니다.",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
+        # 토큰 타입 확인
+        if payload.get("type") != "access":
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="잘못된 토큰 유형입니다.",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
+        sub = payload.get("sub")
+        if not sub:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="토큰에 사용자 정보가 없습니다.",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
+        claims = AccessTokenClaims(
+            user_id=UUID(sub),
+            jti=payload.get("jti"),
+            family=payload.get("fam"),
+            expires_at=payload["exp"],
         )
-
-    # 토큰 타입 확인
-    if payload.get("type") != "access":
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="잘못된 토큰 유형입니다.",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
-    user_id = payload.get("sub")
-    if not user_id:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="토큰에 사용자 정보가 없습니다.",
-            headers={"WWW-Authenticate": "Bearer"},
+        verified_tokens.set(token, claims)
+
+    # 로그아웃/재사용 감지로 폐기된 토큰 또는 로그인 세션
+    revocation = get_token_revocation()
+    for token_id in (claims.jti, claims.family):
+        if token_id and await revocation.is_revoked(token_id):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="폐기된 토큰입니다. 다시 로그인해주세요.",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
+    return claims
+
+
+async def _resolve_principal(db: AsyncSession, user_id: UUID) -> UserPrincipal:
+    """사용자 정보 조회 (캐시 우선)."""
+    user = get_cached_principal(user_id)
+    if user is None:
+        result = await db.execute(
+            select(User.id, User.name, User.role, User.is_active).where(User.id == user_id)
         )
+        row = result.one_or_none()
 
-    # 사용자 조회
-    result = await db.execute(select(User).where(User.id == UUID(user_id)))
-    user = result.scalar_one_or_none()
+        if not row:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="사용자를 찾을 수 없습니다.",
+            )
 
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="사용자를 찾을 수 없습니다.",
-        )
+        user = UserPrincipal(id=row.id, name=row.name, role=row.role, is_active=row.is_active)
+        cache_principal(user)
 
     if not user.is_active:
         raise HTTPException(
@@ -72,23 +117,35 @@ async def get_current_user(
     return user
 
 
+async def get_current_user(
+    claims: Annotated[AccessTokenClaims, Depends(get_access_token_claims)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> UserPrincipal:
+    """현재 인증된 사용자를 반환.
+
+    사용자 정보를 캐시하므로, 정상 상태에서는 users 조회 없이 인증됩니다.
+    """
+    return await _resolve_principal(db, claims.user_id)
+
+
 async def get_current_user_optional(
     credentials: Annotated[Optional[HTTPAuthorizationCredentials], Depends(security)],
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> Optional[User]:
+) -> Optional[UserPrincipal]:
     """현재 인증된 사용자를 반환 (선택적)."""
     if not credentials:
         return None
 
     try:
-        return await get_current_user(credentials, db)
+        claims = await get_access_token_claims(credentials)
+        return await _resolve_principal(db, claims.user_id)
     except HTTPException:
         return None
 
 
 async def get_current_active_manager(
-    current_user: Annotated[User, Depends(get_current_user)],
-) -> User:
+    current_user: Annotated[UserPrincipal, Depends(get_current_user)],
+) -> UserPrincipal:
     """현재 매니저 권한을 가진 사용자 반환."""
     if current_user.role not in [UserRole.MANAGER.value, UserRole.ADMIN.value]:
         raise HTTPException(
@@ -99,8 +156,8 @@ async def get_current_active_manager(
 
 
 async def get_current_admin(
-    current_user: Annotated[User, Depends(get_current_user)],
-) -> User:
+    current_user: Annotated[UserPrincipal, Depends(get_current_user)],
+) -> UserPrincipal:
     """현재 관리자 권한을 가진 사용자 반환."""
     if current_user.role != UserRole.ADMIN.value:
         raise HTTPException(
@@ -110,9 +167,23 @@ async def get_current_admin(
     return current_user
 
 
+def get_client_ip(request: Request) -> str:
+    """요청 제한용 클라이언트 IP.
+
+    프록시 뒤에서는 uvicorn --proxy-headers(--forwarded-allow-ips)로 실제 IP가
+    request.client에 반영되도록 실행합니다.
+    """
+    return request.client.host if request.client else "unknown"
+
+
 # Type aliases for dependency injection
-CurrentUser = Annotated[User, Depends(get_current_user)]
-CurrentUserOptional = Annotated[Optional[User], Depends(get_current_user_optional)]
-CurrentManager = Annotated[User, Depends(get_current_active_manager)]
-CurrentAdmin = Annotated[User, Depends(get_current_admin)]
+AccessToken = Annotated[AccessTokenClaims, Depends(get_access_token_claims)]
+CurrentUser = Annotated[UserPrincipal, Depends(get_current_user)]
+CurrentUserOptional = Annotated[Optional[UserPrincipal], Depends(get_current_user_optional)]
+CurrentManager = Annotated[UserPrincipal, Depends(get_current_active_manager)]
+CurrentAdmin = Annotated[UserPrincipal, Depends(get_current_admin)]
 DbSession = Annotated[AsyncSession, Depends(get_db)]
+# 조회 전용 세션 (복제본 설정 시 복제본에서 읽음, 쓰기 금지)
+ReadSession = Annotated[AsyncSession, Depends(get_read_db)]
+ClientIP = Annotated[str, Depends(get_client_ip)]
+RateLimit = Annotated[RateLimiter, Depends(get_rate_limiter)]
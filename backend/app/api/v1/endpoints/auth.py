@@ -1,11 +1,16 @@
 import secrets
-from datetime import datetime, timedelta
+import time
+from datetime import timedelta
+from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import create_access_token, create_refresh_token
+from app.api.deps import AccessToken, ClientIP, RateLimit
+from app.core.config import settings
+from app.core.revocation import TokenRevocation, get_token_revocation
+from app.core.security import create_token_pair, decode_token
 from app.db.session import get_db
 from app.models.user import User
 from app.schemas.auth import (
@@ -13,17 +18,21 @@ from app.schemas.auth import (
     PhoneVerifyConfirm,
     PhoneVerifyRequest,
     PhoneVerifyResponse,
+    RefreshTokenRequest,
     RegisterRequest,
     TokenResponse,
     UserResponse,
 )
+from app.services.verification import (
+    VERIFICATION_CODE_TTL_SECONDS,
+    VERIFICATION_TOKEN_TTL_SECONDS,
+    VerificationRecord,
+    VerificationStore,
+    get_verification_store,
+)
 
 router = APIRouter()
 
-# 임시 인증번호 저장소 (실제로는 Redis 사용)
-# 형식: {phone: {"code": "123456", "expires_at": datetime, "verified": bool}}
-_verification_codes: dict[str, dict] = {}
-
 # 개발용 테스트 인증번호
 DEV_VERIFICATION_CODE = "000000"
 
@@ -41,19 +50,20 @@ def _create_verification_token(phone: str) -> str:
 @router.post("/send-code", response_model=PhoneVerifyResponse)
 async def send_verification_code(
     data: PhoneVerifyRequest,
-    db: AsyncSession = Depends(get_db),
+    client_ip: ClientIP,
+    rate_limit: RateLimit,
+    store: VerificationStore = Depends(get_verification_store),
 ) -> PhoneVerifyResponse:
     """휴대폰 인증번호 발송."""
+    await rate_limit.hit("auth_send_code_ip", client_ip)
+    await rate_limit.hit("auth_send_code_phone", data.phone)
+
     code = _generate_verification_code()
-    expires_at = datetime.now() + timedelta(minutes=3)
 
     # 인증번호 저장 (실제로는 SMS 발송)
-    _verification_codes[data.phone] = {
-        "code": code,
-        "expires_at": expires_at,
-        "verified": False,
-        "token": None,
-    }
+    await store.set(
+        data.phone, VerificationRecord(code=code), VERIFICATION_CODE_TTL_SECONDS
+    )
 
     # TODO: 실제 SMS 발송 로직
     # await sms_service.send(data.phone, f"인증번호: {code}")
@@ -67,50 +77,38 @@ async def send_verification_code(
 @router.post("/verify-code", response_model=PhoneVerifyResponse)
 async def verify_code(
     data: PhoneVerifyConfirm,
-    db: AsyncSession = Depends(get_db),
+    client_ip: ClientIP,
+    rate_limit: RateLimit,
+    store: VerificationStore = Depends(get_verification_store),
 ) -> PhoneVerifyResponse:
     """휴대폰 인증번호 확인."""
-    stored = _verification_codes.get(data.phone)
+    await rate_limit.hit("auth_verify_code_ip", client_ip)
+    await rate_limit.hit("auth_verify_code_phone", data.phone)
 
     # 개발용 테스트 코드 허용
-    if data.code == DEV_VERIFICATION_CODE:
-        token = _create_verification_token(data.phone)
-        _verification_codes[data.phone] = {
-            "code": DEV_VERIFICATION_CODE,
-            "expires_at": datetime.now() + timedelta(minutes=10),
-            "verified": True,
-            "token": token,
-        }
-        return PhoneVerifyResponse(
-            success=True,
-            message="인증이 완료되었습니다.",
-            verification_token=token,
-        )
-
-    if not stored:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="인증번호를 먼저 요청해주세요.",
-        )
+    if data.code != DEV_VERIFICATION_CODE:
+        stored = await store.get(data.phone)
 
-    if datetime.now() > stored["expires_at"]:
-        del _verification_codes[data.phone]
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="인증번호가 만료되었습니다. 다시 요청해주세요.",
-        )
+        # 만료된 인증번호는 저장소 TTL로 제거됨
+        if not stored:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="인증번호가 없거나 만료되었습니다. 다시 요청해주세요.",
+            )
 
-    if stored["code"] != data.code:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="인증번호가 일치하지 않습니다.",
-        )
+        if stored.code != data.code:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="인증번호가 일치하지 않습니다.",
+            )
 
     # 인증 완료 토큰 발급
     token = _create_verification_token(data.phone)
-    _verification_codes[data.phone]["verified"] = True
-    _verification_codes[data.phone]["token"] = token
-    _verification_codes[data.phone]["expires_at"] = datetime.now() + timedelta(minutes=10)
+    await store.set(
+        data.phone,
+        VerificationRecord(code=data.code, verified=True, token=token),
+        VERIFICATION_TOKEN_TTL_SECONDS,
+    )
 
     return PhoneVerifyResponse(
         success=True,
@@ -123,23 +121,17 @@ async def verify_code(
 async def register(
     data: RegisterRequest,
     db: AsyncSession = Depends(get_db),
+    store: VerificationStore = Depends(get_verification_store),
 ) -> TokenResponse:
     """회원가입."""
-    # 인증 토큰 확인
-    stored = _verification_codes.get(data.phone)
-    if not stored or not stored.get("verified") or stored.get("token") != data.verification_token:
+    # 인증 토큰 확인 (만료된 인증은 저장소 TTL로 제거됨)
+    stored = await store.get(data.phone)
+    if not stored or not stored.verified or stored.token != data.verification_token:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="휴대폰 인증을 먼저 완료해주세요.",
         )
 
-    if datetime.now() > stored["expires_at"]:
-        del _verification_codes[data.phone]
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="인증이 만료되었습니다. 다시 인증해주세요.",
-        )
-
     # 휴대폰 번호 중복 확인
     result = await db.execute(select(User).where(User.phone == data.phone))
     if result.scalar_one_or_none():
@@ -159,11 +151,10 @@ async def register(
     await db.flush()
 
     # 인증 정보 삭제
-    del _verification_codes[data.phone]
+    await store.delete(data.phone)
 
     # 토큰 생성
-    access_token = create_access_token(str(user.id))
-    refresh_token = create_refresh_token(str(user.id))
+    access_token, refresh_token = create_token_pair(str(user.id))
 
     return TokenResponse(
         access_token=access_token,
@@ -176,27 +167,27 @@ async def register(
 @router.post("/login", response_model=TokenResponse)
 async def login(
     data: LoginRequest,
+    client_ip: ClientIP,
+    rate_limit: RateLimit,
     db: AsyncSession = Depends(get_db),
+    store: VerificationStore = Depends(get_verification_store),
 ) -> TokenResponse:
     """로그인 (휴대폰 인증)."""
+    await rate_limit.hit("auth_login_ip", client_ip)
+    await rate_limit.hit("auth_login_phone", data.phone)
+
     # 개발용 테스트 코드 허용
     if data.code != DEV_VERIFICATION_CODE:
-        stored = _verification_codes.get(data.phone)
+        stored = await store.get(data.phone)
 
+        # 만료된 인증번호는 저장소 TTL로 제거됨
         if not stored:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="인증번호를 먼저 요청해주세요.",
-            )
-
-        if datetime.now() > stored["expires_at"]:
-            del _verification_codes[data.phone]
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="인증번호가 만료되었습니다. 다시 요청해주세요.",
+                detail="인증번호가 없거나 만료되었습니다. 다시 요청해주세요.",
             )
 
-        if stored["code"] != data.code:
+        if stored.code != data.code:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="인증번호가 일치하지 않습니다.",
@@ -219,12 +210,79 @@ async def login(
         )
 
     # 인증 정보 삭제
-    if data.phone in _verification_codes:
-        del _verification_codes[data.phone]
+    await store.delete(data.phone)
 
     # 토큰 생성
-    access_token = create_access_token(str(user.id))
-    refresh_token = create_refresh_token(str(user.id))
+    access_token, refresh_token = create_token_pair(str(user.id))
+
+    return TokenResponse(
+        access_token=access_token,
+        refresh_token=refresh_token,
+        token_type="bearer",
+        user=UserResponse.model_validate(user),
+    )
+
+
+def _family_expires_at() -> float:
+    """로그인 세션 폐기 보관 기한 (갱신된 refresh 토큰의 최대 만료 시각)."""
+    return time.time() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS).total_seconds()
+
+
+@router.post("/refresh", response_model=TokenResponse)
+async def refresh(
+    data: RefreshTokenRequest,
+    db: AsyncSession = Depends(get_db),
+    revocation: TokenRevocation = Depends(get_token_revocation),
+) -> TokenResponse:
+    """토큰 갱신 (refresh 토큰 rotation).
+
+    사용한 refresh 토큰은 폐기하고 같은 로그인 세션으로 새 토큰 쌍을 발급합니다.
+    이미 사용된 refresh 토큰이 다시 오면 탈취로 간주하여 로그인 세션 전체를 폐기합니다.
+    """
+    payload = decode_token(data.refresh_token)
+    if (
+        not payload
+        or payload.get("type") != "refresh"
+        or not payload.get("sub")
+        or not payload.get("jti")
+        or not payload.get("fam")
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="유효하지 않은 토큰입니다.",
+        )
+
+    family = payload["fam"]
+    if await revocation.is_revoked(family, exact=True):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="폐기된 토큰입니다. 다시 로그인해주세요.",
+        )
+
+    # 사용한 refresh 토큰 폐기 (이미 폐기되어 있으면 재사용)
+    if not await revocation.revoke(payload["jti"], payload["exp"]):
+        await revocation.revoke(family, _family_expires_at())
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="이미 사용된 토큰입니다. 보안을 위해 다시 로그인해주세요.",
+        )
+
+    result = await db.execute(select(User).where(User.id == UUID(payload["sub"])))
+    user = result.scalar_one_or_none()
+
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="사용자를 찾을 수 없습니다.",
+        )
+
+    if not user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="비활성화된 계정입니다.",
+        )
+
+    access_token, refresh_token = create_token_pair(str(user.id), family=family)
 
     return TokenResponse(
         access_token=access_token,
@@ -235,6 +293,17 @@ async def login(
 
 
 @router.post("/logout")
-async def logout() -> dict[str, str]:
-    """로그아웃."""
+async def logout(
+    claims: AccessToken,
+    revocation: TokenRevocation = Depends(get_token_revocation),
+) -> dict[str, str]:
+    """로그아웃.
+
+    현재 액세스 토큰과 로그인 세션을 폐기하여, 같은 세션의 refresh 토큰으로도
+    더 이상 갱신할 수 없게 합니다.
+    """
+    if claims.jti:
+        await revocation.revoke(claims.jti, claims.expires_at)
+    if claims.family:
+        await revocation.revoke(claims.family, _family_expires_at())
     return {"message": "로그아웃되었습니다."}
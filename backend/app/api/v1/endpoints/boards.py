@@ -2,14 +2,34 @@
 from typing import Optional, List
 from uuid import UUID
 
-from fastapi import APIRouter, Query
-
-from app.api.deps import CurrentUser, CurrentUserOptional, CurrentAdmin, DbSession
-from app.core.board_constants import BoardErrorCode, DEFAULT_PAGE_SIZE
+from fastapi import APIRouter, Query, Request, Response
+
+from app.api.deps import (
+    ClientIP,
+    CurrentUser,
+    CurrentUserOptional,
+    CurrentAdmin,
+    DbSession,
+    RateLimit,
+    ReadSession,
+)
+from app.core.board_constants import (
+    BoardErrorCode,
+    DEFAULT_PAGE_SIZE,
+    DEFAULT_SUMMARY_NOTICE_LIMIT,
+    DEFAULT_SUMMARY_POST_LIMIT,
+    MAX_SUMMARY_NOTICE_LIMIT,
+    MAX_SUMMARY_POST_LIMIT,
+    TRENDING_TOP_K,
+)
 from app.core.board_exceptions import BoardException
+from app.core.config import settings
 from app.schemas.board import (
     BoardResponse,
+    BoardSummary,
     BoardCreate,
+    BulkModerationRequest,
+    ModerationJobResponse,
     BoardUpdate,
     BoardCategoryResponse,
     BoardCategoryCreate,
@@ -27,6 +47,13 @@ from app.services.board import (
     PostService,
     CommentService,
 )
+from app.services.moderation import (
+    ModerationService,
+    get_moderation_job,
+    moderation_job_response,
+    resume_moderation_job,
+    start_moderation_job,
+)
 
 router = APIRouter()
 
@@ -59,6 +86,78 @@ async def create_board(
     return BoardResponse.model_validate(board)
 
 
+@router.get("/boards/summary", response_model=List[BoardSummary])
+async def list_board_summaries(
+    db: DbSession,
+    current_user: CurrentUserOptional,
+    limit: int = Query(
+        DEFAULT_SUMMARY_POST_LIMIT, ge=1, le=MAX_SUMMARY_POST_LIMIT, description="게시판별 최신글 수"
+    ),
+    notice_limit: int = Query(
+        DEFAULT_SUMMARY_NOTICE_LIMIT, ge=0, le=MAX_SUMMARY_NOTICE_LIMIT, description="게시판별 공지 수"
+    ),
+) -> List[BoardSummary]:
+    """게시판 홈 요약 조회 (활성 게시판별 공지 + 최신글).
+
+    읽기 권한이 있는 게시판만 포함됩니다. 짧은 TTL로 캐시되며 게시글 작성/수정/삭제 시 갱신됩니다.
+    """
+    return await BoardService.list_board_summaries(
+        db,
+        current_user,
+        post_limit=limit,
+        notice_limit=notice_limit,
+    )
+
+
+# ==================== 일괄 관리 엔드포인트 ====================
+@router.post("/boards/moderation", response_model=ModerationJobResponse)
+async def bulk_moderate(
+    request_data: BulkModerationRequest,
+    current_user: CurrentAdmin,
+    db: DbSession,
+) -> ModerationJobResponse:
+    """게시글/댓글 일괄 삭제, 복구, 분류 이동.
+
+    관리자만 접근 가능합니다.
+    ID 목록은 단일 UPDATE로 즉시 처리하고, 작성자 단위 요청은 배치 작업으로
+    실행한 뒤 작업 ID를 반환합니다.
+    """
+    if request_data.ids:
+        return await ModerationService.moderate_by_ids(db, request_data, current_user.id)
+
+    job = await start_moderation_job(db, request_data, current_user.id)
+    return moderation_job_response(job)
+
+
+@router.get("/boards/moderation/jobs/{job_id}", response_model=ModerationJobResponse)
+async def get_moderation_job_status(
+    job_id: UUID,
+    current_user: CurrentAdmin,
+    db: DbSession,
+) -> ModerationJobResponse:
+    """일괄 관리 작업 진행 상태 조회.
+
+    관리자만 접근 가능합니다. 진행 상태는 DB에 기록되므로 어느 워커에서도 조회됩니다.
+    """
+    job = await get_moderation_job(db, job_id)
+    return moderation_job_response(job)
+
+
+@router.post("/boards/moderation/jobs/{job_id}/resume", response_model=ModerationJobResponse)
+async def resume_moderation(
+    job_id: UUID,
+    current_user: CurrentAdmin,
+    db: DbSession,
+) -> ModerationJobResponse:
+    """실패하거나 중단된 일괄 관리 작업 재개 (마지막으로 처리한 배치 이후부터).
+
+    관리자만 접근 가능합니다. 작업을 실행하던 프로세스가 종료되어 진행이 멈춘
+    작업도 다른 워커에서 재개할 수 있습니다.
+    """
+    job = await resume_moderation_job(db, job_id, current_user.id)
+    return moderation_job_response(job)
+
+
 @router.get("/boards/{code}", response_model=BoardResponse)
 async def get_board(
     code: str,
@@ -68,14 +167,14 @@ async def get_board(
 
     누구나 접근 가능합니다.
     """
-    board = await BoardService.get_board_by_code(db, code)
+    board = await BoardService.get_board_config(db, code)
     if not board:
         raise BoardException(
             BoardErrorCode.BOARD_NOT_FOUND,
             "게시판을 찾을 수 없습니다.",
             404,
         )
-    return BoardResponse.model_validate(board)
+    return board
 
 
 @router.patch("/boards/{code}", response_model=BoardResponse)
@@ -133,7 +232,7 @@ async def list_categories(
 
     누구나 접근 가능합니다.
     """
-    board = await BoardService.get_board_by_code(db, code)
+    board = await BoardService.get_board_config(db, code)
     if not board:
         raise BoardException(
             BoardErrorCode.BOARD_NOT_FOUND,
@@ -174,8 +273,10 @@ async def create_category(
 @router.get("/boards/{code}/posts", response_model=PaginatedResponse)
 async def list_posts(
     code: str,
-    db: DbSession,
+    db: ReadSession,
     current_user: CurrentUserOptional,
+    client_ip: ClientIP,
+    rate_limit: RateLimit,
     category_id: Optional[UUID] = Query(None, description="분류 ID 필터"),
     search_keyword: Optional[str] = Query(None, description="검색 키워드 (제목, 내용)"),
     page: int = Query(1, ge=1, description="페이지 번호"),
@@ -184,8 +285,12 @@ async def list_posts(
     """게시글 목록 조회.
 
     게시판 읽기 권한에 따라 접근 가능합니다.
+    검색(search_keyword)은 IP별 요청 제한이 적용됩니다.
     """
-    board = await BoardService.get_board_by_code(db, code)
+    if search_keyword:
+        await rate_limit.hit("board_search_ip", client_ip)
+
+    board = await BoardService.get_board_config(db, code)
     if not board:
         raise BoardException(
             BoardErrorCode.BOARD_NOT_FOUND,
@@ -207,34 +312,21 @@ async def list_posts(
         page_size=page_size,
     )
 
-    # PostListItem으로 변환
-    items = [
-        PostListItem(
-            id=post.id,
-            board_id=post.board_id,
-            category_id=post.category_id,
-            author_id=post.author_id,
-            author_name=post.author.name,
-            title=post.title,
-            is_notice=post.is_notice,
-            is_secret=post.is_secret,
-            view_count=post.view_count,
-            like_count=post.like_count,
-            comment_count=post.comment_count,
-            is_answered=post.is_answered,
-            created_at=post.created_at,
-        )
-        for post in posts
-    ]
+    # PostListItem으로 변환 (컬럼 Row에서 직접 생성)
+    items = [PostListItem.model_validate(post) for post in posts]
 
     total_pages = (total + page_size - 1) // page_size
 
+    # 상단 고정 공지 (게시판별 캐시)
+    notices = await PostService.list_notices(db, board.id) if board.use_notice else []
+
     return PaginatedResponse(
         items=items,
         total=total,
         page=page,
         page_size=page_size,
         total_pages=total_pages,
+        notices=notices,
     )
 
 
@@ -271,10 +363,38 @@ async def create_post(
     return PostResponse.model_validate(post)
 
 
+@router.get("/boards/{code}/posts/trending", response_model=List[PostListItem])
+async def list_trending_posts(
+    code: str,
+    db: DbSession,
+    current_user: CurrentUserOptional,
+    limit: int = Query(10, ge=1, le=TRENDING_TOP_K, description="조회 개수"),
+) -> List[PostListItem]:
+    """게시판 인기글 조회.
+
+    최근 게시글의 조회수/좋아요/댓글 수를 시간 감쇠 점수로 환산한 순위입니다.
+    순위는 백그라운드에서 주기적으로 갱신됩니다.
+    """
+    board = await BoardService.get_board_config(db, code)
+    if not board:
+        raise BoardException(
+            BoardErrorCode.BOARD_NOT_FOUND,
+            "게시판을 찾을 수 없습니다.",
+            404,
+        )
+
+    # 읽기 권한 확인
+    await BoardService.check_board_permission(board, "read", current_user)
+
+    return PostService.list_trending_posts(board.id, limit)
+
+
 @router.get("/boards/{code}/posts/{post_id}", response_model=PostResponse)
 async def get_post(
     code: str,
     post_id: UUID,
+    request: Request,
+    response: Response,
     db: DbSession,
     current_user: CurrentUserOptional,
     password: Optional[str] = Query(None, description="비밀글 비밀번호"),
@@ -282,8 +402,10 @@ async def get_post(
     """게시글 상세 조회.
 
     비밀글은 작성자, 관리자, 또는 비밀번호를 아는 사람만 볼 수 있습니다.
+    비밀번호 확인에 성공하면 짧은 유효 시간의 열람 권한 쿠키를 발급하여
+    이후 조회와 댓글 목록에서는 비밀번호 재검증을 생략합니다.
     """
-    board = await BoardService.get_board_by_code(db, code)
+    board = await BoardService.get_board_config(db, code)
     if not board:
         raise BoardException(
             BoardErrorCode.BOARD_NOT_FOUND,
@@ -294,8 +416,8 @@ async def get_post(
     # 읽기 권한 확인
     await BoardService.check_board_permission(board, "read", current_user)
 
-    post = await PostService.get_post_by_id(db, post_id)
-    if not post or post.board_id != board.id:
+    post = await PostService.get_post_by_id(db, post_id, board_id=board.id)
+    if not post:
         raise BoardException(
             BoardErrorCode.POST_NOT_FOUND,
             "게시글을 찾을 수 없습니다.",
@@ -303,13 +425,28 @@ async def get_post(
         )
 
     # 비밀글 접근 권한 확인
-    await PostService.check_secret_post_access(post, current_user, password)
+    cookie_name = PostService.secret_post_grant_cookie_name(post.id)
+    grant = await PostService.check_secret_post_access(
+        post, current_user, password, request.cookies.get(cookie_name)
+    )
+
+    # 비밀번호 확인에 성공한 경우에만 열람 권한 쿠키 발급
+    if grant:
+        response.set_cookie(
+            cookie_name,
+            grant,
+            max_age=settings.SECRET_POST_GRANT_EXPIRE_MINUTES * 60,
+            httponly=True,
+            samesite="lax",
+        )
 
-    # 조회수 증가 (본인 글 제외)
+    post_response = PostResponse.model_validate(post)
+
+    # 조회수 증가 (본인 글 제외, 응답 이후 일괄 반영)
     if not current_user or post.author_id != current_user.id:
-        await PostService.increment_view_count(db, post)
+        post_response.view_count += PostService.increment_view_count(post)
 
-    return PostResponse.model_validate(post)
+    return post_response
 
 
 @router.patch("/boards/{code}/posts/{post_id}", response_model=PostResponse)
@@ -343,6 +480,13 @@ async def update_post(
     # 수정 권한 확인
     PostService.check_post_edit_permission(post, current_user)
 
+    # 공지사항 지정은 관리자만
+    if post_data.is_notice and current_user.role != "admin":
+        raise BoardException(
+            BoardErrorCode.ACCESS_DENIED,
+            "공지사항은 관리자만 작성할 수 있습니다.",
+        )
+
     post = await PostService.update_post(db, post, post_data, current_user.id)
     return PostResponse.model_validate(post)
 
@@ -386,14 +530,17 @@ async def delete_post(
 async def list_comments(
     code: str,
     post_id: UUID,
+    request: Request,
     db: DbSession,
     current_user: CurrentUserOptional,
+    password: Optional[str] = Query(None, description="비밀글 비밀번호"),
 ) -> List[CommentResponse]:
     """댓글 목록 조회.
 
     게시판 읽기 권한에 따라 접근 가능합니다.
+    비밀글의 댓글은 본문과 같은 조건(작성자, 관리자, 비밀번호 또는 열람 권한 쿠키)으로 조회할 수 있습니다.
     """
-    board = await BoardService.get_board_by_code(db, code)
+    board = await BoardService.get_board_config(db, code)
     if not board:
         raise BoardException(
             BoardErrorCode.BOARD_NOT_FOUND,
@@ -404,14 +551,22 @@ async def list_comments(
     # 읽기 권한 확인
     await BoardService.check_board_permission(board, "read", current_user)
 
-    post = await PostService.get_post_by_id(db, post_id)
-    if not post or post.board_id != board.id:
+    post = await PostService.get_post_by_id(db, post_id, board_id=board.id)
+    if not post:
         raise BoardException(
             BoardErrorCode.POST_NOT_FOUND,
             "게시글을 찾을 수 없습니다.",
             404,
         )
 
+    # 비밀글 접근 권한 확인
+    await PostService.check_secret_post_access(
+        post,
+        current_user,
+        password,
+        request.cookies.get(PostService.secret_post_grant_cookie_name(post.id)),
+    )
+
     comments = await CommentService.list_comments(db, post_id)
     return [CommentResponse.model_validate(comment) for comment in comments]
 
@@ -1,5 +1,12 @@
+from typing import Any
+
 from fastapi import APIRouter
 
+from app.api.deps import CurrentAdmin, RateLimit
+from app.db.metrics import db_route_stats
+from app.db.replica import get_replica_router
+from app.db.session import PRIMARY_POOL_NAME, pool_status
+
 router = APIRouter()
 
 
@@ -7,3 +14,22 @@ router = APIRouter()
 async def health_check() -> dict[str, str]:
     """API 헬스체크."""
     return {"status": "healthy", "version": "0.1.0"}
+
+
+@router.get("/rate-limits")
+async def rate_limit_metrics(
+    current_user: CurrentAdmin,
+    rate_limit: RateLimit,
+) -> dict[str, dict[str, int | float]]:
+    """요청 제한 규칙별 설정과 거부 횟수 (관리자 전용, 현재 워커 기준)."""
+    return rate_limit.metrics()
+
+
+@router.get("/db")
+async def db_metrics(current_user: CurrentAdmin) -> dict[str, Any]:
+    """풀(primary, 복제본)별 상태/대기 통계와 라우트별 DB 세션 통계 (관리자 전용, 현재 워커 기준)."""
+    pools = {PRIMARY_POOL_NAME: pool_status()}
+    replica_router = get_replica_router()
+    if replica_router is not None:
+        pools.update(replica_router.pool_status())
+    return {"pools": pools, "routes": db_route_stats.snapshot()}
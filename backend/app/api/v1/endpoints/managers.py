@@ -4,12 +4,20 @@ from decimal import Decimal
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Query, status
-from sqlalchemy import func, select
+from sqlalchemy import Row, func, select
 from sqlalchemy.orm import joinedload
 
-from app.api.deps import CurrentAdmin, CurrentManager, CurrentUser, CurrentUserOptional, DbSession
+from app.api.deps import (
+    CurrentAdmin,
+    CurrentManager,
+    CurrentUser,
+    CurrentUserOptional,
+    DbSession,
+    ReadSession,
+)
+from app.core.principal import invalidate_principal
+from app.db.session import after_commit
 from app.models.manager import Manager, ManagerSchedule, ManagerStatus
-from app.models.review import Review
 from app.models.user import User, UserRole
 from app.schemas.manager import (
     ManagerCreate,
@@ -21,12 +29,15 @@ from app.schemas.manager import (
     ScheduleResponse,
     ScheduleUpdate,
 )
+from app.services.manager_facets import EXPERT_MIN_SERVICES, manager_facet_index
+from app.services.manager_rating import average_rating, build_review_stats
 
 router = APIRouter()
 
 
 def _build_manager_response(manager: Manager) -> ManagerResponse:
-    """매니저 응답 객체 생성."""
+    """매니저 응답 객체 생성 (리뷰 통계는 매니저 집계 컬럼 사용)."""
+    stats = build_review_stats(manager)
     return ManagerResponse(
         id=manager.id,
         user_id=manager.user_id,
@@ -40,11 +51,68 @@ def _build_manager_response(manager: Manager) -> ManagerResponse:
         profile_image=manager.profile_image,
         is_volunteer=manager.is_volunteer,
         created_at=manager.created_at,
+        reviews_count=stats.total_reviews,
+        avg_rating=Decimal(str(stats.average_rating)),
         name=manager.user.name if manager.user else None,
         phone=manager.user.phone if manager.user else None,
     )
 
 
+# 매니저 목록 응답 컬럼 (User 전체 행 대신 이름/연락처만)
+MANAGER_LIST_COLUMNS = (
+    Manager.id,
+    Manager.user_id,
+    Manager.status,
+    Manager.grade,
+    Manager.rating,
+    Manager.total_services,
+    Manager.certifications,
+    Manager.available_areas,
+    Manager.introduction,
+    Manager.profile_image,
+    Manager.is_volunteer,
+    Manager.created_at,
+    Manager.reviews_count,
+    Manager.rating_sum,
+    User.name,
+    User.phone,
+)
+
+
+def _build_manager_list_item(row: Row) -> ManagerResponse:
+    """목록 행(MANAGER_LIST_COLUMNS)으로 매니저 응답 생성.
+
+    DB 값의 타입이 응답 스키마와 같으므로 검증 없이 model_construct로 만듭니다.
+    """
+    return ManagerResponse.model_construct(
+        id=row.id,
+        user_id=row.user_id,
+        status=row.status,
+        grade=row.grade,
+        rating=row.rating,
+        total_services=row.total_services,
+        certifications=row.certifications or [],
+        available_areas=row.available_areas or [],
+        introduction=row.introduction,
+        profile_image=row.profile_image,
+        is_volunteer=row.is_volunteer,
+        created_at=row.created_at,
+        reviews_count=row.reviews_count,
+        avg_rating=Decimal(str(average_rating(row))),
+        name=row.name,
+        phone=row.phone,
+    )
+
+
+def _build_manager_detail_response(manager: Manager) -> ManagerDetailResponse:
+    """매니저 상세 응답 객체 생성 (평점 분포 포함)."""
+    base = _build_manager_response(manager)
+    return ManagerDetailResponse(
+        **base.model_dump(),
+        rating_distribution=build_review_stats(manager).rating_distribution,
+    )
+
+
 @router.post("/register", response_model=ManagerResponse, status_code=status.HTTP_201_CREATED)
 async def register_manager(
     data: ManagerCreate,
@@ -77,15 +145,17 @@ async def register_manager(
     await db.refresh(manager, ["user"])
 
     # 사용자 역할 업데이트
-    current_user.role = UserRole.MANAGER.value
+    manager.user.role = UserRole.MANAGER.value
     await db.flush()
+    after_commit(db, lambda: invalidate_principal(current_user.id))
+    after_commit(db, lambda: manager_facet_index.update(manager))
 
     return _build_manager_response(manager)
 
 
 @router.get("/", response_model=ManagerListResponse)
 async def get_managers(
-    db: DbSession,
+    db: ReadSession,
     current_user: CurrentUserOptional,
     page: int = Query(1, ge=1),
     limit: int = Query(10, ge=1, le=100),
@@ -95,36 +165,39 @@ async def get_managers(
     certification: str | None = Query(None, description="자격증 필터"),
     sort_by: str | None = Query("rating", description="정렬 기준: rating, services, reviews"),
 ) -> ManagerListResponse:
-    """매니저 목록 조회."""
-    query = select(Manager).options(joinedload(Manager.user))
+    """매니저 목록 조회 (활성 매니저 검색이면 패싯 카운트 포함).
+
+    패싯 인덱스는 워커 시작 후 첫 재적재가 끝나야 채워지므로 그 전에는 facets가 null입니다.
+    """
+    conditions = []
 
     # 공개 조회는 활성 매니저만
     if not current_user or current_user.role != UserRole.ADMIN.value:
-        query = query.where(Manager.status == ManagerStatus.ACTIVE.value)
-    elif status_filter:
-        query = query.where(Manager.status == status_filter)
+        status_filter = ManagerStatus.ACTIVE.value
+    if status_filter:
+        conditions.append(Manager.status == status_filter)
 
     # 매니저 유형 필터
     if manager_type == "expert":
         # 전문매니저: 6건 이상 완료
-        query = query.where(Manager.total_services >= 6)
+        conditions.append(Manager.total_services >= EXPERT_MIN_SERVICES)
     elif manager_type == "new":
         # 신규매니저: 5건 이하
-        query = query.where(Manager.total_services <= 5)
+        conditions.append(Manager.total_services < EXPERT_MIN_SERVICES)
     elif manager_type == "volunteer":
         # 자원봉사자
-        query = query.where(Manager.is_volunteer == True)  # noqa: E712
+        conditions.append(Manager.is_volunteer == True)  # noqa: E712
 
     # 지역 필터
     if area:
-        query = query.where(Manager.available_areas.contains([area]))
+        conditions.append(Manager.available_areas.contains([area]))
 
     # 자격증 필터
     if certification:
-        query = query.where(Manager.certifications.contains([certification]))
+        conditions.append(Manager.certifications.contains([certification]))
 
     # 총 개수 조회
-    count_query = select(func.count()).select_from(query.subquery())
+    count_query = select(func.count()).select_from(Manager).where(*conditions)
     total_result = await db.execute(count_query)
     total = total_result.scalar() or 0
 
@@ -132,25 +205,36 @@ async def get_managers(
     if sort_by == "services":
         order_column = Manager.total_services.desc()
     elif sort_by == "reviews":
-        # reviews 정렬은 리뷰 수 기준 - 현재 Manager에 reviews_count가 없으므로 rating 대체
-        # TODO: Manager 모델에 reviews_count 추가 후 수정
-        order_column = Manager.rating.desc()
+        order_column = Manager.reviews_count.desc()
     else:
         # 기본: rating
         order_column = Manager.rating.desc()
 
-    # 페이지네이션
+    # 페이지네이션 (응답 컬럼만 Row로 조회, ORM 객체 생성 없음)
     offset = (page - 1) * limit
-    query = query.order_by(order_column).offset(offset).limit(limit)
+    query = (
+        select(*MANAGER_LIST_COLUMNS)
+        .outerjoin(User, User.id == Manager.user_id)
+        .where(*conditions)
+        .order_by(order_column)
+        .offset(offset)
+        .limit(limit)
+    )
 
     result = await db.execute(query)
-    managers = result.scalars().unique().all()
+    rows = result.all()
+
+    # 지역/자격증/유형별 매니저 수 (메모리 인덱스, 추가 쿼리 없음)
+    facets = None
+    if status_filter == ManagerStatus.ACTIVE.value:
+        facets = manager_facet_index.counts(area, certification, manager_type)
 
     return ManagerListResponse(
-        items=[_build_manager_response(m) for m in managers],
+        items=[_build_manager_list_item(row) for row in rows],
         total=total,
         page=page,
         limit=limit,
+        facets=facets,
     )
 
 
@@ -173,27 +257,13 @@ async def get_my_manager_profile(
             detail="매니저 프로필을 찾을 수 없습니다.",
         )
 
-    # 리뷰 통계
-    stats_result = await db.execute(
-        select(
-            func.count(Review.id).label("count"),
-            func.avg(Review.rating).label("avg"),
-        ).where(Review.manager_id == current_user.id)
-    )
-    stats = stats_result.first()
-
-    base = _build_manager_response(manager)
-    return ManagerDetailResponse(
-        **base.model_dump(),
-        reviews_count=stats.count if stats else 0,
-        avg_rating=Decimal(str(stats.avg or 0)),
-    )
+    return _build_manager_detail_response(manager)
 
 
 @router.get("/{manager_id}", response_model=ManagerDetailResponse)
 async def get_manager(
     manager_id: UUID,
-    db: DbSession,
+    db: ReadSession,
 ) -> ManagerDetailResponse:
     """매니저 상세 조회."""
     result = await db.execute(
@@ -209,21 +279,7 @@ async def get_manager(
             detail="매니저를 찾을 수 없습니다.",
         )
 
-    # 리뷰 통계
-    stats_result = await db.execute(
-        select(
-            func.count(Review.id).label("count"),
-            func.avg(Review.rating).label("avg"),
-        ).where(Review.manager_id == manager.user_id)
-    )
-    stats = stats_result.first()
-
-    base = _build_manager_response(manager)
-    return ManagerDetailResponse(
-        **base.model_dump(),
-        reviews_count=stats.count if stats else 0,
-        avg_rating=Decimal(str(stats.avg or 0)),
-    )
+    return _build_manager_detail_response(manager)
 
 
 @router.patch("/me", response_model=ManagerResponse)
@@ -251,7 +307,7 @@ async def update_my_manager_profile(
         setattr(manager, field, value)
 
     await db.flush()
-    await db.refresh(manager)
+    after_commit(db, lambda: manager_facet_index.update(manager))
 
     return _build_manager_response(manager)
 
@@ -285,7 +341,7 @@ async def update_manager_status(
 
     manager.status = new_status
     await db.flush()
-    await db.refresh(manager)
+    after_commit(db, lambda: manager_facet_index.update(manager))
 
     return _build_manager_response(manager)
 
@@ -345,7 +401,6 @@ async def create_schedule(
 
     db.add(schedule)
     await db.flush()
-    await db.refresh(schedule)
 
     return ScheduleResponse.model_validate(schedule)
 
@@ -389,7 +444,6 @@ async def update_schedule(
         setattr(schedule, field, value)
 
     await db.flush()
-    await db.refresh(schedule)
 
     return ScheduleResponse.model_validate(schedule)
 
@@ -46,9 +46,12 @@ async def create_payment(
             detail="본인의 예약만 결제할 수 있습니다.",
         )
 
-    # 이미 결제가 있는지 확인
+    # 이미 결제가 있는지 확인 (파티션 키 조건으로 해당 월 파티션만 조회)
     existing_result = await db.execute(
-        select(Payment).where(Payment.reservation_id == data.reservation_id)
+        select(Payment).where(
+            Payment.reservation_id == data.reservation_id,
+            Payment.scheduled_date == reservation.scheduled_date,
+        )
     )
     existing = existing_result.scalar_one_or_none()
 
@@ -64,6 +67,7 @@ async def create_payment(
 
     payment = Payment(
         reservation_id=data.reservation_id,
+        scheduled_date=reservation.scheduled_date,
         amount=data.amount,
         method=data.method,
         status=PaymentStatus.PENDING.value,
@@ -71,7 +75,6 @@ async def create_payment(
 
     db.add(payment)
     await db.flush()
-    await db.refresh(payment)
 
     return PaymentResponse.model_validate(payment)
 
@@ -116,14 +119,16 @@ async def confirm_payment(
 
     # 예약 상태 업데이트
     reservation_result = await db.execute(
-        select(Reservation).where(Reservation.id == payment.reservation_id)
+        select(Reservation).where(
+            Reservation.id == payment.reservation_id,
+            Reservation.scheduled_date == payment.scheduled_date,
+        )
     )
     reservation = reservation_result.scalar_one_or_none()
     if reservation and reservation.status == ReservationStatus.PENDING.value:
         reservation.status = ReservationStatus.CONFIRMED.value
 
     await db.flush()
-    await db.refresh(payment)
 
     return PaymentResponse.model_validate(payment)
 
@@ -149,7 +154,10 @@ async def refund_payment(
 
     # 예약 조회
     reservation_result = await db.execute(
-        select(Reservation).where(Reservation.id == payment.reservation_id)
+        select(Reservation).where(
+            Reservation.id == payment.reservation_id,
+            Reservation.scheduled_date == payment.scheduled_date,
+        )
     )
     reservation = reservation_result.scalar_one_or_none()
 
@@ -179,7 +187,6 @@ async def refund_payment(
         reservation.status = ReservationStatus.CANCELLED.value
 
     await db.flush()
-    await db.refresh(payment)
 
     return PaymentResponse.model_validate(payment)
 
@@ -204,7 +211,10 @@ async def get_payment(
 
     # 예약 조회
     reservation_result = await db.execute(
-        select(Reservation).where(Reservation.id == payment.reservation_id)
+        select(Reservation).where(
+            Reservation.id == payment.reservation_id,
+            Reservation.scheduled_date == payment.scheduled_date,
+        )
     )
     reservation = reservation_result.scalar_one_or_none()
 
@@ -248,7 +258,10 @@ async def get_payment_by_reservation(
 
     result = await db.execute(
         select(Payment)
-        .where(Payment.reservation_id == reservation_id)
+        .where(
+            Payment.reservation_id == reservation_id,
+            Payment.scheduled_date == reservation.scheduled_date,
+        )
         .order_by(Payment.created_at.desc())
     )
     payment = result.scalar_one_or_none()
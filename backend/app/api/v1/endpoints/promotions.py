@@ -1,7 +1,7 @@
 """프로모션 API 엔드포인트.
 
 coding-guide 규칙 준수:
-- is_deleted=False 필터 적용 (Soft Delete)
+- 삭제된 행 제외는 세션 전역 조건으로 적용 (Soft Delete, app.db.session)
 - created_by, updated_by 설정
 """
 from uuid import UUID
@@ -27,7 +27,6 @@ async def _get_manager_by_user(db: DbSession, user_id: UUID) -> Manager:
     result = await db.execute(
         select(Manager).where(
             Manager.user_id == user_id,
-            Manager.is_deleted == False,  # noqa: E712 - SQLAlchemy 비교 연산
         )
     )
     manager = result.scalar_one_or_none()
@@ -48,12 +47,11 @@ async def get_my_promotions(
     """내 프로모션 목록 조회."""
     manager = await _get_manager_by_user(db, current_user.id)
 
-    # 프로모션 목록 조회 (is_deleted=False만)
+    # 프로모션 목록 조회
     result = await db.execute(
         select(Promotion)
         .where(
             Promotion.manager_id == manager.id,
-            Promotion.is_deleted == False,  # noqa: E712
         )
         .order_by(Promotion.created_at.desc())
     )
@@ -65,7 +63,6 @@ async def get_my_promotions(
         .select_from(Promotion)
         .where(
             Promotion.manager_id == manager.id,
-            Promotion.is_deleted == False,  # noqa: E712
         )
     )
     total = count_result.scalar() or 0
@@ -101,7 +98,6 @@ async def create_promotion(
 
     db.add(promotion)
     await db.flush()
-    await db.refresh(promotion)
 
     return PromotionResponse.model_validate(promotion)
 
@@ -119,7 +115,6 @@ async def get_promotion(
         select(Promotion).where(
             Promotion.id == promotion_id,
             Promotion.manager_id == manager.id,
-            Promotion.is_deleted == False,  # noqa: E712
         )
     )
     promotion = result.scalar_one_or_none()
@@ -147,7 +142,6 @@ async def update_promotion(
         select(Promotion).where(
             Promotion.id == promotion_id,
             Promotion.manager_id == manager.id,
-            Promotion.is_deleted == False,  # noqa: E712
         )
     )
     promotion = result.scalar_one_or_none()
@@ -166,7 +160,6 @@ async def update_promotion(
     promotion.updated_by = current_user.id
 
     await db.flush()
-    await db.refresh(promotion)
 
     return PromotionResponse.model_validate(promotion)
 
@@ -184,7 +177,6 @@ async def delete_promotion(
         select(Promotion).where(
             Promotion.id == promotion_id,
             Promotion.manager_id == manager.id,
-            Promotion.is_deleted == False,  # noqa: E712
         )
     )
     promotion = result.scalar_one_or_none()
@@ -214,7 +206,6 @@ async def toggle_promotion_active(
         select(Promotion).where(
             Promotion.id == promotion_id,
             Promotion.manager_id == manager.id,
-            Promotion.is_deleted == False,  # noqa: E712
         )
     )
     promotion = result.scalar_one_or_none()
@@ -228,6 +219,5 @@ async def toggle_promotion_active(
     promotion.is_active = not promotion.is_active
     promotion.updated_by = current_user.id  # coding-guide: 수정자 기록
     await db.flush()
-    await db.refresh(promotion)
 
     return PromotionResponse.model_validate(promotion)
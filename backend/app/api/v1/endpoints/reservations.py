@@ -60,7 +60,6 @@ async def create_reservation(
 
     db.add(reservation)
     await db.flush()
-    await db.refresh(reservation)
 
     return ReservationResponse.model_validate(reservation)
 
@@ -183,7 +182,6 @@ async def update_reservation(
         setattr(reservation, field, value)
 
     await db.flush()
-    await db.refresh(reservation)
 
     return ReservationResponse.model_validate(reservation)
 
@@ -280,7 +278,6 @@ async def update_reservation_status(
 
     reservation.status = new_status
     await db.flush()
-    await db.refresh(reservation)
 
     return ReservationResponse.model_validate(reservation)
 
@@ -321,6 +318,5 @@ async def assign_manager(
     reservation.manager_id = manager_id
     reservation.status = ReservationStatus.CONFIRMED.value
     await db.flush()
-    await db.refresh(reservation)
 
     return ReservationResponse.model_validate(reservation)
@@ -5,20 +5,25 @@ from fastapi import APIRouter, HTTPException, Query, status
 from sqlalchemy import func, select
 from sqlalchemy.orm import joinedload
 
-from app.api.deps import CurrentUser, DbSession
+from app.api.deps import CurrentUser, DbSession, ReadSession
 from app.models.reservation import Reservation, ReservationStatus
 from app.models.review import Review
 from app.models.user import User, UserRole
 from app.schemas.review import (
+    ManagerReviewStats,
     ReviewCreate,
     ReviewListResponse,
     ReviewResponse,
     ReviewStats,
     ReviewUpdate,
 )
+from app.services.manager_rating import manager_rating_stats
 
 router = APIRouter()
 
+# 리뷰 작성자 정보는 이름만 필요하므로 필요한 컬럼만 로딩
+_review_user_option = joinedload(Review.user).load_only(User.id, User.name)
+
 
 def _build_review_response(review: Review) -> ReviewResponse:
     """리뷰 응답 객체 생성."""
@@ -95,6 +100,7 @@ async def create_review(
 
     db.add(review)
     await db.flush()
+    await manager_rating_stats.apply_review(db, review.manager_id, added=data.rating)
     await db.refresh(review, ["user"])
 
     return _build_review_response(review)
@@ -102,19 +108,20 @@ async def create_review(
 
 @router.get("/", response_model=ReviewListResponse)
 async def get_reviews(
-    db: DbSession,
+    db: ReadSession,
     page: int = Query(1, ge=1),
     limit: int = Query(10, ge=1, le=100),
     manager_id: UUID | None = None,
 ) -> ReviewListResponse:
     """리뷰 목록 조회."""
-    query = select(Review).options(joinedload(Review.user))
+    query = select(Review).options(_review_user_option)
+    count_query = select(func.count()).select_from(Review)
 
     if manager_id:
         query = query.where(Review.manager_id == manager_id)
+        count_query = count_query.where(Review.manager_id == manager_id)
 
-    # 총 개수 조회
-    count_query = select(func.count()).select_from(query.subquery())
+    # 총 개수 조회 (작성자 조인 불필요)
     total_result = await db.execute(count_query)
     total = total_result.scalar() or 0
 
@@ -133,47 +140,38 @@ async def get_reviews(
     )
 
 
+@router.get("/stats", response_model=list[ManagerReviewStats])
+async def get_review_stats_batch(
+    db: ReadSession,
+    manager_ids: list[UUID] = Query(..., max_length=100, description="매니저 사용자 ID 목록"),
+) -> list[ManagerReviewStats]:
+    """여러 매니저 리뷰 통계 일괄 조회 (요청 순서, 중복 제거)."""
+    stats = await manager_rating_stats.get_review_stats(db, manager_ids)
+    return [
+        ManagerReviewStats(manager_id=manager_id, **manager_stats.model_dump())
+        for manager_id, manager_stats in stats.items()
+    ]
+
+
 @router.get("/stats/{manager_id}", response_model=ReviewStats)
 async def get_review_stats(
     manager_id: UUID,
-    db: DbSession,
+    db: ReadSession,
 ) -> ReviewStats:
-    """매니저 리뷰 통계."""
-    # 기본 통계
-    stats_result = await db.execute(
-        select(
-            func.count(Review.id).label("count"),
-            func.avg(Review.rating).label("avg"),
-        ).where(Review.manager_id == manager_id)
-    )
-    stats = stats_result.first()
-
-    # 평점 분포
-    dist_result = await db.execute(
-        select(Review.rating, func.count(Review.id))
-        .where(Review.manager_id == manager_id)
-        .group_by(Review.rating)
-    )
-    distribution = {1: 0, 2: 0, 3: 0, 4: 0, 5: 0}
-    for rating, count in dist_result.all():
-        distribution[rating] = count
-
-    return ReviewStats(
-        total_reviews=stats.count if stats else 0,
-        average_rating=float(stats.avg or 0),
-        rating_distribution=distribution,
-    )
+    """매니저 리뷰 통계 (manager_id는 매니저 사용자 ID)."""
+    stats = await manager_rating_stats.get_review_stats(db, [manager_id])
+    return stats[manager_id]
 
 
 @router.get("/{review_id}", response_model=ReviewResponse)
 async def get_review(
     review_id: UUID,
-    db: DbSession,
+    db: ReadSession,
 ) -> ReviewResponse:
     """리뷰 상세 조회."""
     result = await db.execute(
         select(Review)
-        .options(joinedload(Review.user))
+        .options(_review_user_option)
         .where(Review.id == review_id)
     )
     review = result.scalar_one_or_none()
@@ -197,7 +195,7 @@ async def update_review(
     """리뷰 수정."""
     result = await db.execute(
         select(Review)
-        .options(joinedload(Review.user))
+        .options(_review_user_option)
         .where(Review.id == review_id)
     )
     review = result.scalar_one_or_none()
@@ -215,12 +213,16 @@ async def update_review(
             detail="접근 권한이 없습니다.",
         )
 
+    previous_rating = review.rating
     update_data = data.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(review, field, value)
 
     await db.flush()
-    await db.refresh(review)
+    if update_data.get("rating") is not None:
+        await manager_rating_stats.apply_review(
+            db, review.manager_id, added=update_data["rating"], removed=previous_rating
+        )
 
     return _build_review_response(review)
 
@@ -252,3 +254,4 @@ async def delete_review(
 
     await db.delete(review)
     await db.flush()
+    await manager_rating_stats.apply_review(db, review.manager_id, removed=review.rating)
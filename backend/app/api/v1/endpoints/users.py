@@ -2,10 +2,12 @@
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, status
-from sqlalchemy import delete, func, select
+from sqlalchemy import delete, func, select, update
 from sqlalchemy.orm import selectinload
 
 from app.api.deps import CurrentAdmin, CurrentUser, DbSession
+from app.core.principal import invalidate_principal
+from app.db.session import after_commit
 from app.models.manager import Manager
 from app.models.payment import Payment, PaymentStatus
 from app.models.reservation import Reservation, ReservationStatus
@@ -57,8 +59,11 @@ async def update_current_user(
     profile_data = {k: v for k, v in update_data.items() if k in profile_fields}
 
     # 사용자 정보 업데이트
-    for field, value in user_fields.items():
-        setattr(current_user, field, value)
+    if user_fields:
+        result = await db.execute(select(User).where(User.id == current_user.id))
+        user = result.scalar_one()
+        for field, value in user_fields.items():
+            setattr(user, field, value)
 
     # 프로필 정보 업데이트
     if profile_data:
@@ -76,6 +81,8 @@ async def update_current_user(
             setattr(profile, field, value)
 
     await db.flush()
+    if user_fields:
+        after_commit(db, lambda: invalidate_principal(current_user.id))
 
     # 업데이트된 정보 다시 로드
     result = await db.execute(
@@ -158,8 +165,10 @@ async def deactivate_current_user(
         # TODO: 정산 시스템 구현 후 미정산 건 확인 로직 추가
 
     # 소프트 삭제: is_active = False
-    current_user.is_active = False
-    await db.flush()
+    await db.execute(
+        update(User).where(User.id == current_user.id).values(is_active=False)
+    )
+    after_commit(db, lambda: invalidate_principal(current_user.id))
 
 
 @router.get("/{user_id}", response_model=UserResponse)
@@ -230,7 +239,7 @@ async def update_user_role(
 
     user.role = role
     await db.flush()
-    await db.refresh(user)
+    after_commit(db, lambda: invalidate_principal(user.id))
 
     return UserResponse.model_validate(user)
 
@@ -253,7 +262,7 @@ async def activate_user(
 
     user.is_active = True
     await db.flush()
-    await db.refresh(user)
+    after_commit(db, lambda: invalidate_principal(user.id))
 
     return UserResponse.model_validate(user)
 
@@ -382,3 +391,4 @@ async def hard_delete_user(
     await db.execute(delete(User).where(User.id == target_user_id))
 
     await db.flush()
+    after_commit(db, lambda: invalidate_principal(target_user_id))
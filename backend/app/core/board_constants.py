@@ -11,6 +11,29 @@ class Permission(str, Enum):
     DISABLED = "disabled"
 
 
+class ModerationAction(str, Enum):
+    """일괄 관리 작업 유형."""
+
+    DELETE = "delete"
+    RESTORE = "restore"
+    MOVE = "move"  # 게시글 분류 이동
+
+
+class ModerationTarget(str, Enum):
+    """일괄 관리 대상."""
+
+    POST = "post"
+    COMMENT = "comment"
+
+
+class ModerationJobStatus(str, Enum):
+    """일괄 관리 백그라운드 작업 상태."""
+
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
 class BoardErrorCode(str, Enum):
     """게시판 에러 코드."""
 
@@ -26,6 +49,9 @@ class BoardErrorCode(str, Enum):
     FILE_TYPE_NOT_ALLOWED = "FILE_TYPE_NOT_ALLOWED"
     INVALID_FILENAME = "INVALID_FILENAME"
     COMMENT_DISABLED = "COMMENT_DISABLED"
+    CATEGORY_NOT_FOUND = "CATEGORY_NOT_FOUND"
+    MODERATION_JOB_NOT_FOUND = "MODERATION_JOB_NOT_FOUND"
+    MODERATION_JOB_NOT_RESUMABLE = "MODERATION_JOB_NOT_RESUMABLE"
 
 
 # 파일 업로드 설정
@@ -55,3 +81,26 @@ MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
 # 페이지네이션 기본값
 DEFAULT_PAGE_SIZE = 20
 MAX_PAGE_SIZE = 100
+
+# 게시글 목록 상단 고정 공지 최대 개수
+MAX_PINNED_NOTICES = 20
+
+# 게시판 홈 요약 기본값
+DEFAULT_SUMMARY_POST_LIMIT = 5
+MAX_SUMMARY_POST_LIMIT = 20
+DEFAULT_SUMMARY_NOTICE_LIMIT = 3
+MAX_SUMMARY_NOTICE_LIMIT = 10
+
+# 인기글(트렌딩) 점수 설정 - HN 방식 시간 감쇠
+# score = (조회수 * W_VIEW + 좋아요 * W_LIKE + 댓글 * W_COMMENT) / (경과 시간(h) + 2) ^ GRAVITY
+TRENDING_WEIGHT_VIEW = 1.0
+TRENDING_WEIGHT_LIKE = 5.0
+TRENDING_WEIGHT_COMMENT = 10.0
+TRENDING_GRAVITY = 1.8
+TRENDING_WINDOW_DAYS = 7  # 집계 대상 기간
+TRENDING_TOP_K = 50  # 게시판별 보관 순위 수
+
+# 일괄 관리 설정
+MAX_BULK_MODERATION_IDS = 5000  # ID 지정 시 요청당 최대 개수 (단일 UPDATE)
+BULK_MODERATION_BATCH_SIZE = 1000  # 작성자 단위 백그라운드 작업의 배치 크기
+MODERATION_JOB_STALE_SECONDS = 300  # 진행 없이 이 시간이 지난 실행 중 작업은 재개 가능
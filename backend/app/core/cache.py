@@ -0,0 +1,52 @@
+"""프로세스 내 TTL 캐시."""
+import time
+from collections.abc import Hashable
+from typing import Generic, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """만료 시간이 있는 간단한 프로세스 내 캐시.
+
+    워커 프로세스마다 독립적으로 유지되므로, 짧은 TTL과 쓰기 시점의
+    명시적 무효화(invalidate)를 함께 사용합니다.
+    최대 크기를 넘으면 가장 오래 전에 저장된 항목부터 제거합니다.
+    """
+
+    def __init__(self, ttl_seconds: float, max_size: int = 1024):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._data: dict[K, tuple[float, V]] = {}
+
+    def get(self, key: K) -> Optional[V]:
+        """캐시 조회 (만료된 항목은 제거 후 None)."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        """캐시 저장."""
+        self._data.pop(key, None)
+        if len(self._data) >= self.max_size:
+            # dict는 삽입 순서를 유지하므로 첫 항목이 가장 오래된 항목
+            del self._data[next(iter(self._data))]
+        self._data[key] = (time.monotonic() + self.ttl_seconds, value)
+
+    def invalidate(self, key: K) -> None:
+        """특정 키 무효화."""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """전체 무효화."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
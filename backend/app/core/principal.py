@@ -0,0 +1,106 @@
+"""인증 사용자 정보(principal) 캐시."""
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+
+
+@dataclass(frozen=True)
+class UserPrincipal:
+    """요청 인증에 필요한 사용자 정보.
+
+    엔드포인트/서비스의 권한 확인은 id, role만 사용하므로 ORM User 대신
+    이 값을 캐시하여 인증된 요청마다 users 테이블을 조회하지 않습니다.
+    """
+
+    id: UUID
+    name: str
+    role: str
+    is_active: bool
+
+
+@dataclass(frozen=True)
+class AccessTokenClaims:
+    """검증된 액세스 토큰에서 사용하는 클레임."""
+
+    user_id: UUID
+    jti: Optional[str]  # 토큰 ID
+    family: Optional[str]  # 로그인 세션 ID
+    expires_at: float
+
+
+class VerifiedTokenCache:
+    """서명 검증을 마친 액세스 토큰 LRU.
+
+    토큰 전체의 SHA-256 다이제스트를 키로 사용하므로, 서명만 같고 내용이 다른
+    토큰은 적중하지 않습니다. 토큰의 exp가 지나면 적중하지 않습니다.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._data: OrderedDict[bytes, AccessTokenClaims] = OrderedDict()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> Optional[AccessTokenClaims]:
+        """검증된 토큰의 클레임 (없거나 만료되면 None)."""
+        key = self._key(token)
+        claims = self._data.get(key)
+        if claims is None:
+            return None
+
+        if claims.expires_at <= time.time():
+            del self._data[key]
+            return None
+
+        self._data.move_to_end(key)
+        return claims
+
+    def set(self, token: str, claims: AccessTokenClaims) -> None:
+        """검증된 토큰 저장 (가장 오래 사용하지 않은 항목부터 제거)."""
+        key = self._key(token)
+        self._data[key] = claims
+        self._data.move_to_end(key)
+        if len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """전체 무효화."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+_principal_cache: TTLCache[UUID, UserPrincipal] = TTLCache(
+    ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+    max_size=settings.PRINCIPAL_CACHE_MAX_SIZE,
+)
+verified_tokens = VerifiedTokenCache(max_size=settings.VERIFIED_TOKEN_CACHE_SIZE)
+
+
+def get_cached_principal(user_id: UUID) -> Optional[UserPrincipal]:
+    """캐시된 사용자 정보 조회."""
+    return _principal_cache.get(user_id)
+
+
+def cache_principal(principal: UserPrincipal) -> None:
+    """사용자 정보 캐시 저장."""
+    _principal_cache.set(principal.id, principal)
+
+
+def invalidate_principal(user_id: UUID) -> None:
+    """사용자 정보 캐시 무효화.
+
+    역할 변경, 활성화/비활성화, 이름 변경, 삭제가 커밋된 뒤 호출합니다
+    (after_commit). 커밋 전에 무효화하면 그 사이의 요청이 이전 값을 다시 캐시합니다.
+    캐시는 워커 프로세스마다 독립적이므로 다른 워커에는 TTL 이내에 반영됩니다.
+    """
+    _principal_cache.invalidate(user_id)
@@ -0,0 +1,189 @@
+"""토큰 버킷 요청 제한."""
+import logging
+import math
+import time
+from abc import ABC, abstractmethod
+from collections import Counter
+from dataclasses import dataclass
+from typing import Optional
+
+from fastapi import HTTPException, status
+from redis.asyncio import Redis
+
+from app.core.config import settings
+from app.core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    """요청 제한 규칙.
+
+    capacity개까지 연속 요청을 허용하고, period_seconds 동안 capacity개가
+    다시 채워집니다.
+    """
+
+    name: str
+    capacity: int
+    period_seconds: float
+
+    @property
+    def refill_per_second(self) -> float:
+        return self.capacity / self.period_seconds
+
+    @classmethod
+    def parse(cls, name: str, spec: str) -> "RateLimitRule":
+        """'횟수/초' 형식 설정 파싱 (예: '5/3600')."""
+        capacity, period = spec.split("/")
+        return cls(name=name, capacity=int(capacity), period_seconds=float(period))
+
+
+class TokenBucketBackend(ABC):
+    """토큰 버킷 상태 저장소."""
+
+    @abstractmethod
+    async def consume(self, key: str, rule: RateLimitRule) -> float:
+        """토큰 1개 소비.
+
+        Returns:
+            허용 시 0, 거부 시 다음 토큰까지 남은 초
+        """
+
+
+class InMemoryTokenBucketBackend(TokenBucketBackend):
+    """프로세스 메모리 토큰 버킷 (단일 워커용).
+
+    버킷은 (토큰 수, 마지막 갱신 시각)만 저장하고, 조회 시점에 경과 시간만큼
+    토큰을 채웁니다(lazy refill). 키는 해시로 샤드에 나누어 저장하며, 샤드가
+    가득 차면 가장 오래 사용하지 않은 버킷부터 제거합니다.
+    """
+
+    def __init__(self, shard_count: int = 16, max_keys_per_shard: int = 10000):
+        self.max_keys_per_shard = max_keys_per_shard
+        self._shards: list[dict[str, tuple[float, float]]] = [{} for _ in range(shard_count)]
+
+    async def consume(self, key: str, rule: RateLimitRule) -> float:
+        shard = self._shards[hash(key) % len(self._shards)]
+        now = time.monotonic()
+
+        bucket = shard.pop(key, None)
+        if bucket is None:
+            tokens = float(rule.capacity)
+        else:
+            tokens, updated_at = bucket
+            tokens = min(rule.capacity, tokens + (now - updated_at) * rule.refill_per_second)
+
+        retry_after = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            retry_after = (1 - tokens) / rule.refill_per_second
+
+        # 다시 넣어 삽입 순서를 최근 사용 순으로 유지
+        shard[key] = (tokens, now)
+        if len(shard) > self.max_keys_per_shard:
+            del shard[next(iter(shard))]
+        return retry_after
+
+
+# KEYS[1]: 버킷 키, ARGV: capacity, 초당 충전량, 현재 시각(초)
+_REDIS_TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1])
+if tokens == nil then
+    tokens = capacity
+else
+    tokens = math.min(capacity, tokens + (now - tonumber(bucket[2])) * rate)
+end
+local retry_after = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    retry_after = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return tostring(retry_after)
+"""
+
+
+class RedisTokenBucketBackend(TokenBucketBackend):
+    """Redis 토큰 버킷 (여러 워커/인스턴스 간 공유).
+
+    충전 계산과 소비를 Lua 스크립트 한 번으로 원자적으로 처리하며,
+    버킷이 가득 찰 시간이 지나면 키가 만료됩니다.
+    """
+
+    KEY_PREFIX = "ratelimit:"
+
+    def __init__(self, client: Redis):
+        self._script = client.register_script(_REDIS_TOKEN_BUCKET_SCRIPT)
+
+    async def consume(self, key: str, rule: RateLimitRule) -> float:
+        retry_after = await self._script(
+            keys=[f"{self.KEY_PREFIX}{key}"],
+            args=[rule.capacity, rule.refill_per_second, time.time()],
+        )
+        return float(retry_after)
+
+
+class RateLimiter:
+    """규칙별 요청 제한과 거부 횟수 집계."""
+
+    def __init__(self, backend: TokenBucketBackend, rules: dict[str, str]):
+        self.backend = backend
+        self.rules = {name: RateLimitRule.parse(name, spec) for name, spec in rules.items()}
+        self.rejected: Counter[str] = Counter()
+
+    async def hit(self, rule_name: str, key: str) -> None:
+        """요청 1회 기록 (한도 초과 시 429).
+
+        설정에 없는 규칙은 제한하지 않습니다. 저장소 장애 시에는 요청을 허용합니다.
+        """
+        rule = self.rules.get(rule_name)
+        if not settings.RATE_LIMIT_ENABLED or rule is None:
+            return
+
+        try:
+            retry_after = await self.backend.consume(f"{rule_name}:{key}", rule)
+        except Exception:
+            logger.exception("요청 제한 확인 실패 (rule=%s)", rule_name)
+            return
+
+        if retry_after > 0:
+            self.rejected[rule_name] += 1
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="요청이 너무 많습니다. 잠시 후 다시 시도해주세요.",
+                headers={"Retry-After": str(math.ceil(retry_after))},
+            )
+
+    def metrics(self) -> dict[str, dict[str, int | float]]:
+        """규칙별 설정과 거부 횟수."""
+        return {
+            name: {
+                "capacity": rule.capacity,
+                "period_seconds": rule.period_seconds,
+                "rejected": self.rejected[name],
+            }
+            for name, rule in self.rules.items()
+        }
+
+
+_rate_limiter: Optional[RateLimiter] = None
+
+
+def get_rate_limiter() -> RateLimiter:
+    """설정(RATE_LIMIT_BACKEND, RATE_LIMIT_RULES)에 따른 요청 제한기."""
+    global _rate_limiter
+    if _rate_limiter is None:
+        if settings.RATE_LIMIT_BACKEND == "redis":
+            backend: TokenBucketBackend = RedisTokenBucketBackend(get_redis())
+        else:
+            backend = InMemoryTokenBucketBackend()
+        _rate_limiter = RateLimiter(backend, settings.RATE_LIMIT_RULES)
+    return _rate_limiter
@@ -0,0 +1,24 @@
+"""Redis 클라이언트."""
+from typing import Optional
+
+from redis.asyncio import Redis
+
+from app.core.config import settings
+
+_redis: Optional[Redis] = None
+
+
+def get_redis() -> Redis:
+    """공유 Redis 클라이언트 (첫 사용 시 생성, 커넥션 풀 공유)."""
+    global _redis
+    if _redis is None:
+        _redis = Redis.from_url(settings.REDIS_URL, decode_responses=True)
+    return _redis
+
+
+async def close_redis() -> None:
+    """Redis 연결 종료 (lifespan 종료 시)."""
+    global _redis
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
@@ -0,0 +1,239 @@
+"""토큰 폐기(revocation) 목록."""
+import asyncio
+import hashlib
+import logging
+import math
+import time
+from abc import ABC, abstractmethod
+from typing import Iterable, Optional
+
+from redis.asyncio import Redis
+
+from app.core.config import settings
+from app.core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+# 만료 시각 기준 버킷 폭. 버킷의 모든 항목이 만료되면 버킷째 버림
+_BUCKET_SECONDS = 24 * 60 * 60
+
+
+def _bucket_of(expires_at: float) -> int:
+    return int(expires_at // _BUCKET_SECONDS)
+
+
+class BloomFilter:
+    """고정 크기 Bloom 필터 (거짓 양성만 있고 거짓 음성은 없음)."""
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str) -> Iterable[int]:
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, item: str) -> None:
+        for pos in self._positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
+class TimeBucketedBloomFilter:
+    """만료 시각별(일 단위) Bloom 필터 묶음.
+
+    토큰 수명(최대 REFRESH_TOKEN_EXPIRE_DAYS)만큼의 버킷만 유지되므로,
+    만료된 폐기 항목이 필터를 계속 채우지 않습니다.
+    """
+
+    def __init__(self, capacity_per_bucket: int, error_rate: float):
+        self.capacity_per_bucket = capacity_per_bucket
+        self.error_rate = error_rate
+        self._buckets: dict[int, BloomFilter] = {}
+
+    def add(self, item: str, expires_at: float) -> None:
+        bucket = _bucket_of(expires_at)
+        bloom = self._buckets.get(bucket)
+        if bloom is None:
+            bloom = BloomFilter(self.capacity_per_bucket, self.error_rate)
+            self._buckets[bucket] = bloom
+        bloom.add(item)
+
+    def might_contain(self, item: str) -> bool:
+        return any(item in bloom for bloom in self._buckets.values())
+
+    def prune(self, now: float) -> None:
+        """모든 항목이 만료된 버킷 제거."""
+        current = _bucket_of(now)
+        for bucket in [b for b in self._buckets if b < current]:
+            del self._buckets[bucket]
+
+
+class RevocationStore(ABC):
+    """폐기 목록 원본 저장소."""
+
+    @abstractmethod
+    async def revoke(self, token_id: str, expires_at: float) -> bool:
+        """폐기 등록 (expires_at 이후에는 보관할 필요 없음).
+
+        Returns:
+            새로 폐기했으면 True, 이미 폐기된 항목이면 False (원자적 확인)
+        """
+
+    @abstractmethod
+    async def is_revoked(self, token_id: str) -> bool:
+        """폐기 여부 (정확한 조회)."""
+
+    async def changes_since(self, cursor: float) -> tuple[list[tuple[str, float]], float]:
+        """다른 워커가 등록한 폐기 항목 (필터 동기화용).
+
+        Returns:
+            ([(토큰 ID, 만료 시각)], 다음 cursor)
+        """
+        return [], cursor
+
+
+class InMemoryRevocationStore(RevocationStore):
+    """프로세스 메모리 저장소 (단일 워커/개발용).
+
+    만료 시각별 버킷에 보관하고 만료된 버킷은 통째로 버립니다.
+    """
+
+    def __init__(self) -> None:
+        self._buckets: dict[int, dict[str, float]] = {}
+
+    async def revoke(self, token_id: str, expires_at: float) -> bool:
+        if await self.is_revoked(token_id):
+            return False
+
+        current = _bucket_of(time.time())
+        for bucket in [b for b in self._buckets if b < current]:
+            del self._buckets[bucket]
+        self._buckets.setdefault(_bucket_of(expires_at), {})[token_id] = expires_at
+        return True
+
+    async def is_revoked(self, token_id: str) -> bool:
+        now = time.time()
+        return any(
+            bucket.get(token_id, 0) > now for bucket in self._buckets.values()
+        )
+
+
+class RedisRevocationStore(RevocationStore):
+    """Redis 저장소 (여러 워커/인스턴스 간 공유).
+
+    항목별 키는 만료 시각에 맞춰 EXPIREAT으로 사라지고, 정렬 집합(등록 시각 점수)에
+    남긴 로그로 다른 워커가 필터를 동기화합니다.
+    """
+
+    KEY_PREFIX = "revoked:"
+    LOG_KEY = "revoked:log"
+
+    def __init__(self, client: Redis):
+        self.client = client
+
+    async def revoke(self, token_id: str, expires_at: float) -> bool:
+        created = await self.client.set(
+            f"{self.KEY_PREFIX}{token_id}", 1, exat=math.ceil(expires_at), nx=True
+        )
+        if not created:
+            return False
+
+        now = time.time()
+        log_retention = settings.REFRESH_TOKEN_EXPIRE_DAYS * _BUCKET_SECONDS
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.zadd(self.LOG_KEY, {f"{token_id}|{expires_at}": now})
+            pipe.zremrangebyscore(self.LOG_KEY, "-inf", now - log_retention)
+            await pipe.execute()
+        return True
+
+    async def is_revoked(self, token_id: str) -> bool:
+        return bool(await self.client.exists(f"{self.KEY_PREFIX}{token_id}"))
+
+    async def changes_since(self, cursor: float) -> tuple[list[tuple[str, float]], float]:
+        rows = await self.client.zrangebyscore(self.LOG_KEY, cursor, "+inf", withscores=True)
+        changes = []
+        for member, score in rows:
+            token_id, expires_at = member.rsplit("|", 1)
+            changes.append((token_id, float(expires_at)))
+            cursor = max(cursor, score)
+        return changes, cursor
+
+
+class TokenRevocation:
+    """토큰 폐기 확인.
+
+    폐기된 토큰 ID(jti)와 로그인 세션 ID(fam)를 Bloom 필터에 넣어 두고,
+    필터에 걸린 경우에만 저장소를 조회합니다. 폐기되지 않은 대부분의 요청은
+    메모리 확인만으로 끝납니다.
+    """
+
+    def __init__(self, store: RevocationStore):
+        self.store = store
+        self.filter = TimeBucketedBloomFilter(
+            settings.TOKEN_REVOCATION_FILTER_CAPACITY,
+            settings.TOKEN_REVOCATION_FILTER_ERROR_RATE,
+        )
+        self._cursor = 0.0
+
+    async def revoke(self, token_id: str, expires_at: float) -> bool:
+        """폐기 등록.
+
+        Returns:
+            새로 폐기했으면 True, 이미 폐기된 항목이면 False
+        """
+        revoked = await self.store.revoke(token_id, expires_at)
+        self.filter.add(token_id, expires_at)
+        return revoked
+
+    async def is_revoked(self, token_id: str, exact: bool = False) -> bool:
+        """폐기 여부.
+
+        기본은 필터 적중 시에만 저장소를 조회합니다. 다른 워커의 폐기가 아직
+        동기화되지 않았을 수 있으므로, 토큰 갱신처럼 즉시 정확해야 하는 확인은
+        exact=True로 저장소를 바로 조회합니다.
+        """
+        if not exact and not self.filter.might_contain(token_id):
+            return False
+        return await self.store.is_revoked(token_id)
+
+    async def sync(self) -> int:
+        """다른 워커가 등록한 폐기 항목을 필터에 반영.
+
+        Returns:
+            반영된 항목 수
+        """
+        changes, self._cursor = await self.store.changes_since(self._cursor)
+        for token_id, expires_at in changes:
+            self.filter.add(token_id, expires_at)
+        self.filter.prune(time.time())
+        return len(changes)
+
+    async def run_periodic_sync(self, interval_seconds: float) -> None:
+        """주기적 동기화 루프 (lifespan에서 실행)."""
+        while True:
+            try:
+                await self.sync()
+            except Exception:
+                logger.exception("토큰 폐기 목록 동기화 실패")
+            await asyncio.sleep(interval_seconds)
+
+
+_token_revocation: Optional[TokenRevocation] = None
+
+
+def get_token_revocation() -> TokenRevocation:
+    """설정(TOKEN_REVOCATION_BACKEND)에 따른 토큰 폐기 확인기."""
+    global _token_revocation
+    if _token_revocation is None:
+        if settings.TOKEN_REVOCATION_BACKEND == "redis":
+            store: RevocationStore = RedisRevocationStore(get_redis())
+        else:
+            store = InMemoryRevocationStore()
+        _token_revocation = TokenRevocation(store)
+    return _token_revocation
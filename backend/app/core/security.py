@@ -1,3 +1,8 @@
+import asyncio
+import hashlib
+import hmac
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
@@ -8,9 +13,27 @@ from app.core.config import settings
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt는 호출당 100ms 이상 CPU를 점유하므로 이벤트 루프가 아닌 전용 스레드 풀에서 실행.
+# max_workers가 동시 해싱/검증 수의 상한이 되고, 초과 요청은 풀 큐에서 대기한다.
+_password_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_MAX_WORKERS,
+    thread_name_prefix="bcrypt",
+)
 
-def create_access_token(subject: str | Any, expires_delta: timedelta | None = None) -> str:
-    """Create JWT access token."""
+
+def _new_token_id() -> str:
+    return uuid.uuid4().hex
+
+
+def create_access_token(
+    subject: str | Any,
+    expires_delta: timedelta | None = None,
+    family: str | None = None,
+) -> str:
+    """Create JWT access token.
+
+    jti(토큰 ID)와 fam(로그인 세션 ID)을 포함하여 로그아웃/재사용 감지 시 폐기할 수 있다.
+    """
     if expires_delta:
         expire = datetime.now(timezone.utc) + expires_delta
     else:
@@ -18,23 +41,51 @@ def create_access_token(subject: str | Any, expires_delta: timedelta | None = No
             minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
         )
 
-    to_encode = {"exp": expire, "sub": str(subject), "type": "access"}
+    to_encode = {
+        "exp": expire,
+        "sub": str(subject),
+        "type": "access",
+        "jti": _new_token_id(),
+        "fam": family or _new_token_id(),
+    }
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
 
-def create_refresh_token(subject: str | Any, expires_delta: timedelta | None = None) -> str:
-    """Create JWT refresh token."""
+def create_refresh_token(
+    subject: str | Any,
+    expires_delta: timedelta | None = None,
+    family: str | None = None,
+) -> str:
+    """Create JWT refresh token.
+
+    갱신할 때마다 같은 fam으로 새 토큰을 발급(rotation)하고 이전 jti는 폐기한다.
+    """
     if expires_delta:
         expire = datetime.now(timezone.utc) + expires_delta
     else:
         expire = datetime.now(timezone.utc) + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
 
-    to_encode = {"exp": expire, "sub": str(subject), "type": "refresh"}
+    to_encode = {
+        "exp": expire,
+        "sub": str(subject),
+        "type": "refresh",
+        "jti": _new_token_id(),
+        "fam": family or _new_token_id(),
+    }
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
 
+def create_token_pair(subject: str | Any, family: str | None = None) -> tuple[str, str]:
+    """같은 로그인 세션(fam)의 access/refresh 토큰 쌍 생성."""
+    family = family or _new_token_id()
+    return (
+        create_access_token(subject, family=family),
+        create_refresh_token(subject, family=family),
+    )
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify password against hash."""
     return pwd_context.verify(plain_password, hashed_password)
@@ -45,6 +96,66 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify password against hash without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _password_hash_executor, pwd_context.verify, plain_password, hashed_password
+    )
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Hash password without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_hash_executor, pwd_context.hash, password)
+
+
+def _secret_post_password_fingerprint(post_id: str | Any, secret_password_hash: str) -> str:
+    """게시글과 비밀번호 해시에 대한 HMAC (비밀번호 변경 시 기존 열람 권한 무효화).
+
+    토큰에 해시 자체를 담지 않으므로 토큰이 노출되어도 해시를 알 수 없다.
+    """
+    message = f"{post_id}:{secret_password_hash}".encode()
+    return hmac.new(settings.SECRET_KEY.encode(), message, hashlib.sha256).hexdigest()
+
+
+def create_secret_post_grant(post_id: str | Any, secret_password_hash: str) -> str:
+    """비밀글 열람 권한 토큰 생성.
+
+    비밀번호 확인에 성공한 뒤 발급하여, 유효 시간 동안은 bcrypt 재검증 없이
+    같은 게시글(본문, 댓글)을 열람할 수 있게 한다.
+    """
+    expire = datetime.now(timezone.utc) + timedelta(
+        minutes=settings.SECRET_POST_GRANT_EXPIRE_MINUTES
+    )
+    to_encode = {
+        "exp": expire,
+        "sub": str(post_id),
+        "type": "secret_post",
+        "pwh": _secret_post_password_fingerprint(post_id, secret_password_hash),
+    }
+    return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+
+
+def verify_secret_post_grant(
+    token: str,
+    post_id: str | Any,
+    secret_password_hash: str,
+) -> bool:
+    """비밀글 열람 권한 토큰 검증 (서명, 만료, 게시글, 비밀번호 변경 여부)."""
+    payload = decode_token(token)
+    if not payload or payload.get("type") != "secret_post":
+        return False
+    if payload.get("sub") != str(post_id):
+        return False
+    fingerprint = payload.get("pwh")
+    if not isinstance(fingerprint, str):
+        return False
+    return hmac.compare_digest(
+        fingerprint, _secret_post_password_fingerprint(post_id, secret_password_hash)
+    )
+
+
 def decode_token(token: str) -> dict[str, Any] | None:
     """Decode JWT token."""
     try:
@@ -10,7 +10,9 @@ from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 class Base(DeclarativeBase):
     """Base class for all models."""
 
-    pass
+    # INSERT/UPDATE 시 서버 생성 값(created_at, updated_at)을 RETURNING으로 함께 조회하여
+    # flush 후 refresh() SELECT 없이 응답을 만들 수 있게 함
+    __mapper_args__ = {"eager_defaults": True}
 
 
 class TimestampMixin:
@@ -23,6 +25,9 @@ class TimestampMixin:
     - updated_by: 수정자 ID
     - is_active: 사용 여부
     - is_deleted: 삭제 여부 (Soft Delete)
+
+    삭제된 행은 모든 ORM 조회에서 자동으로 제외됩니다 (app.db.session).
+    삭제된 행까지 조회하려면 execution_options(include_deleted=True)를 지정합니다.
     """
 
     created_at: Mapped[datetime] = mapped_column(
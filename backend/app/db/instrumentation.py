@@ -0,0 +1,172 @@
+"""요청별 SQL 계측과 반복 쿼리(N+1) 감지."""
+import json
+import logging
+import re
+import time
+from collections import Counter
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Optional
+
+from fastapi import Request, Response
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 바인드 파라미터 표기 (asyncpg $1, sqlite ?, pyformat %(name)s)
+_PARAMETER_PATTERN = re.compile(r"\$\d+|\?|%\(\w+\)s")
+# IN 목록처럼 개수만 다른 파라미터 나열
+_PARAMETER_LIST_PATTERN = re.compile(r"\?(?:\s*,\s*\?)+")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+_START_TIMES_KEY = "query_start_times"
+
+
+class RepeatedStatementError(RuntimeError):
+    """요청 하나에서 같은 형태의 쿼리가 기준 횟수를 넘어 실행됨 (N+1 의심)."""
+
+
+def fingerprint(statement: str) -> str:
+    """파라미터 값/개수와 공백 차이를 무시한 쿼리 형태."""
+    normalized = _PARAMETER_PATTERN.sub("?", statement)
+    normalized = _PARAMETER_LIST_PATTERN.sub("?", normalized)
+    return _WHITESPACE_PATTERN.sub(" ", normalized).strip()
+
+
+class QueryStats:
+    """쿼리 수, 총 DB 시간, 가장 느린 쿼리, 쿼리 형태별 실행 횟수."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_seconds = 0.0
+        self.slowest_seconds = 0.0
+        self.slowest_statement: Optional[str] = None
+        self.fingerprints: Counter[str] = Counter()
+
+    def record(self, statement: str, elapsed: float) -> int:
+        """쿼리 1건 기록.
+
+        Returns:
+            이 요청에서 같은 형태 쿼리의 실행 횟수
+        """
+        self.count += 1
+        self.total_seconds += elapsed
+        if elapsed >= self.slowest_seconds:
+            self.slowest_seconds = elapsed
+            self.slowest_statement = statement
+        shape = fingerprint(statement)
+        self.fingerprints[shape] += 1
+        return self.fingerprints[shape]
+
+    def repeated(self, min_count: int = 2) -> dict[str, int]:
+        """min_count번 이상 실행된 쿼리 형태."""
+        return {shape: count for shape, count in self.fingerprints.most_common() if count >= min_count}
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "query_count": self.count,
+            "db_ms": round(self.total_seconds * 1000, 2),
+            "slowest_ms": round(self.slowest_seconds * 1000, 2),
+            "slowest_statement": (self.slowest_statement or "")[:300],
+            "repeated": {shape[:200]: count for shape, count in self.repeated().items()},
+        }
+
+
+# 현재 요청의 쿼리 통계 (미들웨어가 요청마다 설정, 요청 밖에서는 None)
+_request_stats: ContextVar[Optional[QueryStats]] = ContextVar("request_query_stats", default=None)
+# assert_max_queries 블록에서 수집 중인 통계 (테스트 클라이언트는 다른 스레드에서 요청을 처리하므로 전역)
+_budget_stats: list[QueryStats] = []
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info.setdefault(_START_TIMES_KEY, []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    start_times = conn.info.get(_START_TIMES_KEY)
+    if not start_times:
+        return
+    elapsed = time.perf_counter() - start_times.pop()
+
+    for stats in _budget_stats:
+        stats.record(statement, elapsed)
+
+    stats = _request_stats.get()
+    if stats is None:
+        return
+
+    executions = stats.record(statement, elapsed)
+    if executions == settings.SQL_REPEATED_STATEMENT_THRESHOLD + 1:
+        message = f"같은 형태의 쿼리가 요청 하나에서 {executions}회 이상 실행됨 (N+1 의심): {fingerprint(statement)[:300]}"
+        if settings.SQL_REPEATED_STATEMENT_ACTION == "raise":
+            raise RepeatedStatementError(message)
+        logger.warning(message)
+
+
+def _server_timing(stats: QueryStats) -> str:
+    return f'db;dur={stats.total_seconds * 1000:.2f};desc="{stats.count} queries"'
+
+
+async def sql_instrumentation_middleware(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    """요청별 쿼리 통계를 Server-Timing 헤더와 요청 로그로 남김 (SQL_INSTRUMENTATION_ENABLED 시 등록)."""
+    stats = QueryStats()
+    token = _request_stats.set(stats)
+    started = time.perf_counter()
+    try:
+        response = await call_next(request)
+    finally:
+        _request_stats.reset(token)
+
+    existing = response.headers.get("Server-Timing")
+    timing = _server_timing(stats)
+    response.headers["Server-Timing"] = f"{existing}, {timing}" if existing else timing
+
+    if stats.count:
+        route = request.scope.get("route")
+        logger.info(
+            "request_sql %s",
+            json.dumps(
+                {
+                    "method": request.method,
+                    "route": getattr(route, "path", request.url.path),
+                    "status": response.status_code,
+                    "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+                    **stats.summary(),
+                },
+                ensure_ascii=False,
+            ),
+        )
+    return response
+
+
+@contextmanager
+def assert_max_queries(limit: int) -> Iterator[QueryStats]:
+    """블록 안에서 실행된 SQL이 limit건 이하인지 확인 (테스트용 쿼리 예산).
+
+    사용 예:
+        with assert_max_queries(3):
+            client.get("/api/v1/managers/")
+    """
+    stats = QueryStats()
+    _budget_stats.append(stats)
+    try:
+        yield stats
+    finally:
+        _budget_stats.remove(stats)
+
+    if stats.count > limit:
+        repeated = "\n".join(
+            f"  {count}x {shape[:200]}" for shape, count in stats.repeated().items()
+        )
+        raise AssertionError(
+            f"쿼리 예산 초과: {stats.count}건 실행 (최대 {limit}건)"
+            + (f"\n반복된 쿼리:\n{repeated}" if repeated else "")
+        )
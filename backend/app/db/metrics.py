@@ -0,0 +1,62 @@
+"""DB 세션/커넥션 사용 통계."""
+from collections import defaultdict
+from contextvars import ContextVar
+
+# 현재 요청의 라우트 ("GET /api/v1/boards/{code}"). 요청 밖(백그라운드 작업)은 기본값
+current_route: ContextVar[str] = ContextVar("db_current_route", default="background")
+
+
+class DbRouteStats:
+    """라우트별 DB 세션 요청 수, 커넥션 체크아웃 수, 커밋 수.
+
+    세션을 선언했지만 쿼리가 없는 요청은 체크아웃이 없고, 쓰기가 없는 요청은
+    커밋이 없으므로 requests 대비 checkouts/commits 비율로 절감 효과를 확인합니다.
+    replica_reads는 조회 세션(ReadSession)이 복제본으로 라우팅된 횟수입니다.
+    워커 프로세스마다 독립적으로 집계됩니다.
+    """
+
+    def __init__(self) -> None:
+        self._stats: defaultdict[str, dict[str, int]] = defaultdict(
+            lambda: {"requests": 0, "checkouts": 0, "commits": 0, "replica_reads": 0}
+        )
+
+    def record(self, route: str, field: str) -> None:
+        self._stats[route][field] += 1
+
+    def snapshot(self) -> dict[str, dict[str, int]]:
+        return {route: dict(stats) for route, stats in self._stats.items()}
+
+
+class PoolWaitStats:
+    """커넥션 풀 획득 대기 시간과 타임아웃 수.
+
+    획득 시간에는 유휴 커넥션이 없어 새 커넥션을 여는 시간도 포함됩니다.
+    """
+
+    def __init__(self) -> None:
+        self.acquisitions = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def record(self, wait_seconds: float, timed_out: bool = False) -> None:
+        self.acquisitions += 1
+        self.wait_seconds_total += wait_seconds
+        self.wait_seconds_max = max(self.wait_seconds_max, wait_seconds)
+        if timed_out:
+            self.timeouts += 1
+
+    def snapshot(self) -> dict[str, int | float]:
+        return {
+            "acquisitions": self.acquisitions,
+            "timeouts": self.timeouts,
+            "wait_ms_avg": round(
+                self.wait_seconds_total / self.acquisitions * 1000, 3
+            ) if self.acquisitions else 0.0,
+            "wait_ms_max": round(self.wait_seconds_max * 1000, 3),
+        }
+
+
+db_route_stats = DbRouteStats()
+# 풀 이름("primary", "replica-0", ...)별 대기 통계
+pool_wait_stats: defaultdict[str, PoolWaitStats] = defaultdict(PoolWaitStats)
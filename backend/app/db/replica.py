@@ -0,0 +1,214 @@
+"""읽기 전용 복제본(replica) 라우팅."""
+import logging
+import time
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from typing import Optional
+from uuid import UUID
+
+from fastapi import Request, Response
+from sqlalchemy import event, exc
+from sqlalchemy.engine import ExceptionContext
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.principal import verified_tokens
+from app.db.metrics import current_route, db_route_stats
+from app.db.session import (
+    READ_ONLY,
+    ReadOnlySessionError,
+    async_session_maker,
+    create_db_engine,
+    create_session_maker,
+    engine,
+    pool_status,
+    warmup_pool,
+)
+
+logger = logging.getLogger(__name__)
+
+# 쓰기를 커밋한 클라이언트가 primary에서 읽어야 하는 시각(epoch 초)
+PRIMARY_STICKY_COOKIE = "db_primary_until"
+# 조회 세션 트랜잭션은 READ ONLY로 시작 (primary로 넘어가도 쓰기 불가)
+_READ_ONLY_OPTIONS = {"postgresql_readonly": True}
+# primary 조회용 엔진 (같은 풀 사용)
+_primary_read_engine = engine.execution_options(**_READ_ONLY_OPTIONS)
+
+
+def _request_user_id(request: Request) -> Optional[UUID]:
+    """이 워커에서 이미 검증된 액세스 토큰의 사용자 ID (서명 재검증 없음)."""
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    claims = verified_tokens.get(token)
+    return claims.user_id if claims else None
+
+
+class Replica:
+    """복제본 엔진과 사용 가능 상태.
+
+    접속 실패나 연결 끊김이 발생하면 DATABASE_REPLICA_RETRY_SECONDS 동안
+    선택 대상에서 제외했다가 다시 시도합니다.
+    """
+
+    def __init__(self, name: str, url: str):
+        self.name = name
+        self.engine = create_db_engine(url, name)
+        self.session_maker = create_session_maker(self.engine)
+        self.down_until = 0.0
+        self.failures = 0
+        event.listen(self.engine.sync_engine, "handle_error", self._on_error)
+
+    @property
+    def available(self) -> bool:
+        return self.down_until <= time.monotonic()
+
+    def mark_down(self) -> None:
+        self.failures += 1
+        self.down_until = time.monotonic() + settings.DATABASE_REPLICA_RETRY_SECONDS
+
+    def _on_error(self, context: ExceptionContext) -> None:
+        # 접속 실패(connection 없음) 또는 쿼리 중 연결 끊김. pre-ping 실패는 풀이 재연결함
+        if not context.is_pre_ping and (context.connection is None or context.is_disconnect):
+            logger.warning("복제본 오류로 일시 제외 (%s): %s", self.name, context.original_exception)
+            self.mark_down()
+
+
+class ReplicaRouter:
+    """조회 요청의 복제본 선택.
+
+    사용 가능한 복제본 사이에서 라운드 로빈으로 고르고, 모두 사용할 수 없으면
+    primary를 사용합니다. 쓰기를 커밋한 클라이언트는 복제 지연과 무관하게 자기
+    변경을 보도록 DATABASE_REPLICA_STICKY_SECONDS 동안 primary에서 읽습니다
+    (응답 쿠키, 또는 같은 워커에서는 인증 사용자 ID 기준).
+    """
+
+    def __init__(self, urls: list[str]):
+        self.replicas = [Replica(f"replica-{index}", url) for index, url in enumerate(urls)]
+        self._next = 0
+        self._recent_writers: TTLCache[UUID, bool] = TTLCache(
+            ttl_seconds=settings.DATABASE_REPLICA_STICKY_SECONDS,
+            max_size=100000,
+        )
+
+    def candidates(self) -> list[Replica]:
+        """이번 요청에서 시도할 복제본 (라운드 로빈 순서, 사용 가능한 것만)."""
+        start = self._next
+        self._next = (start + 1) % len(self.replicas)
+        ordered = self.replicas[start:] + self.replicas[:start]
+        return [replica for replica in ordered if replica.available]
+
+    def reads_from_primary(self, request: Request) -> bool:
+        """최근 쓰기를 커밋한 클라이언트인지."""
+        sticky_until = request.cookies.get(PRIMARY_STICKY_COOKIE)
+        if sticky_until:
+            try:
+                if float(sticky_until) > time.time():
+                    return True
+            except ValueError:
+                pass
+
+        user_id = _request_user_id(request)
+        return user_id is not None and self._recent_writers.get(user_id) is not None
+
+    def record_write(self, request: Request, response: Response) -> None:
+        """쓰기를 커밋한 클라이언트를 일정 기간 primary에 고정."""
+        sticky_seconds = settings.DATABASE_REPLICA_STICKY_SECONDS
+        response.set_cookie(
+            PRIMARY_STICKY_COOKIE,
+            str(int(time.time()) + sticky_seconds),
+            max_age=sticky_seconds,
+            httponly=True,
+            samesite="lax",
+        )
+        user_id = _request_user_id(request)
+        if user_id is not None:
+            self._recent_writers.set(user_id, True)
+
+    async def warmup(self, connections: int) -> None:
+        """복제본별 커넥션 풀 예열."""
+        for replica in self.replicas:
+            if connections and not await warmup_pool(connections, replica.engine):
+                replica.mark_down()
+
+    async def dispose(self) -> None:
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+    def pool_status(self) -> dict[str, dict[str, int | float]]:
+        """복제본별 풀 상태와 사용 가능 여부."""
+        return {
+            replica.name: {
+                **pool_status(replica.engine),
+                "available": int(replica.available),
+                "failures": replica.failures,
+            }
+            for replica in self.replicas
+        }
+
+
+_replica_router: Optional[ReplicaRouter] = None
+
+
+def get_replica_router() -> Optional[ReplicaRouter]:
+    """설정(DATABASE_REPLICA_URLS)에 따른 복제본 라우터 (없으면 None)."""
+    global _replica_router
+    if _replica_router is None and settings.DATABASE_REPLICA_URLS:
+        _replica_router = ReplicaRouter(settings.DATABASE_REPLICA_URLS)
+    return _replica_router
+
+
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Dependency for getting read-only database session.
+
+    복제본이 설정되어 있으면 복제본에 연결하고, 접속에 실패하면 다음 복제본,
+    모두 실패하면 primary로 넘어갑니다. 커밋하지 않으며 요청이 끝나면 닫습니다.
+
+    트랜잭션은 READ ONLY로 시작하고, 세션 변경(add/수정/delete)은 flush 시점이나
+    요청이 끝날 때 ReadOnlySessionError로 거부합니다 (버려지지 않도록).
+    """
+    route = request.scope.get("route")
+    route_name = f"{request.method} {getattr(route, 'path', request.url.path)}"
+    current_route.set(route_name)
+    db_route_stats.record(route_name, "requests")
+
+    router = get_replica_router()
+    connection: Optional[AsyncConnection] = None
+    session: Optional[AsyncSession] = None
+    if router is not None and not router.reads_from_primary(request):
+        for replica in router.candidates():
+            try:
+                connection = await replica.engine.connect()
+                await connection.execution_options(**_READ_ONLY_OPTIONS)
+            except (OSError, exc.SQLAlchemyError):
+                logger.warning("복제본 접속 실패, 다음 대상으로 전환 (%s)", replica.name)
+                if replica.available:  # handle_error에서 이미 제외했으면 중복 집계하지 않음
+                    replica.mark_down()
+                continue
+            session = replica.session_maker(bind=connection)
+            db_route_stats.record(route_name, "replica_reads")
+            break
+
+    if session is None:
+        session = async_session_maker(bind=_primary_read_engine)
+    session.info[READ_ONLY] = True
+
+    try:
+        yield session
+        if session.new or session.dirty or session.deleted:
+            raise ReadOnlySessionError("조회 전용 세션의 변경은 저장되지 않습니다. DbSession을 사용하세요.")
+    finally:
+        await session.close()
+        if connection is not None:
+            await connection.close()
+
+
+async def read_your_writes_middleware(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    """쓰기를 커밋한 요청의 응답에 primary 고정 쿠키 발급 (복제본 사용 시 등록)."""
+    response = await call_next(request)
+    router = get_replica_router()
+    if router is not None and getattr(request.state, "db_committed", False):
+        router.record_write(request, response)
+    return response
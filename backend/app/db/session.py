@@ -1,34 +1,276 @@
-from collections.abc import AsyncGenerator
+import asyncio
+import logging
+import time
+import uuid
+from collections.abc import AsyncGenerator, Callable
+from typing import Any, Optional
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from fastapi import Request
+from sqlalchemy import event, exc, select
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import ORMExecuteState, Session, with_loader_criteria
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.core.config import settings
+from app.db.base import TimestampMixin
+from app.db.metrics import current_route, db_route_stats, pool_wait_stats
+
+logger = logging.getLogger(__name__)
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """커넥션 획득 대기 시간과 타임아웃을 집계하는 풀 (풀 이름별)."""
+
+    def _do_get(self) -> Any:
+        stats = pool_wait_stats[self._orig_logging_name or PRIMARY_POOL_NAME]
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            stats.record(time.perf_counter() - started, timed_out=True)
+            raise
+        stats.record(time.perf_counter() - started)
+        return connection
+
+
+def _connect_args() -> dict[str, Any]:
+    """asyncpg 접속 옵션 (세션 기본 statement_timeout)."""
+    if not settings.DATABASE_STATEMENT_TIMEOUT_MS:
+        return {}
+    return {
+        "server_settings": {"statement_timeout": str(settings.DATABASE_STATEMENT_TIMEOUT_MS)}
+    }
+
+
+def create_db_engine(url: str, pool_name: str) -> AsyncEngine:
+    """풀 설정이 적용된 엔진 생성 (primary, 복제본 공통)."""
+    db_engine = create_async_engine(
+        url,
+        echo=False,
+        future=True,
+        poolclass=InstrumentedQueuePool,
+        pool_logging_name=pool_name,
+        pool_size=settings.DATABASE_POOL_SIZE,
+        max_overflow=settings.DATABASE_MAX_OVERFLOW,
+        pool_timeout=settings.DATABASE_POOL_TIMEOUT_SECONDS,
+        pool_recycle=settings.DATABASE_POOL_RECYCLE_SECONDS,
+        pool_pre_ping=settings.DATABASE_POOL_PRE_PING,
+        connect_args=_connect_args(),
+    )
+    event.listen(db_engine.sync_engine, "checkout", _record_checkout)
+    return db_engine
+
+
+def create_session_maker(bind: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    """세션 팩토리 생성 (primary, 복제본 공통)."""
+    return async_sessionmaker(
+        bind,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+    )
+
+
+def _record_checkout(dbapi_connection, connection_record, connection_proxy) -> None:
+    db_route_stats.record(current_route.get(), "checkouts")
+
+
+PRIMARY_POOL_NAME = "primary"
 
 # Create async engine
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=False,
-    future=True,
-)
+engine = create_db_engine(settings.DATABASE_URL, PRIMARY_POOL_NAME)
 
 # Create async session factory
-async_session_maker = async_sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autocommit=False,
-    autoflush=False,
-)
+async_session_maker = create_session_maker(engine)
+
+# 세션에서 쓰기(flush, DML 실행)가 있었는지 표시하는 session.info 키
+_HAS_WRITES = "has_writes"
+# 커밋 후 실행할 콜백 목록 session.info 키
+_AFTER_COMMIT = "after_commit_callbacks"
+# 삭제(soft delete)된 행도 조회해야 할 때 지정하는 실행 옵션
+# 예: select(Post).execution_options(include_deleted=True)
+INCLUDE_DELETED = "include_deleted"
+# 조회 전용 세션(get_read_db) 표시 session.info 키
+READ_ONLY = "read_only"
+
+
+class ReadOnlySessionError(RuntimeError):
+    """조회 전용 세션(ReadSession)에서 쓰기 시도 (쓰기는 DbSession으로)."""
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_write_statement(orm_execute_state: ORMExecuteState) -> None:
+    if not orm_execute_state.is_select:
+        orm_execute_state.session.info[_HAS_WRITES] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _reject_read_only_statement(orm_execute_state: ORMExecuteState) -> None:
+    if orm_execute_state.session.info.get(READ_ONLY) and (
+        orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete
+    ):
+        raise ReadOnlySessionError("조회 전용 세션에서는 INSERT/UPDATE/DELETE를 실행할 수 없습니다.")
+
+
+def exclude_deleted() -> Any:
+    """삭제된 행 제외 조건 (TimestampMixin 모델 전체에 적용되는 로더 옵션)."""
+    return with_loader_criteria(
+        TimestampMixin,
+        lambda cls: cls.is_deleted == False,  # noqa: E712
+        include_aliases=True,
+    )
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _exclude_soft_deleted(orm_execute_state: ORMExecuteState) -> None:
+    """모든 ORM 조회에서 삭제된 행 제외.
 
+    지연/관계 로딩에는 최초 조회의 조건이 그대로 전파됩니다.
+    """
+    if (
+        orm_execute_state.is_select
+        and not orm_execute_state.is_column_load
+        and not orm_execute_state.is_relationship_load
+        and not orm_execute_state.execution_options.get(INCLUDE_DELETED, False)
+    ):
+        orm_execute_state.statement = orm_execute_state.statement.options(exclude_deleted())
+
+
+@event.listens_for(Session, "before_flush")
+def _reject_read_only_flush(session: Session, flush_context, instances) -> None:
+    if session.info.get(READ_ONLY) and (session.new or session.dirty or session.deleted):
+        raise ReadOnlySessionError("조회 전용 세션에서는 변경을 flush할 수 없습니다.")
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_flush(session: Session, flush_context) -> None:
+    session.info[_HAS_WRITES] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _run_after_commit(session: Session) -> None:
+    for callback in session.info.pop(_AFTER_COMMIT, []):
+        callback()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_commit(session: Session) -> None:
+    session.info.pop(_AFTER_COMMIT, None)
+
+
+def after_commit(session: AsyncSession, callback: Callable[[], None]) -> None:
+    """트랜잭션이 커밋된 뒤 실행할 콜백 등록 (캐시 무효화 등).
+
+    서비스는 커밋하지 않고 flush만 하며, 커밋은 요청 경계(get_db)에서 한 번만
+    수행합니다. 롤백되면 콜백은 버려집니다.
+    """
+    session.info.setdefault(_AFTER_COMMIT, []).append(callback)
+
+
+def _has_writes(session: AsyncSession) -> bool:
+    """커밋이 필요한지 (쓰기 실행 또는 아직 flush되지 않은 변경)."""
+    return bool(
+        session.info.get(_HAS_WRITES)
+        or session.new
+        or session.dirty
+        or session.deleted
+    )
+
+
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Dependency for getting async database session.
+
+    요청 하나가 하나의 트랜잭션(unit of work)입니다. 서비스는 flush만 하고,
+    여기서 요청이 끝날 때 한 번만 커밋합니다.
+
+    커넥션은 첫 쿼리 실행 시점에 풀에서 가져오므로, 쿼리가 없는 요청은
+    체크아웃하지 않습니다. 쓰기가 없는 요청은 COMMIT 없이 세션을 닫습니다.
+    """
+    route = request.scope.get("route")
+    route_name = f"{request.method} {getattr(route, 'path', request.url.path)}"
+    current_route.set(route_name)
+    db_route_stats.record(route_name, "requests")
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Dependency for getting async database session."""
     async with async_session_maker() as session:
         try:
             yield session
-            await session.commit()
+            if _has_writes(session):
+                await session.commit()
+                db_route_stats.record(route_name, "commits")
+                # 읽기 복제본 라우팅의 read-your-writes 판단용
+                request.state.db_committed = True
         except Exception:
             await session.rollback()
             raise
         finally:
             await session.close()
+
+
+def _warmup_statements() -> list[Any]:
+    """예열 시 실행할 쿼리.
+
+    인증 사용자 조회, 게시판 설정 조회는 요청 경로와 같은 SQL이므로
+    prepared statement가 그대로 재사용됩니다. 나머지는 주요 테이블 컬럼 타입
+    (UUID, JSONB, ARRAY 등) 정보를 미리 조회해 둡니다.
+    """
+    # 예열에서만 쓰는 모델이므로 세션 모듈이 모델 패키지 전체에 의존하지 않도록 여기서 import
+    from app.models import Board, Manager, Post, Reservation, Review, User
+
+    placeholder_id = uuid.UUID(int=0)
+    # 커넥션 직접 실행은 ORM 이벤트를 거치지 않으므로 삭제 행 제외 조건을 직접 추가
+    return [
+        select(User.id, User.name, User.role, User.is_active)
+        .where(User.id == placeholder_id)
+        .where(User.is_deleted == False),  # noqa: E712
+        select(Board)
+        .where(Board.code == "")
+        .where(Board.is_deleted == False),  # noqa: E712
+        *(select(model).limit(0) for model in (Post, Manager, Reservation, Review)),
+    ]
+
+
+async def warmup_pool(connections: int, target: Optional[AsyncEngine] = None) -> int:
+    """커넥션 풀 예열 (lifespan 시작 시, 기본은 primary).
+
+    connections개(최대 풀 크기)의 커넥션을 동시에 열고, 커넥션마다 주요 쿼리를
+    한 번씩 실행해 첫 요청이 접속/타입 조회/statement 준비 비용을 내지 않게 합니다.
+    DB에 접속할 수 없어도 앱 시작은 계속합니다.
+
+    Returns:
+        예열된 커넥션 수
+    """
+    statements = _warmup_statements()
+
+    async def _prime() -> None:
+        async with (target or engine).connect() as conn:
+            for statement in statements:
+                await conn.execute(statement)
+
+    count = min(connections, settings.DATABASE_POOL_SIZE)
+    results = await asyncio.gather(*(_prime() for _ in range(count)), return_exceptions=True)
+    failures = [result for result in results if isinstance(result, BaseException)]
+    if failures:
+        logger.warning("커넥션 풀 예열 실패 (%d/%d): %s", len(failures), count, failures[0])
+    return count - len(failures)
+
+
+def pool_status(target: Optional[AsyncEngine] = None) -> dict[str, int | float]:
+    """커넥션 풀 현재 상태와 누적 대기 통계 (현재 워커 기준, 기본은 primary)."""
+    pool = (target or engine).pool
+    status: dict[str, int | float] = {}
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        status.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=max(pool.overflow(), 0),
+        )
+    pool_name = getattr(pool, "logging_name", None) or PRIMARY_POOL_NAME
+    status.update(pool_wait_stats[pool_name].snapshot())
+    return status
@@ -1,3 +1,5 @@
+import asyncio
+import contextlib
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
@@ -7,6 +9,16 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.api.v1.router import api_router
 from app.core.board_exceptions import BoardException, board_exception_handler
 from app.core.config import settings
+from app.core.redis import close_redis
+from app.core.revocation import get_token_revocation
+from app.db.instrumentation import sql_instrumentation_middleware
+from app.db.replica import get_replica_router, read_your_writes_middleware
+from app.db.session import engine, warmup_pool
+from app.services.manager_facets import manager_facet_index
+from app.services.manager_rating import manager_rating_stats
+from app.services.partitioning import partition_maintenance
+from app.services.post_counter import post_view_counter
+from app.services.trending import trending_tracker
 
 
 @asynccontextmanager
@@ -14,9 +26,54 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan events."""
     # Startup
     print("Starting up...")
+    await warmup_pool(settings.DATABASE_POOL_WARMUP_CONNECTIONS)
+    replica_router = get_replica_router()
+    if replica_router is not None:
+        await replica_router.warmup(settings.DATABASE_POOL_WARMUP_CONNECTIONS)
+    view_count_task = asyncio.create_task(
+        post_view_counter.run_periodic_flush(settings.VIEW_COUNT_FLUSH_INTERVAL_SECONDS)
+    )
+    trending_task = asyncio.create_task(
+        trending_tracker.run_periodic_refresh(
+            settings.TRENDING_REFRESH_INTERVAL_SECONDS,
+            settings.TRENDING_RESEED_INTERVAL_SECONDS,
+        )
+    )
+    revocation_sync_task = asyncio.create_task(
+        get_token_revocation().run_periodic_sync(settings.TOKEN_REVOCATION_SYNC_INTERVAL_SECONDS)
+    )
+    partition_task = asyncio.create_task(
+        partition_maintenance.run_periodic_maintenance(
+            settings.PARTITION_MAINTENANCE_INTERVAL_SECONDS,
+            settings.PARTITION_MONTHS_AHEAD,
+            settings.PARTITION_ARCHIVE_RETENTION_MONTHS,
+        )
+    )
+    rating_reconcile_task = asyncio.create_task(
+        manager_rating_stats.run_periodic_reconcile(settings.MANAGER_RATING_RECONCILE_INTERVAL_SECONDS)
+    )
+    facet_task = asyncio.create_task(
+        manager_facet_index.run_periodic_reseed(settings.MANAGER_FACET_RESEED_INTERVAL_SECONDS)
+    )
     yield
     # Shutdown
     print("Shutting down...")
+    for task in (
+        view_count_task,
+        trending_task,
+        revocation_sync_task,
+        partition_task,
+        rating_reconcile_task,
+        facet_task,
+    ):
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+    await post_view_counter.flush()
+    await close_redis()
+    await engine.dispose()
+    if replica_router is not None:
+        await replica_router.dispose()
 
 
 app = FastAPI(
@@ -38,6 +95,14 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 읽기 복제본 사용 시 쓰기 직후 조회를 primary로 고정 (read-your-writes)
+if settings.DATABASE_REPLICA_URLS:
+    app.middleware("http")(read_your_writes_middleware)
+
+# 요청별 SQL 계측 (Server-Timing 헤더, 요청 로그, 반복 쿼리 감지)
+if settings.SQL_INSTRUMENTATION_ENABLED:
+    app.middleware("http")(sql_instrumentation_middleware)
+
 # 예외 핸들러 등록
 app.add_exception_handler(BoardException, board_exception_handler)
 
@@ -5,7 +5,7 @@ from app.models.reservation import Reservation, ServiceType, ReservationStatus
 from app.models.payment import Payment, PaymentStatus, PaymentMethod
 from app.models.review import Review
 from app.models.promotion import Promotion, DiscountType, DiscountTarget
-from app.models.board import Board, BoardCategory, Post, Comment, Attachment
+from app.models.board import Board, BoardCategory, Post, Comment, Attachment, ModerationJob
 
 __all__ = [
     # User
@@ -37,4 +37,5 @@ __all__ = [
     "Post",
     "Comment",
     "Attachment",
+    "ModerationJob",
 ]
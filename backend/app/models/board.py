@@ -2,7 +2,7 @@
 import uuid
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import Boolean, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -116,7 +116,7 @@ class Post(Base, TimestampMixin):
     title: Mapped[str] = mapped_column(String(200), nullable=False)
     content: Mapped[str] = mapped_column(Text, nullable=False)
 
-    is_notice: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False, index=True)
+    is_notice: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     is_secret: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     secret_password: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
 
@@ -145,6 +145,23 @@ class Post(Base, TimestampMixin):
     )
 
 
+# 일반 게시글 목록 (공지 제외, 최신순) 전용 부분 인덱스
+Index(
+    "ix_posts_board_id_created_at_listing",
+    Post.board_id,
+    Post.created_at.desc(),
+    postgresql_where=(Post.is_deleted == False) & (Post.is_notice == False),  # noqa: E712
+)
+
+# 게시판 상단 고정 공지 (최신순) 부분 인덱스 - 공지만 담으므로 크기가 작음
+Index(
+    "ix_posts_board_id_created_at_notices",
+    Post.board_id,
+    Post.created_at.desc(),
+    postgresql_where=(Post.is_deleted == False) & (Post.is_notice == True),  # noqa: E712
+)
+
+
 class Comment(Base, TimestampMixin):
     """댓글 모델."""
 
@@ -193,6 +210,15 @@ class Comment(Base, TimestampMixin):
     )
 
 
+# 게시글별 댓글 목록 (작성순, 삭제되지 않은 댓글)
+Index(
+    "ix_comments_post_id_created_at",
+    Comment.post_id,
+    Comment.created_at,
+    postgresql_where=Comment.is_deleted == False,  # noqa: E712
+)
+
+
 class Attachment(Base, TimestampMixin):
     """첨부파일 모델."""
 
@@ -219,3 +245,30 @@ class Attachment(Base, TimestampMixin):
 
     # Relationships
     post: Mapped["Post"] = relationship("Post", back_populates="attachments")
+
+
+class ModerationJob(Base, TimestampMixin):
+    """작성자 단위 일괄 관리 작업.
+
+    배치마다 대상 변경과 같은 트랜잭션에서 진행 위치(last_id)를 기록하므로,
+    작업을 실행하던 프로세스가 종료되어도 다른 워커에서 이어서 처리할 수 있습니다.
+    created_by는 작업을 요청한 관리자입니다.
+    """
+
+    __tablename__ = "moderation_jobs"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid.uuid4,
+    )
+    target: Mapped[str] = mapped_column(String(20), nullable=False)  # ModerationTarget
+    action: Mapped[str] = mapped_column(String(20), nullable=False)  # ModerationAction
+    author_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    category_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), nullable=True)
+    status: Mapped[str] = mapped_column(String(20), nullable=False)  # ModerationJobStatus
+    processed: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    affected: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    # 마지막으로 처리한 대상 ID (키셋 배치 재개 위치)
+    last_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), nullable=True)
+    error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
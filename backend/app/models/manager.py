@@ -2,7 +2,7 @@ import uuid
 from enum import Enum
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import Boolean, Date, ForeignKey, Numeric, String, Text, Time
+from sqlalchemy import Boolean, Date, ForeignKey, Index, Numeric, String, Text, Time
 from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -58,6 +58,15 @@ class Manager(Base, TimestampMixin):
         default=0.0,
     )
     total_services: Mapped[int] = mapped_column(nullable=False, default=0)
+    # 리뷰 집계 (리뷰 작성/수정/삭제 시 같은 트랜잭션에서 갱신, app.services.manager_rating)
+    # rating은 rating_sum / reviews_count를 소수 첫째 자리로 반올림한 값
+    reviews_count: Mapped[int] = mapped_column(nullable=False, default=0)
+    rating_sum: Mapped[int] = mapped_column(nullable=False, default=0)
+    rating_1_count: Mapped[int] = mapped_column(nullable=False, default=0)
+    rating_2_count: Mapped[int] = mapped_column(nullable=False, default=0)
+    rating_3_count: Mapped[int] = mapped_column(nullable=False, default=0)
+    rating_4_count: Mapped[int] = mapped_column(nullable=False, default=0)
+    rating_5_count: Mapped[int] = mapped_column(nullable=False, default=0)
     certifications: Mapped[list[str]] = mapped_column(
         ARRAY(String),
         nullable=False,
@@ -88,6 +97,23 @@ class Manager(Base, TimestampMixin):
     )
 
 
+# 매니저 목록 (상태 필터, 평점순)
+Index(
+    "ix_managers_status_rating",
+    Manager.status,
+    Manager.rating.desc(),
+    postgresql_where=Manager.is_deleted == False,  # noqa: E712
+)
+
+# 매니저 목록 (상태 필터, 리뷰 많은 순)
+Index(
+    "ix_managers_status_reviews_count",
+    Manager.status,
+    Manager.reviews_count.desc(),
+    postgresql_where=Manager.is_deleted == False,  # noqa: E712
+)
+
+
 class ManagerSchedule(Base, TimestampMixin):
     """Manager schedule model."""
 
@@ -110,3 +136,12 @@ class ManagerSchedule(Base, TimestampMixin):
 
     # Relationships
     manager: Mapped["Manager"] = relationship("Manager", back_populates="schedules")
+
+
+# 매니저 날짜별 스케줄
+Index(
+    "ix_manager_schedules_manager_id_date",
+    ManagerSchedule.manager_id,
+    ManagerSchedule.date,
+    postgresql_where=ManagerSchedule.is_deleted == False,  # noqa: E712
+)
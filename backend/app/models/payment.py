@@ -1,10 +1,18 @@
 import uuid
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
 from enum import Enum
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import DateTime, ForeignKey, Numeric, String
+from sqlalchemy import (
+    Date,
+    DateTime,
+    ForeignKeyConstraint,
+    Index,
+    Numeric,
+    String,
+    UniqueConstraint,
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -32,18 +40,26 @@ class Payment(Base, TimestampMixin):
     """Payment model."""
 
     __tablename__ = "payments"
+    # 예약과 같은 예약일 기준 월별 파티션 (예약 파티션과 함께 보관)
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["reservation_id", "scheduled_date"],
+            ["reservations.id", "reservations.scheduled_date"],
+            ondelete="CASCADE",
+            onupdate="CASCADE",
+        ),
+        UniqueConstraint("reservation_id", "scheduled_date"),
+        {"postgresql_partition_by": "RANGE (scheduled_date)"},
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
         default=uuid.uuid4,
     )
-    reservation_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True),
-        ForeignKey("reservations.id", ondelete="CASCADE"),
-        nullable=False,
-        unique=True,
-    )
+    reservation_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    # 예약의 scheduled_date (파티션 키, 예약 일정 변경 시 함께 갱신)
+    scheduled_date: Mapped[date] = mapped_column(Date, primary_key=True)
     amount: Mapped[Decimal] = mapped_column(Numeric(10, 0), nullable=False)
     method: Mapped[str] = mapped_column(String(30), nullable=False)
     status: Mapped[str] = mapped_column(
@@ -58,3 +74,11 @@ class Payment(Base, TimestampMixin):
 
     # Relationships
     reservation: Mapped["Reservation"] = relationship("Reservation", back_populates="payment")
+
+
+# 관리자 결제 목록 (최신순)
+Index(
+    "ix_payments_created_at",
+    Payment.created_at.desc(),
+    postgresql_where=Payment.is_deleted == False,  # noqa: E712
+)
@@ -4,7 +4,7 @@ from decimal import Decimal
 from enum import Enum
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import Date, ForeignKey, Numeric, String, Text, Time
+from sqlalchemy import Date, ForeignKey, Index, Numeric, String, Text, Time
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -34,6 +34,8 @@ class Reservation(Base, TimestampMixin):
     """Reservation model."""
 
     __tablename__ = "reservations"
+    # 예약일 기준 월별 파티션 (app.services.partitioning이 파티션 생성/보관)
+    __table_args__ = {"postgresql_partition_by": "RANGE (scheduled_date)"}
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -51,7 +53,8 @@ class Reservation(Base, TimestampMixin):
         nullable=True,
     )
     service_type: Mapped[str] = mapped_column(String(50), nullable=False)
-    scheduled_date: Mapped[date] = mapped_column(Date, nullable=False)
+    # 파티션 키는 기본 키에 포함되어야 함
+    scheduled_date: Mapped[date] = mapped_column(Date, primary_key=True)
     scheduled_time: Mapped[time] = mapped_column(Time, nullable=False)
     estimated_hours: Mapped[Decimal] = mapped_column(
         Numeric(3, 1),
@@ -84,6 +87,24 @@ class Reservation(Base, TimestampMixin):
     )
     review: Mapped[Optional["Review"]] = relationship(
         "Review",
+        primaryjoin="Reservation.id == foreign(Review.reservation_id)",
         back_populates="reservation",
         uselist=False,
     )
+
+
+# 매니저 중복 예약 확인 (manager_id, scheduled_date, status IN (...))
+Index(
+    "ix_reservations_manager_id_scheduled_date_status",
+    Reservation.manager_id,
+    Reservation.scheduled_date,
+    Reservation.status,
+    postgresql_where=Reservation.is_deleted == False,  # noqa: E712
+)
+# 내 예약 목록 (최신순)
+Index(
+    "ix_reservations_user_id_created_at",
+    Reservation.user_id,
+    Reservation.created_at.desc(),
+    postgresql_where=Reservation.is_deleted == False,  # noqa: E712
+)
@@ -1,8 +1,8 @@
 import uuid
 from decimal import Decimal
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import ForeignKey, Numeric, Text
+from sqlalchemy import ForeignKey, Index, Numeric, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -23,9 +23,9 @@ class Review(Base, TimestampMixin):
         primary_key=True,
         default=uuid.uuid4,
     )
+    # 예약은 월별 파티션 테이블이고 오래된 파티션은 보관 후 삭제되므로 외래 키 없이 앱에서 확인
     reservation_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
-        ForeignKey("reservations.id", ondelete="CASCADE"),
         nullable=False,
         unique=True,
     )
@@ -43,6 +43,19 @@ class Review(Base, TimestampMixin):
     content: Mapped[str] = mapped_column(Text, nullable=False)
 
     # Relationships
-    reservation: Mapped["Reservation"] = relationship("Reservation", back_populates="review")
+    reservation: Mapped[Optional["Reservation"]] = relationship(
+        "Reservation",
+        primaryjoin="foreign(Review.reservation_id) == Reservation.id",
+        back_populates="review",
+    )
     user: Mapped["User"] = relationship("User", foreign_keys=[user_id])
     manager: Mapped["User"] = relationship("User", foreign_keys=[manager_id])
+
+
+# 매니저 리뷰 목록 (최신순)
+Index(
+    "ix_reviews_manager_id_created_at",
+    Review.manager_id,
+    Review.created_at.desc(),
+    postgresql_where=Review.is_deleted == False,  # noqa: E712
+)
@@ -48,6 +48,9 @@ from app.schemas.board import (
     PostUpdate,
     PostResponse,
     PostListItem,
+    BoardSummary,
+    BulkModerationRequest,
+    ModerationJobResponse,
     CommentCreate,
     CommentUpdate,
     CommentResponse,
@@ -107,6 +110,9 @@ __all__ = [
     "PostUpdate",
     "PostResponse",
     "PostListItem",
+    "BoardSummary",
+    "BulkModerationRequest",
+    "ModerationJobResponse",
     "CommentCreate",
     "CommentUpdate",
     "CommentResponse",
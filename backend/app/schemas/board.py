@@ -4,7 +4,14 @@ from datetime import datetime
 from typing import Optional, List
 from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+from app.core.board_constants import (
+    MAX_BULK_MODERATION_IDS,
+    ModerationAction,
+    ModerationJobStatus,
+    ModerationTarget,
+)
 
 
 # ==================== Board 스키마 ====================
@@ -259,6 +266,59 @@ class AttachmentResponse(BaseModel):
         from_attributes = True
 
 
+# ==================== Board Summary 스키마 ====================
+class BoardSummary(BaseModel):
+    """게시판 요약 스키마 (홈 화면용 공지 + 최신글)."""
+
+    board_id: UUID
+    code: str
+    name: str
+    notices: List[PostListItem] = []
+    latest_posts: List[PostListItem] = []
+
+
+# ==================== Moderation 스키마 ====================
+class BulkModerationRequest(BaseModel):
+    """게시글/댓글 일괄 관리 요청 스키마.
+
+    ids(최대 MAX_BULK_MODERATION_IDS개) 또는 author_id 중 하나를 지정합니다.
+    author_id 지정 시 백그라운드 작업으로 배치 처리됩니다.
+    """
+
+    target: ModerationTarget
+    action: ModerationAction
+    ids: List[UUID] = Field(default_factory=list, max_length=MAX_BULK_MODERATION_IDS)
+    author_id: Optional[UUID] = None
+    category_id: Optional[UUID] = None  # action=move 일 때 이동할 분류
+
+    @model_validator(mode="after")
+    def validate_selection(self) -> "BulkModerationRequest":
+        """대상 선택 조건 검증."""
+        if bool(self.ids) == bool(self.author_id):
+            raise ValueError("ids 또는 author_id 중 하나만 지정해야 합니다.")
+        if self.action == ModerationAction.MOVE:
+            if self.target != ModerationTarget.POST:
+                raise ValueError("분류 이동은 게시글에만 사용할 수 있습니다.")
+            if not self.category_id:
+                raise ValueError("분류 이동에는 category_id가 필요합니다.")
+        return self
+
+
+class ModerationJobResponse(BaseModel):
+    """일괄 관리 결과/작업 상태 응답 스키마.
+
+    ids 지정 요청은 즉시 완료되어 job_id가 없습니다.
+    """
+
+    job_id: Optional[UUID] = None
+    target: ModerationTarget
+    action: ModerationAction
+    status: ModerationJobStatus
+    processed: int = 0  # 검사한 대상 수
+    affected: int = 0  # 실제 변경된 대상 수
+    error: Optional[str] = None
+
+
 # ==================== Pagination 스키마 ====================
 class PaginatedResponse(BaseModel):
     """페이지네이션 응답 스키마."""
@@ -268,6 +328,7 @@ class PaginatedResponse(BaseModel):
     page: int
     page_size: int
     total_pages: int
+    notices: List[PostListItem] = []  # 상단 고정 공지 (items와 별도)
 
 
 # ==================== Error 스키마 ====================
@@ -50,6 +50,10 @@ class ManagerResponse(BaseModel):
     is_volunteer: bool = False
     created_at: datetime
 
+    # 리뷰 통계 (매니저 집계 컬럼)
+    reviews_count: int = 0
+    avg_rating: Decimal = Decimal("0.0")
+
     # User 정보 포함
     name: Optional[str] = None
     phone: Optional[str] = None
@@ -58,6 +62,15 @@ class ManagerResponse(BaseModel):
         from_attributes = True
 
 
+class ManagerFacetCounts(BaseModel):
+    """매니저 검색 패싯 카운트 스키마 (활성 매니저 기준, 값별 매니저 수 내림차순)."""
+
+    total: int
+    areas: dict[str, int]
+    certifications: dict[str, int]
+    types: dict[str, int]  # expert, new, volunteer
+
+
 class ManagerListResponse(BaseModel):
     """매니저 목록 응답 스키마."""
 
@@ -65,13 +78,16 @@ class ManagerListResponse(BaseModel):
     total: int
     page: int
     limit: int
+    facets: Optional[ManagerFacetCounts] = Field(
+        None,
+        description="활성 매니저 검색의 패싯 카운트 (그 외 검색, 또는 서버 시작 후 첫 재적재 전이면 null)",
+    )
 
 
 class ManagerDetailResponse(ManagerResponse):
     """매니저 상세 응답 스키마 (추가 정보 포함)."""
 
-    reviews_count: int = 0
-    avg_rating: Decimal = Decimal("0.0")
+    rating_distribution: dict[int, int] = Field(default_factory=dict)
 
 
 # Schedule 스키마
@@ -58,3 +58,9 @@ class ReviewStats(BaseModel):
     total_reviews: int
     average_rating: float
     rating_distribution: dict[int, int]  # {1: 10, 2: 5, 3: 20, 4: 50, 5: 100}
+
+
+class ManagerReviewStats(ReviewStats):
+    """매니저별 리뷰 통계 스키마 (일괄 조회)."""
+
+    manager_id: UUID
@@ -2,30 +2,93 @@
 from typing import Optional, List
 from uuid import UUID
 
-from passlib.hash import bcrypt
-from sqlalchemy import select, func, or_, and_
+from sqlalchemy import Row, Select, select, func, or_, and_, true, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.core.board_constants import (
     BoardErrorCode,
     Permission,
     DEFAULT_PAGE_SIZE,
     MAX_PAGE_SIZE,
+    DEFAULT_SUMMARY_NOTICE_LIMIT,
+    DEFAULT_SUMMARY_POST_LIMIT,
+    MAX_PINNED_NOTICES,
 )
 from app.core.board_exceptions import BoardException
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.principal import UserPrincipal
+from app.core.security import (
+    create_secret_post_grant,
+    get_password_hash_async,
+    verify_password_async,
+    verify_secret_post_grant,
+)
+from app.db.session import after_commit
 from app.models.board import Board, BoardCategory, Post, Comment
 from app.models.user import User
+from app.services.post_counter import post_view_counter
+from app.services.trending import trending_tracker
 from app.schemas.board import (
     BoardCreate,
     BoardUpdate,
+    BoardResponse,
+    BoardSummary,
     BoardCategoryCreate,
     PostCreate,
     PostUpdate,
+    PostListItem,
     CommentCreate,
 )
 
 
+# 작성자 정보 로딩 시 필요한 컬럼만 조회 (phone, email, password_hash 등 제외)
+AUTHOR_INFO_COLUMNS = (User.id, User.name, User.role)
+
+# 게시글 목록(PostListItem) 컬럼 프로젝션 - ORM 객체 대신 Row로 조회
+POST_LIST_COLUMNS = (
+    Post.id,
+    Post.board_id,
+    Post.category_id,
+    Post.author_id,
+    User.name.label("author_name"),
+    Post.title,
+    Post.is_notice,
+    Post.is_secret,
+    Post.view_count,
+    Post.like_count,
+    Post.comment_count,
+    Post.is_answered,
+    Post.created_at,
+)
+
+# 게시판 설정 캐시 (code → BoardResponse). 권한 확인은 이 스냅샷으로 수행
+_board_config_cache: TTLCache[str, BoardResponse] = TTLCache(
+    ttl_seconds=settings.BOARD_CACHE_TTL_SECONDS,
+)
+
+# 게시판 홈 요약 캐시 ((열람 가능 권한, 최신글 수, 공지 수) → 요약 목록). 게시글 쓰기 시 무효화
+_board_summary_cache: TTLCache[tuple, List[BoardSummary]] = TTLCache(
+    ttl_seconds=settings.BOARD_SUMMARY_CACHE_TTL_SECONDS,
+)
+
+# 게시판별 상단 고정 공지 캐시 (board_id → 공지 목록). 공지 게시글 쓰기 시 무효화
+_notice_cache: TTLCache[UUID, List[PostListItem]] = TTLCache(
+    ttl_seconds=settings.NOTICE_CACHE_TTL_SECONDS,
+)
+
+
+def _readable_permissions(current_user: Optional[UserPrincipal]) -> tuple[str, ...]:
+    """사용자가 읽을 수 있는 게시판 읽기 권한 목록."""
+    if not current_user:
+        return (Permission.PUBLIC.value,)
+    if current_user.role == "admin":
+        return (Permission.PUBLIC.value, Permission.MEMBER.value, Permission.ADMIN.value)
+    return (Permission.PUBLIC.value, Permission.MEMBER.value)
+
+
 class BoardService:
     """게시판 서비스."""
 
@@ -38,10 +101,117 @@ class BoardService:
         result = await db.execute(
             select(Board)
             .where(Board.code == code)
-            .where(Board.is_deleted == False)  # noqa: E712
         )
         return result.scalar_one_or_none()
 
+    @staticmethod
+    async def get_board_config(
+        db: AsyncSession,
+        code: str,
+    ) -> Optional[BoardResponse]:
+        """게시판 설정 조회 (캐시 우선).
+
+        읽기 경로의 권한 확인용입니다. 게시판 수정/삭제 시 무효화됩니다.
+        """
+        config = _board_config_cache.get(code)
+        if config is not None:
+            return config
+
+        board = await BoardService.get_board_by_code(db, code)
+        if not board:
+            return None
+
+        config = BoardResponse.model_validate(board)
+        _board_config_cache.set(code, config)
+        return config
+
+    @staticmethod
+    def invalidate_board_config(code: str) -> None:
+        """게시판 설정 캐시 무효화."""
+        _board_config_cache.invalidate(code)
+
+    @staticmethod
+    async def list_board_summaries(
+        db: AsyncSession,
+        current_user: Optional[UserPrincipal] = None,
+        post_limit: int = DEFAULT_SUMMARY_POST_LIMIT,
+        notice_limit: int = DEFAULT_SUMMARY_NOTICE_LIMIT,
+    ) -> List[BoardSummary]:
+        """활성 게시판별 공지 + 최신글 요약 (캐시 우선).
+
+        게시판마다 LATERAL 서브쿼리(공지 UNION ALL 최신글)를 조인하여
+        모든 게시판의 요약을 한 번의 쿼리로 조회합니다.
+        """
+        permissions = _readable_permissions(current_user)
+        cache_key = (permissions, post_limit, notice_limit)
+        summaries = _board_summary_cache.get(cache_key)
+        if summaries is not None:
+            return summaries
+
+        def _posts_branch(is_notice: bool, limit: int):
+            return (
+                select(*POST_LIST_COLUMNS)
+                .join(User, User.id == Post.author_id)
+                .where(Post.board_id == Board.id)
+                .where(Post.is_notice == is_notice)
+                .order_by(Post.created_at.desc())
+                .limit(limit)
+            )
+
+        board_posts = (
+            union_all(_posts_branch(True, notice_limit), _posts_branch(False, post_limit))
+            .subquery()
+            .lateral("board_posts")
+        )
+        query = (
+            select(
+                Board.id.label("summary_board_id"),
+                Board.code.label("board_code"),
+                Board.name.label("board_name"),
+                board_posts,
+            )
+            .select_from(Board)
+            .outerjoin(board_posts, true())
+            .where(Board.is_active == True)  # noqa: E712
+            .where(Board.read_permission.in_(permissions))
+            .order_by(
+                Board.sort_order,
+                Board.created_at.desc(),
+                board_posts.c.created_at.desc(),
+            )
+        )
+        result = await db.execute(query)
+
+        by_board: dict[UUID, BoardSummary] = {}
+        for row in result.all():
+            summary = by_board.get(row.summary_board_id)
+            if summary is None:
+                summary = BoardSummary(
+                    board_id=row.summary_board_id,
+                    code=row.board_code,
+                    name=row.board_name,
+                )
+                by_board[row.summary_board_id] = summary
+
+            # 게시글이 없는 게시판은 LEFT JOIN 결과로 id가 NULL
+            if row.id is None:
+                continue
+
+            item = PostListItem.model_validate(row)
+            if item.is_notice:
+                summary.notices.append(item)
+            else:
+                summary.latest_posts.append(item)
+
+        summaries = list(by_board.values())
+        _board_summary_cache.set(cache_key, summaries)
+        return summaries
+
+    @staticmethod
+    def invalidate_board_summaries() -> None:
+        """게시판 홈 요약 캐시 무효화."""
+        _board_summary_cache.clear()
+
     @staticmethod
     async def get_board_by_id(
         db: AsyncSession,
@@ -51,7 +221,6 @@ class BoardService:
         result = await db.execute(
             select(Board)
             .where(Board.id == board_id)
-            .where(Board.is_deleted == False)  # noqa: E712
         )
         return result.scalar_one_or_none()
 
@@ -61,7 +230,7 @@ class BoardService:
         is_active: Optional[bool] = None,
     ) -> List[Board]:
         """게시판 목록 조회."""
-        query = select(Board).where(Board.is_deleted == False)  # noqa: E712
+        query = select(Board)
 
         if is_active is not None:
             query = query.where(Board.is_active == is_active)
@@ -91,8 +260,7 @@ class BoardService:
             updated_by=creator_id,
         )
         db.add(board)
-        await db.commit()
-        await db.refresh(board)
+        await db.flush()
         return board
 
     @staticmethod
@@ -108,8 +276,9 @@ class BoardService:
             setattr(board, key, value)
 
         board.updated_by = updater_id
-        await db.commit()
-        await db.refresh(board)
+        await db.flush()
+        after_commit(db, lambda: BoardService.invalidate_board_config(board.code))
+        after_commit(db, BoardService.invalidate_board_summaries)
         return board
 
     @staticmethod
@@ -122,18 +291,20 @@ class BoardService:
         board.is_deleted = True
         board.is_active = False
         board.updated_by = deleter_id
-        await db.commit()
+        await db.flush()
+        after_commit(db, lambda: BoardService.invalidate_board_config(board.code))
+        after_commit(db, BoardService.invalidate_board_summaries)
 
     @staticmethod
     async def check_board_permission(
-        board: Board,
+        board: Board | BoardResponse,
         permission_type: str,  # "read", "write", "comment"
-        current_user: Optional[User] = None,
+        current_user: Optional[UserPrincipal] = None,
     ) -> None:
         """게시판 권한 검증.
 
         Args:
-            board: 게시판 객체
+            board: 게시판 객체 또는 캐시된 게시판 설정
             permission_type: "read", "write", "comment"
             current_user: 현재 사용자 (없으면 비회원)
 
@@ -178,7 +349,6 @@ class CategoryService:
         result = await db.execute(
             select(BoardCategory)
             .where(BoardCategory.board_id == board_id)
-            .where(BoardCategory.is_deleted == False)  # noqa: E712
             .where(BoardCategory.is_active == True)  # noqa: E712
             .order_by(BoardCategory.sort_order, BoardCategory.created_at)
         )
@@ -199,8 +369,7 @@ class CategoryService:
             updated_by=creator_id,
         )
         db.add(category)
-        await db.commit()
-        await db.refresh(category)
+        await db.flush()
         return category
 
 
@@ -211,14 +380,22 @@ class PostService:
     async def get_post_by_id(
         db: AsyncSession,
         post_id: UUID,
+        board_id: Optional[UUID] = None,
     ) -> Optional[Post]:
-        """게시글 ID로 조회."""
-        result = await db.execute(
+        """게시글 ID로 조회.
+
+        작성자 정보(id, name, role)를 조인하여 한 번의 쿼리로 조회합니다.
+        board_id를 지정하면 해당 게시판의 게시글만 조회합니다.
+        """
+        query = (
             select(Post)
-            .options(selectinload(Post.author))
+            .options(joinedload(Post.author).load_only(*AUTHOR_INFO_COLUMNS))
             .where(Post.id == post_id)
-            .where(Post.is_deleted == False)  # noqa: E712
         )
+        if board_id is not None:
+            query = query.where(Post.board_id == board_id)
+
+        result = await db.execute(query)
         return result.scalar_one_or_none()
 
     @staticmethod
@@ -230,56 +407,115 @@ class PostService:
         is_notice: Optional[bool] = None,
         page: int = 1,
         page_size: int = DEFAULT_PAGE_SIZE,
-    ) -> tuple[List[Post], int]:
+    ) -> tuple[List[Row], int]:
         """게시글 목록 조회.
 
+        작성자는 이름만 조인하여 컬럼 단위로 조회합니다 (User 전체 로딩 없음).
+
         Returns:
-            (게시글 목록, 전체 개수)
+            (게시글 Row 목록, 전체 개수)
         """
         # 페이지 크기 제한
         page_size = min(page_size, MAX_PAGE_SIZE)
         offset = (page - 1) * page_size
 
-        # 기본 쿼리
-        query = (
-            select(Post)
-            .options(selectinload(Post.author))
-            .where(Post.board_id == board_id)
-            .where(Post.is_deleted == False)  # noqa: E712
-        )
+        # 필터 조건
+        conditions = [
+            Post.board_id == board_id,
+        ]
 
-        # 필터 적용
         if category_id:
-            query = query.where(Post.category_id == category_id)
+            conditions.append(Post.category_id == category_id)
 
         if is_notice is not None:
-            query = query.where(Post.is_notice == is_notice)
+            conditions.append(Post.is_notice == is_notice)
 
         if search_keyword:
-            query = query.where(
+            conditions.append(
                 or_(
                     Post.title.ilike(f"%{search_keyword}%"),
                     Post.content.ilike(f"%{search_keyword}%"),
                 )
             )
 
-        # 전체 개수 조회
-        count_query = select(func.count()).select_from(query.subquery())
+        # 전체 개수 조회 (작성자 조인 불필요)
+        count_query = select(func.count()).select_from(Post).where(*conditions)
         total_result = await db.execute(count_query)
         total = total_result.scalar_one()
 
         # 정렬 및 페이지네이션
-        # 공지사항은 상단 고정, 나머지는 최신순
-        query = query.order_by(
-            Post.is_notice.desc(),
-            Post.created_at.desc(),
-        ).limit(page_size).offset(offset)
+        # 공지 여부를 지정하지 않으면 공지사항 상단 고정, 나머지는 최신순
+        # (is_notice=False 목록은 부분 인덱스 (board_id, created_at DESC)를 사용)
+        order_by = [Post.created_at.desc()]
+        if is_notice is None:
+            order_by.insert(0, Post.is_notice.desc())
+
+        query = (
+            select(*POST_LIST_COLUMNS)
+            .join(User, User.id == Post.author_id)
+            .where(*conditions)
+            .order_by(*order_by)
+            .limit(page_size)
+            .offset(offset)
+        )
 
         result = await db.execute(query)
-        posts = list(result.scalars().all())
+        posts = list(result.all())
 
         return posts, total
 
+    @staticmethod
+    def notices_query(board_id: UUID) -> Select:
+        """상단 고정 공지 조회 쿼리 (ix_posts_board_id_created_at_notices 부분 인덱스)."""
+        return (
+            select(*POST_LIST_COLUMNS)
+            .join(User, User.id == Post.author_id)
+            .where(Post.board_id == board_id)
+            .where(Post.is_notice == True)  # noqa: E712
+            .order_by(Post.created_at.desc())
+            .limit(MAX_PINNED_NOTICES)
+        )
+
+    @staticmethod
+    async def list_notices(
+        db: AsyncSession,
+        board_id: UUID,
+    ) -> List[PostListItem]:
+        """게시판 상단 고정 공지 목록 (캐시 우선).
+
+        페이지네이션 목록과 분리하여 게시판별로 캐시하며,
+        공지 게시글 작성/수정/삭제 시 무효화됩니다.
+        """
+        notices = _notice_cache.get(board_id)
+        if notices is not None:
+            return notices
+
+        result = await db.execute(PostService.notices_query(board_id))
+        notices = [PostListItem.model_validate(row) for row in result.all()]
+        _notice_cache.set(board_id, notices)
+        return notices
+
+    @staticmethod
+    def _invalidate_post_caches(post: Post, was_notice: bool = False) -> None:
+        """게시글 쓰기 후 목록 캐시 무효화."""
+        BoardService.invalidate_board_summaries()
+        if post.is_notice or was_notice:
+            _notice_cache.invalidate(post.board_id)
+
+    @staticmethod
+    def invalidate_list_caches() -> None:
+        """전체 목록 캐시 무효화 (여러 게시판에 걸친 일괄 변경 후)."""
+        BoardService.invalidate_board_summaries()
+        _notice_cache.clear()
+
+    @staticmethod
+    def list_trending_posts(
+        board_id: UUID,
+        limit: int,
+    ) -> List[PostListItem]:
+        """게시판 인기글 목록 (백그라운드에서 미리 계산된 순위)."""
+        return trending_tracker.top(board_id, limit)
+
     @staticmethod
     async def create_post(
         db: AsyncSession,
@@ -287,18 +523,14 @@ class PostService:
         post_data: PostCreate,
         author_id: UUID,
     ) -> Post:
-        """게시글 작성."""
-        # 공지사항은 관리자만
-        if post_data.is_notice:
-            raise BoardException(
-                BoardErrorCode.ACCESS_DENIED,
-                "공지사항은 관리자만 작성할 수 있습니다.",
-            )
+        """게시글 작성.
 
+        공지사항 작성 권한(관리자)은 호출하는 엔드포인트에서 확인합니다.
+        """
         # 비밀글 비밀번호 해싱
         secret_password = None
         if post_data.is_secret and post_data.secret_password:
-            secret_password = bcrypt.hash(post_data.secret_password)
+            secret_password = await get_password_hash_async(post_data.secret_password)
 
         post = Post(
             board_id=board.id,
@@ -313,8 +545,11 @@ class PostService:
             updated_by=author_id,
         )
         db.add(post)
-        await db.commit()
-        await db.refresh(post)
+        await db.flush()
+        # 응답용 작성자 정보 (비동기 세션에서는 지연 로딩 불가)
+        await db.refresh(post, ["author"])
+        after_commit(db, lambda: PostService._invalidate_post_caches(post))
+        after_commit(db, lambda: trending_tracker.add(post))
         return post
 
     @staticmethod
@@ -326,17 +561,21 @@ class PostService:
     ) -> Post:
         """게시글 수정."""
         update_dict = post_data.model_dump(exclude_unset=True)
+        was_notice = post.is_notice
 
         # 비밀글 비밀번호 해싱
         if "secret_password" in update_dict and update_dict["secret_password"]:
-            update_dict["secret_password"] = bcrypt.hash(update_dict["secret_password"])
+            update_dict["secret_password"] = await get_password_hash_async(
+                update_dict["secret_password"]
+            )
 
         for key, value in update_dict.items():
             setattr(post, key, value)
 
         post.updated_by = updater_id
-        await db.commit()
-        await db.refresh(post)
+        await db.flush()
+        after_commit(db, lambda: PostService._invalidate_post_caches(post, was_notice=was_notice))
+        after_commit(db, lambda: trending_tracker.update_post(post))
         return post
 
     @staticmethod
@@ -348,57 +587,74 @@ class PostService:
         """게시글 삭제 (소프트 삭제)."""
         post.is_deleted = True
         post.updated_by = deleter_id
-        await db.commit()
+        await db.flush()
+        after_commit(db, lambda: PostService._invalidate_post_caches(post))
+        after_commit(db, lambda: trending_tracker.remove(post.id))
 
     @staticmethod
-    async def increment_view_count(
-        db: AsyncSession,
-        post: Post,
-    ) -> None:
-        """조회수 증가."""
-        post.view_count += 1
-        await db.commit()
+    def increment_view_count(post: Post) -> int:
+        """조회수 증가 (지연 반영).
+
+        조회 경로에서는 메모리 버퍼에만 기록하고, DB에는 주기적으로 일괄 반영합니다.
+
+        Returns:
+            아직 DB에 반영되지 않은 증가분
+        """
+        return post_view_counter.record(post.id)
 
     @staticmethod
     async def check_secret_post_access(
         post: Post,
-        current_user: Optional[User],
+        current_user: Optional[UserPrincipal],
         password: Optional[str] = None,
-    ) -> bool:
+        grant: Optional[str] = None,
+    ) -> Optional[str]:
         """비밀글 접근 권한 확인.
 
+        열람 권한 토큰(grant)이 유효하면 bcrypt 검증을 생략합니다.
+
         Returns:
-            True: 접근 가능
-            False: 접근 불가
+            비밀번호 확인으로 접근한 경우 새 열람 권한 토큰,
+            그 외(비밀글 아님, 관리자, 작성자, 유효한 열람 권한)에는 None
 
         Raises:
             BoardException: 비밀글 접근 불가
         """
         if not post.is_secret:
-            return True
+            return None
 
         # 관리자는 항상 접근 가능
         if current_user and current_user.role == "admin":
-            return True
+            return None
 
         # 작성자는 항상 접근 가능
         if current_user and post.author_id == current_user.id:
-            return True
+            return None
 
-        # 비밀번호 확인
+        # 열람 권한 토큰 확인 (비밀번호 재검증 생략)
+        if post.secret_password and grant:
+            if verify_secret_post_grant(grant, post.id, post.secret_password):
+                return None
+
+        # 비밀번호 확인 (성공한 경우에만 열람 권한 발급)
         if post.secret_password and password:
-            if bcrypt.verify(password, post.secret_password):
-                return True
+            if await verify_password_async(password, post.secret_password):
+                return create_secret_post_grant(post.id, post.secret_password)
 
         raise BoardException(
             BoardErrorCode.SECRET_POST_ACCESS_DENIED,
             "비밀글은 작성자와 관리자만 볼 수 있습니다.",
         )
 
+    @staticmethod
+    def secret_post_grant_cookie_name(post_id: UUID) -> str:
+        """비밀글 열람 권한 쿠키 이름."""
+        return f"secret_post_{post_id}"
+
     @staticmethod
     def check_post_edit_permission(
         post: Post,
-        current_user: User,
+        current_user: UserPrincipal,
     ) -> None:
         """게시글 수정/삭제 권한 확인.
 
@@ -430,7 +686,6 @@ class CommentService:
             select(Comment)
             .options(selectinload(Comment.author))
             .where(Comment.id == comment_id)
-            .where(Comment.is_deleted == False)  # noqa: E712
         )
         return result.scalar_one_or_none()
 
@@ -439,19 +694,26 @@ class CommentService:
         db: AsyncSession,
         post_id: UUID,
     ) -> List[Comment]:
-        """댓글 목록 조회 (대댓글 포함)."""
+        """댓글 목록 조회 (대댓글 포함).
+
+        게시글의 댓글을 한 번에 조회해 답글 트리를 구성합니다. 답글의 답글까지
+        replies가 채워지므로 응답 직렬화 중 지연 로딩이 일어나지 않습니다.
+        """
         result = await db.execute(
             select(Comment)
-            .options(
-                selectinload(Comment.author),
-                selectinload(Comment.replies).selectinload(Comment.author),
-            )
+            .options(joinedload(Comment.author).load_only(*AUTHOR_INFO_COLUMNS))
             .where(Comment.post_id == post_id)
-            .where(Comment.is_deleted == False)  # noqa: E712
-            .where(Comment.parent_id == None)  # noqa: E711 (최상위 댓글만)
             .order_by(Comment.created_at.asc())
         )
-        return list(result.scalars().all())
+        comments = list(result.scalars().all())
+
+        replies: dict[UUID, List[Comment]] = {}
+        for comment in comments:
+            if comment.parent_id is not None:
+                replies.setdefault(comment.parent_id, []).append(comment)
+        for comment in comments:
+            set_committed_value(comment, "replies", replies.get(comment.id, []))
+        return [comment for comment in comments if comment.parent_id is None]
 
     @staticmethod
     async def create_comment(
@@ -475,8 +737,11 @@ class CommentService:
         # 게시글 댓글 수 증가
         post.comment_count += 1
 
-        await db.commit()
-        await db.refresh(comment)
+        await db.flush()
+        # 응답용 작성자 (비동기 세션에서는 지연 로딩 불가). 새 댓글의 답글은 항상 비어 있음
+        set_committed_value(comment, "replies", [])
+        await db.refresh(comment, ["author"])
+        after_commit(db, lambda: trending_tracker.apply_delta(post.id, comments=1))
         return comment
 
     @staticmethod
@@ -494,12 +759,13 @@ class CommentService:
         if post.comment_count > 0:
             post.comment_count -= 1
 
-        await db.commit()
+        await db.flush()
+        after_commit(db, lambda: trending_tracker.apply_delta(post.id, comments=-1))
 
     @staticmethod
     def check_comment_edit_permission(
         comment: Comment,
-        current_user: User,
+        current_user: UserPrincipal,
     ) -> None:
         """댓글 수정/삭제 권한 확인.
 
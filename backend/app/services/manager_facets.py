@@ -0,0 +1,192 @@
+"""매니저 검색 패싯(지역/자격증/유형별 활성 매니저 수) 인덱스."""
+import asyncio
+import logging
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import select
+
+from app.db.session import async_session_maker
+from app.models.manager import Manager, ManagerStatus
+from app.schemas.manager import ManagerFacetCounts
+
+logger = logging.getLogger(__name__)
+
+# 전문매니저 기준 완료 서비스 수 (미만이면 신규매니저)
+EXPERT_MIN_SERVICES = 6
+
+_FACET_COLUMNS = (
+    Manager.id,
+    Manager.status,
+    Manager.is_deleted,
+    Manager.available_areas,
+    Manager.certifications,
+    Manager.total_services,
+    Manager.is_volunteer,
+)
+
+
+def manager_types(total_services: int, is_volunteer: bool) -> tuple[str, ...]:
+    """매니저 유형 (manager_type 필터 값: expert, new, volunteer)."""
+    types = ("expert",) if total_services >= EXPERT_MIN_SERVICES else ("new",)
+    return (*types, "volunteer") if is_volunteer else types
+
+
+class ManagerFacetIndex:
+    """활성 매니저 패싯 카운트 인덱스.
+
+    활성 매니저마다 슬롯 번호를 배정하고, 지역/자격증/유형 값마다 해당 매니저
+    슬롯 비트를 켠 비트셋(int)을 둡니다. 검색 조건 비트셋을 AND한 뒤 값별
+    비트셋과 AND해 비트 수를 세므로, 검색마다 GROUP BY 쿼리 없이 메모리에서
+    계산합니다. 매니저 등록/수정/상태 변경은 커밋 후 바로 반영합니다.
+
+    워커 프로세스마다 독립적이므로 다른 워커의 변경과 DB에서 직접 바뀐 값
+    (완료 서비스 수 등)은 주기적인 재적재(reseed)로 반영됩니다.
+    """
+
+    def __init__(self) -> None:
+        self._loaded = False
+        # 재적재 중 반영된 변경 (적재 결과에 다시 적용)
+        self._reseed_updates: Optional[list[Manager]] = None
+        self._all = 0
+        self._slots: dict[UUID, int] = {}
+        self._free_slots: list[int] = []
+        # 매니저별 (지역, 자격증, 유형) - 제외 시 비트를 끌 값
+        self._values: dict[UUID, tuple[tuple[str, ...], tuple[str, ...], tuple[str, ...]]] = {}
+        self._areas: dict[str, int] = {}
+        self._certifications: dict[str, int] = {}
+        self._types: dict[str, int] = {}
+
+    def _add(
+        self,
+        manager_id: UUID,
+        areas: tuple[str, ...],
+        certifications: tuple[str, ...],
+        types: tuple[str, ...],
+    ) -> None:
+        slot = self._free_slots.pop() if self._free_slots else len(self._slots)
+        bit = 1 << slot
+        self._slots[manager_id] = slot
+        self._values[manager_id] = (areas, certifications, types)
+        self._all |= bit
+        for bitsets, values in (
+            (self._areas, areas),
+            (self._certifications, certifications),
+            (self._types, types),
+        ):
+            for value in values:
+                bitsets[value] = bitsets.get(value, 0) | bit
+
+    def remove(self, manager_id: UUID) -> None:
+        """매니저 제외 (없으면 무시)."""
+        slot = self._slots.pop(manager_id, None)
+        if slot is None:
+            return
+
+        mask = ~(1 << slot)
+        self._all &= mask
+        areas, certifications, types = self._values.pop(manager_id)
+        for bitsets, values in (
+            (self._areas, areas),
+            (self._certifications, certifications),
+            (self._types, types),
+        ):
+            for value in values:
+                bits = bitsets[value] & mask
+                if bits:
+                    bitsets[value] = bits
+                else:
+                    del bitsets[value]
+        self._free_slots.append(slot)
+
+    def update(self, manager: Manager) -> None:
+        """매니저 등록/수정/상태 변경 반영 (활성 매니저만 집계)."""
+        if self._reseed_updates is not None:
+            self._reseed_updates.append(manager)
+        self.remove(manager.id)
+        if manager.status != ManagerStatus.ACTIVE.value or manager.is_deleted:
+            return
+
+        self._add(
+            manager.id,
+            tuple(set(manager.available_areas or [])),
+            tuple(set(manager.certifications or [])),
+            manager_types(manager.total_services, manager.is_volunteer),
+        )
+
+    @staticmethod
+    def _count(bitsets: dict[str, int], mask: int) -> dict[str, int]:
+        counts = {value: (bits & mask).bit_count() for value, bits in bitsets.items()}
+        return dict(sorted(((v, c) for v, c in counts.items() if c), key=lambda item: -item[1]))
+
+    def counts(
+        self,
+        area: Optional[str] = None,
+        certification: Optional[str] = None,
+        manager_type: Optional[str] = None,
+    ) -> Optional[ManagerFacetCounts]:
+        """검색 조건에 맞는 활성 매니저 수와 패싯 값별 매니저 수.
+
+        패싯별 카운트에는 해당 패싯 자신의 조건을 적용하지 않으므로 (예: 지역을
+        선택해도 다른 지역 수가 표시됨) 다른 값으로 바꿨을 때의 결과 수가 됩니다.
+
+        Returns:
+            패싯 카운트 (아직 적재 전이면 None)
+        """
+        if not self._loaded:
+            return None
+
+        area_mask = self._areas.get(area, 0) if area else self._all
+        certification_mask = (
+            self._certifications.get(certification, 0) if certification else self._all
+        )
+        type_mask = self._types.get(manager_type, 0) if manager_type else self._all
+
+        return ManagerFacetCounts(
+            total=(area_mask & certification_mask & type_mask).bit_count(),
+            areas=self._count(self._areas, certification_mask & type_mask),
+            certifications=self._count(self._certifications, area_mask & type_mask),
+            types=self._count(self._types, area_mask & certification_mask),
+        )
+
+    async def reseed(self) -> int:
+        """활성 매니저를 DB에서 다시 적재.
+
+        Returns:
+            적재된 매니저 수
+        """
+        self._reseed_updates = []
+        try:
+            async with async_session_maker() as session:
+                result = await session.execute(
+                    select(*_FACET_COLUMNS).where(Manager.status == ManagerStatus.ACTIVE.value)
+                )
+                rows = result.all()
+
+            index = ManagerFacetIndex()
+            for row in [*rows, *self._reseed_updates]:
+                index.update(row)
+        finally:
+            self._reseed_updates = None
+
+        self._all = index._all
+        self._slots = index._slots
+        self._free_slots = index._free_slots
+        self._values = index._values
+        self._areas = index._areas
+        self._certifications = index._certifications
+        self._types = index._types
+        self._loaded = True
+        return len(self._slots)
+
+    async def run_periodic_reseed(self, interval_seconds: float) -> None:
+        """주기적 재적재 루프 (lifespan에서 실행, 시작 시 1회 즉시 실행)."""
+        while True:
+            try:
+                await self.reseed()
+            except Exception:
+                logger.exception("매니저 패싯 인덱스 적재 실패")
+            await asyncio.sleep(interval_seconds)
+
+
+manager_facet_index = ManagerFacetIndex()
@@ -0,0 +1,261 @@
+"""매니저 리뷰 집계(리뷰 수, 평점 합계/분포) 관리 서비스."""
+import asyncio
+import logging
+from typing import Any, Optional
+from uuid import UUID
+
+from sqlalchemy import Numeric, and_, case, cast, func, or_, select, text, update
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from app.db.session import engine
+from app.models.manager import Manager
+from app.models.review import Review
+from app.schemas.review import ReviewStats
+
+logger = logging.getLogger(__name__)
+
+_managers = Manager.__table__
+_reviews = Review.__table__
+
+RATING_VALUES = (1, 2, 3, 4, 5)
+# 여러 워커 중 하나만 실행 (pg_try_advisory_lock 키)
+RECONCILE_LOCK_KEY = 4_402_202_611
+# 재계산 트랜잭션 하나에서 잠그는 매니저 수
+RECONCILE_BATCH_SIZE = 1000
+
+
+def average_rating(aggregates: Any) -> float:
+    """집계 컬럼(rating_sum, reviews_count)의 평균 평점 (리뷰가 없으면 0)."""
+    return aggregates.rating_sum / aggregates.reviews_count if aggregates.reviews_count else 0.0
+
+
+def build_review_stats(aggregates: Any) -> ReviewStats:
+    """매니저 집계 컬럼(Manager 또는 같은 이름의 컬럼을 가진 Row)으로 리뷰 통계 생성."""
+    return ReviewStats(
+        total_reviews=aggregates.reviews_count,
+        average_rating=average_rating(aggregates),
+        rating_distribution={
+            rating: getattr(aggregates, f"rating_{rating}_count") for rating in RATING_VALUES
+        },
+    )
+
+
+_EMPTY_STATS = ReviewStats(
+    total_reviews=0,
+    average_rating=0.0,
+    rating_distribution=dict.fromkeys(RATING_VALUES, 0),
+)
+
+# 일괄 통계 조회 컬럼
+_stats_columns = (
+    Manager.user_id,
+    Manager.reviews_count,
+    Manager.rating_sum,
+    Manager.rating_1_count,
+    Manager.rating_2_count,
+    Manager.rating_3_count,
+    Manager.rating_4_count,
+    Manager.rating_5_count,
+)
+
+
+def _histogram_column(rating: int):
+    return _managers.c[f"rating_{rating}_count"]
+
+
+def _rounded_average(rating_sum, reviews_count):
+    """반올림한 평균 평점 SQL 식 (리뷰가 없으면 0)."""
+    return case(
+        (reviews_count > 0, func.round(cast(rating_sum, Numeric) / reviews_count, 1)),
+        else_=0,
+    )
+
+
+def review_stats_query(manager_ids: list[UUID]):
+    """매니저별 리뷰 집계를 reviews에서 계산하는 쿼리 (리뷰가 없는 매니저도 포함)."""
+    reviews_count = func.count(_reviews.c.id)
+    rating_sum = func.coalesce(func.sum(_reviews.c.rating), 0)
+    return (
+        select(
+            _managers.c.id,
+            reviews_count.label("reviews_count"),
+            rating_sum.label("rating_sum"),
+            *[
+                func.count(_reviews.c.id).filter(_reviews.c.rating == rating).label(f"rating_{rating}_count")
+                for rating in RATING_VALUES
+            ],
+            _rounded_average(rating_sum, reviews_count).label("rating"),
+        )
+        .select_from(
+            _managers.outerjoin(
+                _reviews,
+                and_(
+                    _reviews.c.manager_id == _managers.c.user_id,
+                    _reviews.c.is_deleted == False,  # noqa: E712
+                ),
+            )
+        )
+        .where(_managers.c.id.in_(manager_ids))
+        .group_by(_managers.c.id)
+    )
+
+
+_AGGREGATE_COLUMNS = (
+    "reviews_count",
+    "rating_sum",
+    *[f"rating_{rating}_count" for rating in RATING_VALUES],
+    "rating",
+)
+
+
+class ManagerRatingStats:
+    """매니저 리뷰 집계.
+
+    상세/목록 조회가 reviews를 매번 집계하지 않도록 managers에 리뷰 수, 평점 합계,
+    평점별 리뷰 수를 두고 리뷰가 바뀔 때 증감만 반영합니다. 반영 누락(직접 수정한
+    데이터 등)은 주기적 재계산으로 바로잡습니다.
+    """
+
+    @staticmethod
+    async def get_review_stats(
+        db: AsyncSession,
+        manager_user_ids: list[UUID],
+    ) -> dict[UUID, ReviewStats]:
+        """여러 매니저의 리뷰 통계를 쿼리 한 번으로 조회 (매니저 집계 컬럼 사용).
+
+        Args:
+            manager_user_ids: 매니저 사용자 ID 목록 (리뷰의 manager_id)
+
+        Returns:
+            요청한 ID별 통계 (요청 순서, 중복 제거, 매니저가 없으면 0)
+        """
+        stats = dict.fromkeys(manager_user_ids, _EMPTY_STATS)
+        if not stats:
+            return stats
+
+        # 삭제된 매니저도 리뷰는 남아 있으므로 함께 조회
+        result = await db.execute(
+            select(*_stats_columns)
+            .where(Manager.user_id.in_(list(stats)))
+            .execution_options(include_deleted=True)
+        )
+        for row in result.all():
+            stats[row.user_id] = build_review_stats(row)
+        return stats
+
+    @staticmethod
+    async def apply_review(
+        db: AsyncSession,
+        manager_user_id: UUID,
+        added: Optional[int] = None,
+        removed: Optional[int] = None,
+    ) -> None:
+        """리뷰 평점 추가/제거를 매니저 집계에 반영 (리뷰 변경과 같은 트랜잭션에서 호출).
+
+        증감을 UPDATE 한 번으로 반영하므로 같은 매니저에 리뷰가 동시에 작성되어도
+        행 잠금으로 직렬화되어 집계가 어긋나지 않습니다. 평점 수정은 이전 평점을
+        removed, 새 평점을 added로 전달합니다.
+
+        Args:
+            manager_user_id: 리뷰의 manager_id (매니저 사용자 ID)
+            added: 추가된 평점 (1~5)
+            removed: 제거된 평점 (1~5)
+        """
+        added = int(added) if added is not None else None
+        removed = int(removed) if removed is not None else None
+        if added == removed:
+            return
+
+        count_delta = int(added is not None) - int(removed is not None)
+        reviews_count = _managers.c.reviews_count + count_delta
+        rating_sum = _managers.c.rating_sum + ((added or 0) - (removed or 0))
+        values = {
+            "reviews_count": reviews_count,
+            "rating_sum": rating_sum,
+            "rating": _rounded_average(rating_sum, reviews_count),
+        }
+        if added is not None:
+            values[f"rating_{added}_count"] = _histogram_column(added) + 1
+        if removed is not None:
+            values[f"rating_{removed}_count"] = _histogram_column(removed) - 1
+
+        await db.execute(
+            update(_managers).where(_managers.c.user_id == manager_user_id).values(**values)
+        )
+
+    @staticmethod
+    async def reconcile_batch(
+        conn: AsyncConnection,
+        after_id: Optional[UUID],
+        limit: int,
+    ) -> tuple[Optional[UUID], int]:
+        """매니저 ID 순으로 limit명을 잠그고 reviews에서 다시 계산해 다른 값만 갱신.
+
+        매니저 행을 먼저 잠그므로 이미 집계를 갱신한 리뷰 트랜잭션은 커밋될 때까지
+        기다렸다가 반영하고, 이후 트랜잭션의 증감은 재계산 결과 위에 더해집니다.
+
+        Returns:
+            (마지막 매니저 ID (없으면 None), 수정된 매니저 수)
+        """
+        query = select(_managers.c.id).order_by(_managers.c.id).limit(limit).with_for_update()
+        if after_id is not None:
+            query = query.where(_managers.c.id > after_id)
+        manager_ids = list((await conn.execute(query)).scalars().all())
+        if not manager_ids:
+            return None, 0
+
+        stats = review_stats_query(manager_ids).subquery()
+        result = await conn.execute(
+            update(_managers)
+            .where(
+                _managers.c.id == stats.c.id,
+                or_(*[_managers.c[name] != stats.c[name] for name in _AGGREGATE_COLUMNS]),
+            )
+            .values({name: stats.c[name] for name in _AGGREGATE_COLUMNS})
+        )
+        return manager_ids[-1], result.rowcount
+
+    async def reconcile(self, batch_size: int = RECONCILE_BATCH_SIZE) -> Optional[int]:
+        """전체 매니저 집계 재계산 (배치마다 트랜잭션 하나).
+
+        Returns:
+            수정된 매니저 수 (다른 워커가 실행 중이면 None)
+        """
+        # 세션 수준 advisory lock은 배치 트랜잭션들과 같은 커넥션에서 잡고 풂
+        async with engine.connect() as conn:
+            async with conn.begin():
+                locked = (
+                    await conn.execute(
+                        text("SELECT pg_try_advisory_lock(:key)"), {"key": RECONCILE_LOCK_KEY}
+                    )
+                ).scalar()
+            if not locked:
+                return None
+            try:
+                fixed = 0
+                after_id = None
+                while True:
+                    async with conn.begin():
+                        after_id, count = await self.reconcile_batch(conn, after_id, batch_size)
+                    fixed += count
+                    if after_id is None:
+                        return fixed
+            finally:
+                async with conn.begin():
+                    await conn.execute(
+                        text("SELECT pg_advisory_unlock(:key)"), {"key": RECONCILE_LOCK_KEY}
+                    )
+
+    async def run_periodic_reconcile(self, interval_seconds: float) -> None:
+        """주기적 재계산 루프 (lifespan에서 실행)."""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                fixed = await self.reconcile()
+                if fixed:
+                    logger.warning("매니저 리뷰 집계 불일치 수정: %d명", fixed)
+            except Exception:
+                logger.exception("매니저 리뷰 집계 재계산 실패")
+
+
+manager_rating_stats = ManagerRatingStats()
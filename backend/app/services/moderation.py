@@ -0,0 +1,372 @@
+"""게시글/댓글 일괄 관리 서비스."""
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import ColumnElement, and_, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.board_constants import (
+    BULK_MODERATION_BATCH_SIZE,
+    MODERATION_JOB_STALE_SECONDS,
+    TRENDING_WINDOW_DAYS,
+    BoardErrorCode,
+    ModerationAction,
+    ModerationJobStatus,
+    ModerationTarget,
+)
+from app.core.board_exceptions import BoardException
+from app.db.session import after_commit, async_session_maker
+from app.models.board import BoardCategory, Comment, ModerationJob, Post
+from app.models.user import User
+from app.schemas.board import BulkModerationRequest, ModerationJobResponse, PostListItem
+from app.services.board import POST_LIST_COLUMNS, PostService
+from app.services.trending import trending_tracker
+
+logger = logging.getLogger(__name__)
+
+_posts = Post.__table__
+_comments = Comment.__table__
+
+
+class ModerationService:
+    """일괄 관리 서비스.
+
+    대상 선택 조건마다 집합 단위 UPDATE 한 번으로 처리합니다.
+    """
+
+    @staticmethod
+    async def moderate_posts(
+        db: AsyncSession,
+        action: ModerationAction,
+        condition: ColumnElement[bool],
+        moderator_id: UUID,
+        category: Optional[BoardCategory] = None,
+    ) -> list[UUID]:
+        """게시글 일괄 삭제/복구/분류 이동.
+
+        Returns:
+            변경된 게시글 ID 목록
+        """
+        stmt = update(_posts).where(condition)
+
+        if action == ModerationAction.DELETE:
+            stmt = stmt.where(_posts.c.is_deleted == False).values(is_deleted=True)  # noqa: E712
+        elif action == ModerationAction.RESTORE:
+            stmt = stmt.where(_posts.c.is_deleted == True).values(is_deleted=False)  # noqa: E712
+        else:
+            # 분류 이동은 같은 게시판의 게시글에만 적용
+            stmt = (
+                stmt.where(_posts.c.board_id == category.board_id)
+                .where(_posts.c.is_deleted == False)  # noqa: E712
+                .values(category_id=category.id)
+            )
+
+        result = await db.execute(
+            stmt.values(updated_by=moderator_id).returning(_posts.c.id)
+        )
+        return list(result.scalars().all())
+
+    @staticmethod
+    async def moderate_comments(
+        db: AsyncSession,
+        action: ModerationAction,
+        condition: ColumnElement[bool],
+        moderator_id: UUID,
+    ) -> int:
+        """댓글 일괄 삭제/복구.
+
+        댓글 UPDATE를 CTE로 묶어, 변경된 댓글 수만큼 게시글 comment_count를
+        같은 SQL 문에서 보정합니다.
+
+        Returns:
+            변경된 댓글 수
+        """
+        is_delete = action == ModerationAction.DELETE
+        changed = (
+            update(_comments)
+            .where(condition)
+            .where(_comments.c.is_deleted == (not is_delete))
+            .values(is_deleted=is_delete, updated_by=moderator_id)
+            .returning(_comments.c.post_id)
+            .cte("changed_comments")
+        )
+        counts = (
+            select(changed.c.post_id, func.count().label("cnt"))
+            .group_by(changed.c.post_id)
+            .subquery("changed_counts")
+        )
+        delta = -counts.c.cnt if is_delete else counts.c.cnt
+        stmt = (
+            update(_posts)
+            .where(_posts.c.id == counts.c.post_id)
+            .values(comment_count=func.greatest(_posts.c.comment_count + delta, 0))
+            .returning(counts.c.cnt)
+        )
+        result = await db.execute(stmt)
+        return sum(result.scalars().all())
+
+    @staticmethod
+    async def apply(
+        db: AsyncSession,
+        request: BulkModerationRequest,
+        condition: ColumnElement[bool],
+        moderator_id: UUID,
+        category: Optional[BoardCategory] = None,
+    ) -> int:
+        """요청 대상에 일괄 관리 작업 적용.
+
+        Returns:
+            변경된 대상 수
+        """
+        if request.target == ModerationTarget.COMMENT:
+            return await ModerationService.moderate_comments(
+                db, request.action, condition, moderator_id
+            )
+
+        post_ids = await ModerationService.moderate_posts(
+            db, request.action, condition, moderator_id, category
+        )
+        if request.action == ModerationAction.DELETE:
+            after_commit(db, lambda: ModerationService._untrack_posts(post_ids))
+        elif request.action == ModerationAction.RESTORE:
+            await ModerationService._track_restored_posts(db, post_ids)
+        return len(post_ids)
+
+    @staticmethod
+    def _untrack_posts(post_ids: list[UUID]) -> None:
+        for post_id in post_ids:
+            trending_tracker.remove(post_id)
+
+    @staticmethod
+    async def _track_restored_posts(db: AsyncSession, post_ids: list[UUID]) -> None:
+        """복구된 게시글을 커밋 후 인기글 집계에 다시 추가 (집계 기간 내 일반글만)."""
+        if not post_ids:
+            return
+
+        window_start = datetime.now(timezone.utc) - timedelta(days=TRENDING_WINDOW_DAYS)
+        result = await db.execute(
+            select(*POST_LIST_COLUMNS)
+            .join(User, User.id == Post.author_id)
+            .where(Post.id.in_(post_ids))
+            .where(Post.is_notice == False)  # noqa: E712
+            .where(Post.created_at >= window_start)
+        )
+        items = [PostListItem.model_validate(row) for row in result.all()]
+
+        def track() -> None:
+            for item in items:
+                trending_tracker.add(item)
+
+        after_commit(db, track)
+
+    @staticmethod
+    async def get_category(
+        db: AsyncSession,
+        category_id: UUID,
+    ) -> BoardCategory:
+        """이동 대상 분류 조회."""
+        result = await db.execute(
+            select(BoardCategory)
+            .where(BoardCategory.id == category_id)
+        )
+        category = result.scalar_one_or_none()
+        if not category:
+            raise BoardException(
+                BoardErrorCode.CATEGORY_NOT_FOUND,
+                "분류를 찾을 수 없습니다.",
+                404,
+            )
+        return category
+
+    @staticmethod
+    async def moderate_by_ids(
+        db: AsyncSession,
+        request: BulkModerationRequest,
+        moderator_id: UUID,
+    ) -> ModerationJobResponse:
+        """ID 목록 일괄 관리 (단일 UPDATE, 요청 트랜잭션 내 처리)."""
+        category = None
+        if request.action == ModerationAction.MOVE:
+            category = await ModerationService.get_category(db, request.category_id)
+
+        table = _comments if request.target == ModerationTarget.COMMENT else _posts
+        affected = await ModerationService.apply(
+            db, request, table.c.id.in_(request.ids), moderator_id, category
+        )
+        after_commit(db, PostService.invalidate_list_caches)
+
+        return ModerationJobResponse(
+            target=request.target,
+            action=request.action,
+            status=ModerationJobStatus.COMPLETED,
+            processed=len(request.ids),
+            affected=affected,
+        )
+
+
+# 이 프로세스에서 실행 중인 작업 (태스크 참조 유지, 중복 실행 방지)
+_running_jobs: dict[UUID, asyncio.Task] = {}
+
+
+def moderation_job_response(job: ModerationJob) -> ModerationJobResponse:
+    """작업 상태 응답 변환."""
+    return ModerationJobResponse(
+        job_id=job.id,
+        target=job.target,
+        action=job.action,
+        status=job.status,
+        processed=job.processed,
+        affected=job.affected,
+        error=job.error,
+    )
+
+
+async def _next_batch(session: AsyncSession, job: ModerationJob) -> list[UUID]:
+    """다음 배치 대상 ID 조회 (키셋 페이지네이션)."""
+    table = _comments if job.target == ModerationTarget.COMMENT else _posts
+    query = (
+        select(table.c.id)
+        .where(table.c.author_id == job.author_id)
+        .order_by(table.c.id)
+        .limit(BULK_MODERATION_BATCH_SIZE)
+    )
+    if job.last_id is not None:
+        query = query.where(table.c.id > job.last_id)
+
+    result = await session.execute(query)
+    return list(result.scalars().all())
+
+
+async def _run_moderation_job(job_id: UUID) -> None:
+    """작업 실행 (배치마다 대상 변경과 진행 위치를 함께 커밋)."""
+    try:
+        category = None
+        while True:
+            async with async_session_maker() as session:
+                job = await session.get(ModerationJob, job_id)
+                request = BulkModerationRequest(
+                    target=job.target,
+                    action=job.action,
+                    author_id=job.author_id,
+                    category_id=job.category_id,
+                )
+                if request.action == ModerationAction.MOVE and category is None:
+                    category = await ModerationService.get_category(session, job.category_id)
+
+                batch = await _next_batch(session, job)
+                if not batch:
+                    job.status = ModerationJobStatus.COMPLETED.value
+                    await session.commit()
+                    break
+
+                table = _comments if request.target == ModerationTarget.COMMENT else _posts
+                affected = await ModerationService.apply(
+                    session,
+                    request,
+                    table.c.id.in_(batch),
+                    job.updated_by,
+                    category,
+                )
+                job.last_id = batch[-1]
+                job.processed += len(batch)
+                job.affected += affected
+                await session.commit()
+    except Exception as exc:
+        logger.exception("일괄 관리 작업 실패 (job_id=%s)", job_id)
+        try:
+            async with async_session_maker() as session:
+                await session.execute(
+                    update(ModerationJob)
+                    .where(ModerationJob.id == job_id)
+                    .values(status=ModerationJobStatus.FAILED.value, error=str(exc))
+                )
+                await session.commit()
+        except Exception:
+            logger.exception("일괄 관리 작업 실패 기록 실패 (job_id=%s)", job_id)
+    finally:
+        _running_jobs.pop(job_id, None)
+        PostService.invalidate_list_caches()
+
+
+def _spawn_moderation_job(job_id: UUID) -> None:
+    _running_jobs[job_id] = asyncio.create_task(_run_moderation_job(job_id))
+
+
+async def start_moderation_job(
+    db: AsyncSession,
+    request: BulkModerationRequest,
+    moderator_id: UUID,
+) -> ModerationJob:
+    """작성자 단위 일괄 관리 작업 등록 (요청이 커밋된 뒤 이 프로세스에서 실행)."""
+    job = ModerationJob(
+        target=request.target.value,
+        action=request.action.value,
+        author_id=request.author_id,
+        category_id=request.category_id,
+        status=ModerationJobStatus.RUNNING.value,
+        created_by=moderator_id,
+        updated_by=moderator_id,
+    )
+    db.add(job)
+    await db.flush()
+    after_commit(db, lambda: _spawn_moderation_job(job.id))
+    return job
+
+
+async def get_moderation_job(db: AsyncSession, job_id: UUID) -> ModerationJob:
+    """일괄 관리 작업 조회."""
+    job = await db.get(ModerationJob, job_id)
+    if not job:
+        raise BoardException(
+            BoardErrorCode.MODERATION_JOB_NOT_FOUND,
+            "일괄 관리 작업을 찾을 수 없습니다.",
+            404,
+        )
+    return job
+
+
+async def resume_moderation_job(
+    db: AsyncSession,
+    job_id: UUID,
+    moderator_id: UUID,
+) -> ModerationJob:
+    """실패하거나 중단된 일괄 관리 작업을 마지막 처리 위치부터 재개.
+
+    실행 중(running)이지만 MODERATION_JOB_STALE_SECONDS 동안 진행이 없는 작업은
+    실행하던 프로세스가 종료된 것으로 보고 재개합니다. 여러 워커가 동시에 재개하지
+    않도록 상태 조건을 건 UPDATE로 작업을 선점합니다.
+    """
+    job = await get_moderation_job(db, job_id)
+
+    stale_before = datetime.now(timezone.utc) - timedelta(seconds=MODERATION_JOB_STALE_SECONDS)
+    claimed = None
+    if job_id not in _running_jobs:
+        result = await db.execute(
+            update(ModerationJob)
+            .where(ModerationJob.id == job_id)
+            .where(
+                or_(
+                    ModerationJob.status == ModerationJobStatus.FAILED.value,
+                    and_(
+                        ModerationJob.status == ModerationJobStatus.RUNNING.value,
+                        ModerationJob.updated_at < stale_before,
+                    ),
+                )
+            )
+            .values(status=ModerationJobStatus.RUNNING.value, error=None, updated_by=moderator_id)
+            .returning(ModerationJob.id)
+        )
+        claimed = result.scalar_one_or_none()
+
+    if claimed is None:
+        raise BoardException(
+            BoardErrorCode.MODERATION_JOB_NOT_RESUMABLE,
+            "실패했거나 중단된 작업만 재개할 수 있습니다.",
+        )
+
+    await db.refresh(job)
+    after_commit(db, lambda: _spawn_moderation_job(job_id))
+    return job
@@ -0,0 +1,215 @@
+"""예약/결제 월별 파티션 관리 서비스."""
+import asyncio
+import logging
+from datetime import date
+from typing import Optional
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.db.session import engine
+from app.models.reservation import ReservationStatus
+
+logger = logging.getLogger(__name__)
+
+# 결제 파티션이 같은 월의 예약 파티션을 참조하므로 결제부터 분리/보관
+PARTITIONED_TABLES = ("payments", "reservations")
+# 여러 워커 중 하나만 실행 (pg_try_advisory_xact_lock 키)
+MAINTENANCE_LOCK_KEY = 4_402_202_610
+# 보관 테이블 한 행에 묶을 원본 행 수 (JSONB 값 크기 제한, 묶음 단위 압축)
+ARCHIVE_CHUNK_SIZE = 1000
+
+# 진행 중인 예약이 남아 있는 월은 보관하지 않음
+_OPEN_STATUSES = (
+    ReservationStatus.PENDING.value,
+    ReservationStatus.CONFIRMED.value,
+    ReservationStatus.IN_PROGRESS.value,
+)
+
+_partitions_query = text(
+    "SELECT child.relname FROM pg_inherits "
+    "JOIN pg_class AS child ON child.oid = pg_inherits.inhrelid "
+    "WHERE pg_inherits.inhparent = CAST(:parent AS regclass)"
+)
+
+
+def month_start(value: date) -> date:
+    return value.replace(day=1)
+
+
+def add_months(value: date, months: int) -> date:
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    """월별 파티션 테이블 이름 (예: reservations_p202610)."""
+    return f"{table}_p{month:%Y%m}"
+
+
+def partition_month(table: str, name: str) -> Optional[date]:
+    """월별 파티션 이름의 월 (DEFAULT 파티션 등은 None)."""
+    suffix = name.removeprefix(f"{table}_p")
+    if suffix == name or len(suffix) != 6 or not suffix.isdigit():
+        return None
+    return date(int(suffix[:4]), int(suffix[4:]), 1)
+
+
+class PartitionMaintenance:
+    """예약/결제 월별 파티션 생성과 보관.
+
+    reservations/payments는 scheduled_date 기준 월별 RANGE 파티션입니다.
+    앞으로 쓸 월의 파티션을 미리 만들어 DEFAULT 파티션에 행이 쌓이지 않게 하고,
+    보관 기간이 지나고 진행 중인 예약이 없는 월의 파티션은 분리(DETACH)해
+    partition_archives에 JSONB로 옮긴 뒤 삭제합니다.
+    """
+
+    @staticmethod
+    async def _partitions(conn: AsyncConnection, table: str) -> set[str]:
+        result = await conn.execute(_partitions_query, {"parent": table})
+        return set(result.scalars().all())
+
+    @staticmethod
+    async def _try_lock(conn: AsyncConnection) -> bool:
+        result = await conn.execute(
+            text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": MAINTENANCE_LOCK_KEY}
+        )
+        return bool(result.scalar())
+
+    @staticmethod
+    async def create_partitions(
+        conn: AsyncConnection,
+        first_month: date,
+        last_month: date,
+    ) -> list[str]:
+        """first_month부터 last_month까지 없는 월별 파티션 생성.
+
+        DEFAULT 파티션에 이미 해당 월의 행이 있으면 생성이 실패하므로
+        경고만 남기고 건너뜁니다.
+
+        Returns:
+            생성된 파티션 이름 목록
+        """
+        created = []
+        for table in PARTITIONED_TABLES:
+            existing = await PartitionMaintenance._partitions(conn, table)
+            month = month_start(first_month)
+            while month <= last_month:
+                name = partition_name(table, month)
+                next_month = add_months(month, 1)
+                if name not in existing:
+                    try:
+                        async with conn.begin_nested():
+                            await conn.execute(
+                                text(
+                                    f"CREATE TABLE {name} PARTITION OF {table} "
+                                    f"FOR VALUES FROM ('{month.isoformat()}') "
+                                    f"TO ('{next_month.isoformat()}')"
+                                )
+                            )
+                        created.append(name)
+                    except DBAPIError:
+                        logger.warning("파티션 생성 실패 (DEFAULT 파티션에 같은 월 행 존재?): %s", name)
+                month = next_month
+        return created
+
+    @staticmethod
+    async def ensure_partitions(
+        conn: AsyncConnection,
+        months_ahead: int,
+        today: Optional[date] = None,
+    ) -> list[str]:
+        """현재 월부터 months_ahead개월 뒤까지 없는 파티션 생성."""
+        current = month_start(today or date.today())
+        return await PartitionMaintenance.create_partitions(
+            conn, current, add_months(current, months_ahead)
+        )
+
+    @staticmethod
+    async def archivable_months(
+        conn: AsyncConnection,
+        retention_months: int,
+        today: Optional[date] = None,
+    ) -> list[date]:
+        """보관 기간이 지났고 진행 중인 예약이 없는 월 (오래된 순)."""
+        cutoff = add_months(month_start(today or date.today()), -retention_months)
+        months = []
+        for name in await PartitionMaintenance._partitions(conn, "reservations"):
+            month = partition_month("reservations", name)
+            if month is None or month >= cutoff:
+                continue
+            result = await conn.execute(
+                text(f"SELECT EXISTS (SELECT 1 FROM {name} WHERE status IN :statuses)").bindparams(
+                    bindparam("statuses", expanding=True)
+                ),
+                {"statuses": list(_OPEN_STATUSES)},
+            )
+            if result.scalar():
+                logger.warning("진행 중인 예약이 남아 있어 보관하지 않음: %s", name)
+                continue
+            months.append(month)
+        return sorted(months)
+
+    @staticmethod
+    async def archive_month(conn: AsyncConnection, month: date) -> dict[str, int]:
+        """한 달치 결제/예약 파티션을 분리해 보관 테이블로 옮기고 삭제.
+
+        Returns:
+            테이블별 보관된 행 수
+        """
+        archived = {}
+        for table in PARTITIONED_TABLES:
+            name = partition_name(table, month)
+            if name not in await PartitionMaintenance._partitions(conn, table):
+                continue
+            await conn.execute(text(f"ALTER TABLE {table} DETACH PARTITION {name}"))
+            result = await conn.execute(
+                text(
+                    "INSERT INTO partition_archives (table_name, month, chunk, row_count, rows) "
+                    "SELECT :table_name, :month, chunk, count(*), jsonb_agg(row ORDER BY id) "
+                    "FROM ("
+                    "  SELECT (row_number() OVER (ORDER BY t.id) - 1) / :chunk_size AS chunk,"
+                    f"         t.id, to_jsonb(t) AS row FROM {name} AS t"
+                    ") AS numbered GROUP BY chunk "
+                    "RETURNING row_count"
+                ),
+                {"table_name": table, "month": month, "chunk_size": ARCHIVE_CHUNK_SIZE},
+            )
+            archived[table] = sum(result.scalars().all())
+            await conn.execute(text(f"DROP TABLE {name}"))
+        return archived
+
+    async def run_maintenance(self, months_ahead: int, retention_months: int) -> None:
+        """파티션 생성 후 보관 대상 월을 한 달씩(월마다 트랜잭션 하나) 보관."""
+        async with engine.begin() as conn:
+            if not await self._try_lock(conn):
+                return
+            created = await self.ensure_partitions(conn, months_ahead)
+            months = await self.archivable_months(conn, retention_months) if retention_months else []
+        if created:
+            logger.info("파티션 생성: %s", ", ".join(created))
+
+        for month in months:
+            async with engine.begin() as conn:
+                if not await self._try_lock(conn):
+                    return
+                archived = await self.archive_month(conn, month)
+            logger.info("파티션 보관 (%s): %s", month.strftime("%Y-%m"), archived)
+
+    async def run_periodic_maintenance(
+        self,
+        interval_seconds: float,
+        months_ahead: int,
+        retention_months: int,
+    ) -> None:
+        """주기적 파티션 관리 루프 (lifespan에서 실행, 시작 시 1회 즉시 실행)."""
+        while True:
+            try:
+                await self.run_maintenance(months_ahead, retention_months)
+            except Exception:
+                logger.exception("파티션 관리 작업 실패")
+            await asyncio.sleep(interval_seconds)
+
+
+partition_maintenance = PartitionMaintenance()
@@ -0,0 +1,83 @@
+"""게시글 조회수 지연 반영 서비스."""
+import asyncio
+import logging
+from uuid import UUID
+
+from sqlalchemy import bindparam, update
+
+from app.db.session import async_session_maker
+from app.models.board import Post
+from app.services.trending import trending_tracker
+
+logger = logging.getLogger(__name__)
+
+_posts = Post.__table__
+
+# 게시글별 누적 증가분을 한 번의 executemany UPDATE로 반영
+_flush_statement = (
+    update(_posts)
+    .where(_posts.c.id == bindparam("post_id"))
+    .values(view_count=_posts.c.view_count + bindparam("delta"))
+)
+
+
+class PostViewCounter:
+    """게시글 조회수 버퍼.
+
+    조회 요청마다 UPDATE/COMMIT을 실행하는 대신 프로세스 메모리에 증가분을
+    모아 두었다가 주기적으로 일괄 반영합니다. 조회 응답 경로에서는 DB 쓰기가
+    발생하지 않습니다.
+    """
+
+    def __init__(self) -> None:
+        self._pending: dict[UUID, int] = {}
+
+    def record(self, post_id: UUID) -> int:
+        """조회 1회 기록 후 반영 대기 중인 증가분 반환."""
+        count = self._pending.get(post_id, 0) + 1
+        self._pending[post_id] = count
+        return count
+
+    def pending(self, post_id: UUID) -> int:
+        """반영 대기 중인 증가분."""
+        return self._pending.get(post_id, 0)
+
+    async def flush(self) -> int:
+        """대기 중인 증가분을 DB에 반영.
+
+        Returns:
+            반영된 게시글 수
+        """
+        if not self._pending:
+            return 0
+
+        pending, self._pending = self._pending, {}
+        params = [{"post_id": post_id, "delta": delta} for post_id, delta in pending.items()]
+
+        try:
+            async with async_session_maker() as session:
+                await session.execute(_flush_statement, params)
+                await session.commit()
+        except Exception:
+            # 반영 실패한 증가분은 다음 주기에 다시 시도
+            for post_id, delta in pending.items():
+                self._pending[post_id] = self._pending.get(post_id, 0) + delta
+            raise
+
+        # 인기글 순위에는 반영된 증가분만 전달
+        for post_id, delta in pending.items():
+            trending_tracker.apply_delta(post_id, views=delta)
+
+        return len(pending)
+
+    async def run_periodic_flush(self, interval_seconds: float) -> None:
+        """주기적 반영 루프 (lifespan에서 실행)."""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("게시글 조회수 반영 실패")
+
+
+post_view_counter = PostViewCounter()
@@ -181,7 +181,6 @@ class ReservationService:
 
         self.db.add(reservation)
         await self.db.flush()
-        await self.db.refresh(reservation)
 
         return reservation
 
@@ -218,7 +217,6 @@ class ReservationService:
         reservation.status = ReservationStatus.CONFIRMED.value
 
         await self.db.flush()
-        await self.db.refresh(reservation)
 
         return reservation
 
@@ -240,6 +238,5 @@ class ReservationService:
         # TODO: 취소 사유 저장 (별도 테이블 또는 필드 필요)
 
         await self.db.flush()
-        await self.db.refresh(reservation)
 
         return reservation
@@ -0,0 +1,199 @@
+"""인기글(트렌딩) 순위 서비스."""
+import asyncio
+import heapq
+import logging
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+from uuid import UUID
+
+from sqlalchemy import select
+
+from app.core.board_constants import (
+    TRENDING_GRAVITY,
+    TRENDING_TOP_K,
+    TRENDING_WEIGHT_COMMENT,
+    TRENDING_WEIGHT_LIKE,
+    TRENDING_WEIGHT_VIEW,
+    TRENDING_WINDOW_DAYS,
+)
+from app.db.session import async_session_maker
+from app.models.board import Post
+from app.models.user import User
+from app.schemas.board import PostListItem
+
+logger = logging.getLogger(__name__)
+
+
+def trending_score(item: PostListItem, now: datetime) -> float:
+    """시간 감쇠 인기 점수 (HN 방식)."""
+    age_hours = max((now - item.created_at).total_seconds() / 3600, 0.0)
+    points = (
+        item.view_count * TRENDING_WEIGHT_VIEW
+        + item.like_count * TRENDING_WEIGHT_LIKE
+        + item.comment_count * TRENDING_WEIGHT_COMMENT
+    )
+    return points / pow(age_hours + 2, TRENDING_GRAVITY)
+
+
+class TrendingTracker:
+    """게시판별 인기글 순위.
+
+    최근 TRENDING_WINDOW_DAYS 이내 게시글만 메모리에 유지하고, 조회/좋아요/댓글
+    카운터 증가분을 받아 갱신합니다. 백그라운드 작업이 주기적으로 점수를 다시
+    계산하여 게시판별 상위 TRENDING_TOP_K개를 만들어 두므로, 조회는 O(k)입니다.
+
+    워커 프로세스마다 독립적이므로 다른 워커의 증가분은 주기적인 재적재(reseed)로
+    반영됩니다.
+    """
+
+    def __init__(self) -> None:
+        self._posts: dict[UUID, PostListItem] = {}
+        self._ranked: dict[UUID, List[PostListItem]] = {}
+        # 재적재 중 반영된 변경 (적재 완료 후 새 목록에 다시 적용)
+        self._reseed_changes: Optional[list[Callable[[], None]]] = None
+
+    def _record(self, change: Callable[[], None]) -> None:
+        if self._reseed_changes is not None:
+            self._reseed_changes.append(change)
+
+    def add(self, post: Post | PostListItem) -> None:
+        """새 게시글 추가 (작성, 복구). Post는 작성자(author)가 로드되어 있어야 합니다.
+
+        순위에는 다음 재계산(rerank)부터 반영됩니다.
+        """
+        self._record(lambda: self.add(post))
+        if post.is_notice:
+            return
+
+        if isinstance(post, PostListItem):
+            item = post.model_copy()
+        else:
+            item = PostListItem(
+                id=post.id,
+                board_id=post.board_id,
+                category_id=post.category_id,
+                author_id=post.author_id,
+                author_name=post.author.name,
+                title=post.title,
+                is_notice=post.is_notice,
+                is_secret=post.is_secret,
+                view_count=post.view_count or 0,
+                like_count=post.like_count or 0,
+                comment_count=post.comment_count or 0,
+                is_answered=bool(post.is_answered),
+                created_at=post.created_at,
+            )
+        self._posts[item.id] = item
+
+    def apply_delta(
+        self,
+        post_id: UUID,
+        views: int = 0,
+        likes: int = 0,
+        comments: int = 0,
+    ) -> None:
+        """카운터 증가분 반영 (집계 대상이 아닌 게시글은 무시)."""
+        self._record(lambda: self.apply_delta(post_id, views, likes, comments))
+        item = self._posts.get(post_id)
+        if item is None:
+            return
+
+        item.view_count += views
+        item.like_count += likes
+        item.comment_count = max(item.comment_count + comments, 0)
+
+    def update_post(self, post: Post) -> None:
+        """게시글 수정 내용 반영 (제목, 분류, 비밀글 여부)."""
+        self._record(lambda: self.update_post(post))
+        item = self._posts.get(post.id)
+        if item is None:
+            return
+
+        item.title = post.title
+        item.category_id = post.category_id
+        item.is_secret = post.is_secret
+        if post.is_notice:
+            self.remove(post.id)
+
+    def remove(self, post_id: UUID) -> None:
+        """삭제된 게시글 제외."""
+        self._record(lambda: self.remove(post_id))
+        self._posts.pop(post_id, None)
+
+    def rerank(self, now: Optional[datetime] = None) -> None:
+        """게시판별 상위 TRENDING_TOP_K개 재계산."""
+        now = now or datetime.now(timezone.utc)
+        window_start = now - timedelta(days=TRENDING_WINDOW_DAYS)
+
+        by_board: dict[UUID, List[PostListItem]] = {}
+        for post_id, item in list(self._posts.items()):
+            if item.created_at < window_start:
+                del self._posts[post_id]
+                continue
+            by_board.setdefault(item.board_id, []).append(item)
+
+        self._ranked = {
+            board_id: heapq.nlargest(
+                TRENDING_TOP_K, items, key=lambda item: trending_score(item, now)
+            )
+            for board_id, items in by_board.items()
+        }
+
+    def top(self, board_id: UUID, limit: int) -> List[PostListItem]:
+        """게시판 인기글 상위 limit개."""
+        return self._ranked.get(board_id, [])[:limit]
+
+    async def reseed(self) -> int:
+        """집계 기간 내 게시글을 DB에서 다시 적재.
+
+        Returns:
+            적재된 게시글 수
+        """
+        # 순환 import 방지 (board 서비스가 이 모듈을 사용)
+        from app.services.board import POST_LIST_COLUMNS
+
+        window_start = datetime.now(timezone.utc) - timedelta(days=TRENDING_WINDOW_DAYS)
+        self._reseed_changes = []
+        try:
+            async with async_session_maker() as session:
+                result = await session.execute(
+                    select(*POST_LIST_COLUMNS)
+                    .join(User, User.id == Post.author_id)
+                    .where(Post.is_notice == False)  # noqa: E712
+                    .where(Post.created_at >= window_start)
+                )
+                rows = result.all()
+        finally:
+            changes, self._reseed_changes = self._reseed_changes, None
+
+        # 조회 중 반영된 변경을 새 목록에 다시 적용 (조회 결과에 이미 포함된 증가분이
+        # 한 번 더 더해질 수 있으나 다음 재적재에서 바로잡힘)
+        self._posts = {row.id: PostListItem.model_validate(row) for row in rows}
+        for change in changes:
+            change()
+        self.rerank()
+        return len(self._posts)
+
+    async def run_periodic_refresh(
+        self,
+        refresh_interval_seconds: float,
+        reseed_interval_seconds: float,
+    ) -> None:
+        """주기적 순위 갱신 루프 (lifespan에서 실행)."""
+        last_reseed: Optional[float] = None
+        while True:
+            try:
+                if last_reseed is None or time.monotonic() - last_reseed >= reseed_interval_seconds:
+                    await self.reseed()
+                    last_reseed = time.monotonic()
+                else:
+                    # 증가분이 없어도 시간 감쇠로 순위가 바뀌므로 매 주기 재계산
+                    self.rerank()
+            except Exception:
+                logger.exception("인기글 순위 갱신 실패")
+            await asyncio.sleep(refresh_interval_seconds)
+
+
+trending_tracker = TrendingTracker()
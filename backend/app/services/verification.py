@@ -0,0 +1,134 @@
+"""휴대폰 인증번호 저장소."""
+import heapq
+import time
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from pydantic import BaseModel
+from redis.asyncio import Redis
+
+from app.core.config import settings
+from app.core.redis import get_redis
+
+# 인증번호 유효 시간 / 인증 완료 후 회원가입까지 유효 시간
+VERIFICATION_CODE_TTL_SECONDS = 3 * 60
+VERIFICATION_TOKEN_TTL_SECONDS = 10 * 60
+
+
+class VerificationRecord(BaseModel):
+    """휴대폰 번호별 인증 상태."""
+
+    code: str
+    verified: bool = False
+    token: Optional[str] = None  # 인증 완료 토큰 (회원가입 시 확인)
+
+
+class VerificationStore(ABC):
+    """인증번호 저장소 인터페이스.
+
+    모든 항목은 TTL과 함께 저장되며, 만료된 항목은 조회되지 않습니다.
+    """
+
+    @abstractmethod
+    async def get(self, phone: str) -> Optional[VerificationRecord]:
+        """인증 상태 조회 (없거나 만료되면 None)."""
+
+    @abstractmethod
+    async def set(self, phone: str, record: VerificationRecord, ttl_seconds: int) -> None:
+        """인증 상태 저장 (기존 항목과 TTL을 덮어씀)."""
+
+    @abstractmethod
+    async def delete(self, phone: str) -> None:
+        """인증 상태 삭제."""
+
+
+class InMemoryVerificationStore(VerificationStore):
+    """프로세스 메모리 저장소 (단일 워커/개발용).
+
+    만료 시각 힙으로 만료된 항목을 쓰기마다 정리하고, 최대 크기를 넘으면
+    만료가 가장 임박한 항목부터 제거합니다.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._data: dict[str, tuple[float, VerificationRecord]] = {}
+        self._expiry_heap: list[tuple[float, str]] = []
+
+    def _evict(self, now: float) -> None:
+        while self._expiry_heap:
+            expires_at, phone = self._expiry_heap[0]
+            entry = self._data.get(phone)
+            # 덮어쓰거나 삭제된 항목의 힙 원소는 그대로 버림
+            if entry is None or entry[0] != expires_at:
+                heapq.heappop(self._expiry_heap)
+                continue
+            if expires_at > now and len(self._data) <= self.max_size:
+                break
+            heapq.heappop(self._expiry_heap)
+            del self._data[phone]
+
+    async def get(self, phone: str) -> Optional[VerificationRecord]:
+        entry = self._data.get(phone)
+        if entry is None:
+            return None
+
+        expires_at, record = entry
+        if expires_at <= time.monotonic():
+            del self._data[phone]
+            return None
+        return record.model_copy()
+
+    async def set(self, phone: str, record: VerificationRecord, ttl_seconds: int) -> None:
+        expires_at = time.monotonic() + ttl_seconds
+        self._data[phone] = (expires_at, record.model_copy())
+        heapq.heappush(self._expiry_heap, (expires_at, phone))
+        self._evict(time.monotonic())
+
+    async def delete(self, phone: str) -> None:
+        self._data.pop(phone, None)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class RedisVerificationStore(VerificationStore):
+    """Redis 저장소 (여러 워커/인스턴스 간 공유).
+
+    만료는 Redis 키 TTL(SET EX)에 맡깁니다.
+    """
+
+    KEY_PREFIX = "verification:"
+
+    def __init__(self, client: Redis):
+        self.client = client
+
+    def _key(self, phone: str) -> str:
+        return f"{self.KEY_PREFIX}{phone}"
+
+    async def get(self, phone: str) -> Optional[VerificationRecord]:
+        value = await self.client.get(self._key(phone))
+        if value is None:
+            return None
+        return VerificationRecord.model_validate_json(value)
+
+    async def set(self, phone: str, record: VerificationRecord, ttl_seconds: int) -> None:
+        await self.client.set(self._key(phone), record.model_dump_json(), ex=ttl_seconds)
+
+    async def delete(self, phone: str) -> None:
+        await self.client.delete(self._key(phone))
+
+
+_verification_store: Optional[VerificationStore] = None
+
+
+def get_verification_store() -> VerificationStore:
+    """설정(VERIFICATION_STORE_BACKEND)에 따른 인증번호 저장소 (의존성 주입용)."""
+    global _verification_store
+    if _verification_store is None:
+        if settings.VERIFICATION_STORE_BACKEND == "redis":
+            _verification_store = RedisVerificationStore(get_redis())
+        else:
+            _verification_store = InMemoryVerificationStore(
+                max_size=settings.VERIFICATION_STORE_MAX_SIZE
+            )
+    return _verification_store
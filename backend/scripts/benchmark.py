@@ -0,0 +1,586 @@
+"""HTTP 부하 테스트/벤치마크 스크립트.
+
+scripts/generate_dataset.py로 적재한 DB를 대상으로 앱(uvicorn)을 띄우고,
+여러 동시 사용자가 실제 사용 흐름(시나리오)을 반복하도록 요청을 보냅니다.
+요청 종류별 p50/p95/p99 지연, 처리량, 요청당 쿼리 수(Server-Timing 헤더)를
+JSON으로 저장하고, 기준(baseline) 결과와 비교해 성능 저하를 표시합니다.
+
+시나리오:
+  auth                로그인 후 내 정보 조회
+  browse_managers     매니저 목록(지역 필터/정렬) 후 상세 조회
+  search_availability 매니저 일주일 스케줄 조회
+  create_reservation  예약 생성
+  read_board          게시글 목록, 상세, 댓글 조회
+  list_board_page     게시글 목록 100개 페이지 조회 (행/초 측정)
+  post_comment        게시글에 댓글 작성
+
+사용법:
+  python scripts/benchmark.py --scale 0.01 --output bench.json
+  python scripts/benchmark.py --scale 0.01 --baseline bench.json            # 저하 시 종료 코드 1
+  python scripts/benchmark.py --url http://localhost:8000 --scenario read_board --duration 60
+
+--scale/--users/--managers는 데이터 생성 시 사용한 값과 같아야 합니다
+(로그인할 휴대폰 번호 범위 계산). 앱을 직접 띄울 때는 요청 제한을 끄고
+SQL 계측을 켭니다.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import httpx
+
+from app.api.v1.endpoints.auth import DEV_VERIFICATION_CODE
+from app.models.reservation import ServiceType
+from scripts.generate_dataset import BOARDS, DEFAULT_VOLUMES, HOSPITALS
+from scripts.seed_managers import AREAS
+
+API = "/api/v1"
+BACKEND_DIR = Path(__file__).parent.parent
+
+# 시나리오별 기본 가중치 (조회 위주)
+DEFAULT_MIX = {
+    "browse_managers": 30,
+    "search_availability": 20,
+    "read_board": 30,
+    "list_board_page": 5,
+    "create_reservation": 8,
+    "post_comment": 7,
+    "auth": 5,
+}
+# list_board_page 페이지 크기 (API 최대값)
+LIST_PAGE_SIZE = 100
+# 성능 저하 판정 기준 (baseline 대비)
+DEFAULT_MAX_LATENCY_REGRESSION = 0.2  # p95 20% 증가
+DEFAULT_MAX_THROUGHPUT_REGRESSION = 0.2  # 처리량 20% 감소
+QUERY_COUNT_TOLERANCE = 0.5  # 요청당 평균 쿼리 수 증가 허용치
+
+
+def _query_count(response: httpx.Response) -> Optional[int]:
+    """Server-Timing 헤더의 쿼리 수 (db;dur=..;desc="N queries")."""
+    for metric in response.headers.get("server-timing", "").split(","):
+        name, _, params = metric.strip().partition(";")
+        if name != "db":
+            continue
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "desc":
+                return int(value.strip('"').split()[0])
+    return None
+
+
+@dataclass
+class EndpointStats:
+    """요청 종류별 측정값."""
+
+    latencies: list[float] = field(default_factory=list)
+    queries: list[int] = field(default_factory=list)
+    errors: int = 0
+    # 응답 목록 항목 수 합계 (목록 시나리오만 기록)
+    rows: int = 0
+    status_codes: dict[int, int] = field(default_factory=lambda: defaultdict(int))
+
+    def record(self, response: Optional[httpx.Response], elapsed: float) -> None:
+        self.latencies.append(elapsed)
+        if response is None:
+            self.errors += 1
+            return
+        self.status_codes[response.status_code] += 1
+        if response.status_code >= 400:
+            self.errors += 1
+        count = _query_count(response)
+        if count is not None:
+            self.queries.append(count)
+
+    def summary(self, duration: float) -> dict[str, Any]:
+        latencies = sorted(self.latencies)
+        if len(latencies) >= 2:
+            cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+            p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+        else:
+            p50 = p95 = p99 = latencies[0] if latencies else 0.0
+        return {
+            "requests": len(latencies),
+            "errors": self.errors,
+            "throughput_rps": round(len(latencies) / duration, 2) if duration else 0.0,
+            "p50_ms": round(p50 * 1000, 2),
+            "p95_ms": round(p95 * 1000, 2),
+            "p99_ms": round(p99 * 1000, 2),
+            "mean_ms": round(statistics.fmean(latencies) * 1000, 2) if latencies else 0.0,
+            "queries_per_request": round(statistics.fmean(self.queries), 2) if self.queries else None,
+            "rows_per_second": round(self.rows / duration, 2) if self.rows and duration else None,
+            "status_codes": {str(code): count for code, count in sorted(self.status_codes.items())},
+        }
+
+
+class Recorder:
+    """요청 측정 기록 (워밍업 중 요청은 버림)."""
+
+    def __init__(self) -> None:
+        self.endpoints: dict[str, EndpointStats] = defaultdict(EndpointStats)
+        self.scenarios: dict[str, EndpointStats] = defaultdict(EndpointStats)
+        self.recording = False
+
+    async def request(
+        self,
+        client: httpx.AsyncClient,
+        name: str,
+        method: str,
+        url: str,
+        **kwargs: Any,
+    ) -> Optional[httpx.Response]:
+        started = time.perf_counter()
+        try:
+            response: Optional[httpx.Response] = await client.request(method, url, **kwargs)
+        except httpx.HTTPError:
+            response = None
+        if self.recording:
+            self.endpoints[name].record(response, time.perf_counter() - started)
+        return response
+
+
+class Context:
+    """데이터셋 규모와 시나리오에서 공유하는 값 (로그인 토큰, 매니저/게시글 ID)."""
+
+    def __init__(self, users: int, managers: int, today: date):
+        self.users = users
+        self.managers = managers
+        self.today = today
+        self.tokens: list[str] = []
+        self.manager_ids: list[str] = []
+        self.manager_user_ids: list[str] = []
+        self.post_ids: dict[str, list[str]] = {}
+        self.areas = [area for areas in AREAS.values() for area in areas]
+
+    def customer_phone(self, rng: random.Random) -> str:
+        """generate_dataset 규칙의 고객 휴대폰 번호 (매니저 다음 1명은 관리자)."""
+        return f"010{rng.randrange(self.managers + 1, self.users):08d}"
+
+    def auth_headers(self, rng: random.Random) -> dict[str, str]:
+        return {"Authorization": f"Bearer {rng.choice(self.tokens)}"}
+
+
+Scenario = Callable[[httpx.AsyncClient, Recorder, Context, random.Random], Awaitable[None]]
+
+
+async def auth(client: httpx.AsyncClient, recorder: Recorder, ctx: Context, rng: random.Random) -> None:
+    response = await recorder.request(
+        client,
+        "POST /auth/login",
+        "POST",
+        f"{API}/auth/login",
+        json={"phone": ctx.customer_phone(rng), "code": DEV_VERIFICATION_CODE},
+    )
+    if response is None or response.status_code != 200:
+        return
+    token = response.json()["access_token"]
+    await recorder.request(
+        client, "GET /users/me", "GET", f"{API}/users/me", headers={"Authorization": f"Bearer {token}"}
+    )
+
+
+async def browse_managers(
+    client: httpx.AsyncClient, recorder: Recorder, ctx: Context, rng: random.Random
+) -> None:
+    params: dict[str, Any] = {
+        "page": rng.randint(1, 5),
+        "limit": 10,
+        "sort_by": rng.choice(["rating", "rating", "services", "reviews"]),
+    }
+    if rng.random() < 0.7:
+        # 앞쪽 지역(인기 지역)일수록 자주 검색
+        params["area"] = ctx.areas[min(int(rng.expovariate(0.2)), len(ctx.areas) - 1)]
+    response = await recorder.request(client, "GET /managers/", "GET", f"{API}/managers/", params=params)
+    items = response.json()["items"] if response is not None and response.status_code == 200 else []
+    manager_id = rng.choice(items)["id"] if items else rng.choice(ctx.manager_ids)
+    await recorder.request(client, "GET /managers/{id}", "GET", f"{API}/managers/{manager_id}")
+
+
+async def search_availability(
+    client: httpx.AsyncClient, recorder: Recorder, ctx: Context, rng: random.Random
+) -> None:
+    start = ctx.today + timedelta(days=rng.randint(0, 14))
+    await recorder.request(
+        client,
+        "GET /managers/{id}/schedules",
+        "GET",
+        f"{API}/managers/{rng.choice(ctx.manager_ids)}/schedules",
+        params={"start_date": start.isoformat(), "end_date": (start + timedelta(days=7)).isoformat()},
+    )
+
+
+async def create_reservation(
+    client: httpx.AsyncClient, recorder: Recorder, ctx: Context, rng: random.Random
+) -> None:
+    hospital_name, hospital_address = rng.choice(HOSPITALS)
+    await recorder.request(
+        client,
+        "POST /reservations/",
+        "POST",
+        f"{API}/reservations/",
+        headers=ctx.auth_headers(rng),
+        json={
+            "service_type": rng.choice([service_type.value for service_type in ServiceType]),
+            "scheduled_date": (ctx.today + timedelta(days=rng.randint(1, 30))).isoformat(),
+            "scheduled_time": f"{rng.randint(8, 17):02d}:00:00",
+            "estimated_hours": rng.choice(["2", "3", "4"]),
+            "hospital_name": hospital_name,
+            "hospital_address": hospital_address,
+            "manager_id": rng.choice(ctx.manager_user_ids) if ctx.manager_user_ids else None,
+        },
+    )
+
+
+def _board_code(ctx: Context, rng: random.Random) -> str:
+    # 앞쪽 게시판(인기 게시판)일수록 자주 조회
+    codes = [code for code in ctx.post_ids if ctx.post_ids[code]]
+    return codes[min(int(rng.expovariate(0.7)), len(codes) - 1)]
+
+
+async def read_board(client: httpx.AsyncClient, recorder: Recorder, ctx: Context, rng: random.Random) -> None:
+    code = _board_code(ctx, rng)
+    page = 1 if rng.random() < 0.7 else rng.randint(2, 20)
+    response = await recorder.request(
+        client, "GET /boards/{code}/posts", "GET", f"{API}/boards/{code}/posts", params={"page": page}
+    )
+    items = response.json()["items"] if response is not None and response.status_code == 200 else []
+    post_id = rng.choice(items)["id"] if items else rng.choice(ctx.post_ids[code])
+    await recorder.request(
+        client, "GET /boards/{code}/posts/{id}", "GET", f"{API}/boards/{code}/posts/{post_id}"
+    )
+    await recorder.request(
+        client,
+        "GET /boards/{code}/posts/{id}/comments",
+        "GET",
+        f"{API}/boards/{code}/posts/{post_id}/comments",
+    )
+
+
+async def list_board_page(
+    client: httpx.AsyncClient, recorder: Recorder, ctx: Context, rng: random.Random
+) -> None:
+    code = _board_code(ctx, rng)
+    name = f"GET /boards/{{code}}/posts?page_size={LIST_PAGE_SIZE}"
+    response = await recorder.request(
+        client,
+        name,
+        "GET",
+        f"{API}/boards/{code}/posts",
+        params={"page": rng.randint(1, 5), "page_size": LIST_PAGE_SIZE},
+    )
+    if recorder.recording and response is not None and response.status_code == 200:
+        recorder.endpoints[name].rows += len(response.json()["items"])
+
+
+async def post_comment(
+    client: httpx.AsyncClient, recorder: Recorder, ctx: Context, rng: random.Random
+) -> None:
+    code = _board_code(ctx, rng)
+    await recorder.request(
+        client,
+        "POST /boards/{code}/posts/{id}/comments",
+        "POST",
+        f"{API}/boards/{code}/posts/{rng.choice(ctx.post_ids[code])}/comments",
+        headers=ctx.auth_headers(rng),
+        json={"content": "벤치마크 댓글입니다."},
+    )
+
+
+SCENARIOS: dict[str, Scenario] = {
+    "auth": auth,
+    "browse_managers": browse_managers,
+    "search_availability": search_availability,
+    "create_reservation": create_reservation,
+    "read_board": read_board,
+    "list_board_page": list_board_page,
+    "post_comment": post_comment,
+}
+
+
+async def prepare(client: httpx.AsyncClient, ctx: Context, sessions: int, rng: random.Random) -> None:
+    """시나리오에서 쓸 로그인 토큰과 매니저/게시글 ID 수집 (측정 제외)."""
+    for _ in range(sessions):
+        response = await client.post(
+            f"{API}/auth/login", json={"phone": ctx.customer_phone(rng), "code": DEV_VERIFICATION_CODE}
+        )
+        if response.status_code == 200:
+            ctx.tokens.append(response.json()["access_token"])
+    if not ctx.tokens:
+        raise RuntimeError("로그인 실패: 데이터셋 규모(--scale/--users/--managers)를 확인하세요.")
+
+    for page in range(1, 6):
+        response = await client.get(f"{API}/managers/", params={"page": page, "limit": 100})
+        response.raise_for_status()
+        for item in response.json()["items"]:
+            ctx.manager_ids.append(item["id"])
+            ctx.manager_user_ids.append(item["user_id"])
+    if not ctx.manager_ids:
+        raise RuntimeError("활성 매니저가 없습니다.")
+
+    for code, _ in BOARDS:
+        response = await client.get(f"{API}/boards/{code}/posts", params={"page_size": 100})
+        ctx.post_ids[code] = (
+            [item["id"] for item in response.json()["items"]] if response.status_code == 200 else []
+        )
+    if not any(ctx.post_ids.values()):
+        raise RuntimeError("게시글이 없습니다.")
+
+
+async def worker(
+    client: httpx.AsyncClient,
+    recorder: Recorder,
+    ctx: Context,
+    mix: dict[str, int],
+    deadline: float,
+    seed: int,
+) -> None:
+    rng = random.Random(seed)
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    while time.perf_counter() < deadline:
+        name = rng.choices(names, weights=weights)[0]
+        started = time.perf_counter()
+        try:
+            await SCENARIOS[name](client, recorder, ctx, rng)
+            failed = False
+        except (httpx.HTTPError, KeyError, ValueError, IndexError):
+            failed = True
+        if recorder.recording:
+            stats = recorder.scenarios[name]
+            stats.latencies.append(time.perf_counter() - started)
+            stats.errors += int(failed)
+
+
+async def run_load(args: argparse.Namespace, base_url: str) -> dict[str, Any]:
+    volumes = {
+        table: getattr(args, table) if getattr(args, table) is not None else max(int(count * args.scale), 1)
+        for table, count in DEFAULT_VOLUMES.items()
+        if table in ("users", "managers")
+    }
+    ctx = Context(max(volumes["users"], volumes["managers"] + 2), volumes["managers"], args.today)
+    mix = {name: DEFAULT_MIX[name] for name in (args.scenario or DEFAULT_MIX)}
+    recorder = Recorder()
+
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=args.timeout) as client:
+        await prepare(client, ctx, args.sessions, random.Random(args.seed))
+
+        started = time.perf_counter()
+        deadline = started + args.warmup + args.duration
+        workers = [
+            asyncio.create_task(worker(client, recorder, ctx, mix, deadline, args.seed + index))
+            for index in range(args.concurrency)
+        ]
+        await asyncio.sleep(args.warmup)
+        recorder.recording = True
+        measured_from = time.perf_counter()
+        await asyncio.gather(*workers)
+        duration = time.perf_counter() - measured_from
+
+    total = EndpointStats()
+    for stats in recorder.endpoints.values():
+        total.latencies.extend(stats.latencies)
+        total.queries.extend(stats.queries)
+        total.errors += stats.errors
+        for code, count in stats.status_codes.items():
+            total.status_codes[code] += count
+
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "base_url": base_url,
+            "duration_seconds": round(duration, 2),
+            "warmup_seconds": args.warmup,
+            "concurrency": args.concurrency,
+            "seed": args.seed,
+            "volumes": volumes,
+            "mix": mix,
+        },
+        "total": total.summary(duration),
+        "scenarios": {name: stats.summary(duration) for name, stats in sorted(recorder.scenarios.items())},
+        "endpoints": {name: stats.summary(duration) for name, stats in sorted(recorder.endpoints.items())},
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BACKEND_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(
+    result: dict[str, Any],
+    baseline: dict[str, Any],
+    max_latency_regression: float,
+    max_throughput_regression: float,
+) -> list[str]:
+    """baseline 대비 성능 저하 목록 (요청 종류별 p95, 처리량, 요청당 쿼리 수)."""
+    regressions = []
+    rows = [("total", result["total"], baseline.get("total"))]
+    rows += [(name, stats, baseline.get("endpoints", {}).get(name)) for name, stats in result["endpoints"].items()]
+
+    print(f"\n{'요청':<42} {'p95 ms':>18} {'처리량 rps':>18} {'쿼리/요청':>14}")
+    for name, current, base in rows:
+        if not base or not base["requests"] or not current["requests"]:
+            print(f"{name:<42} {current['p95_ms']:>18} {current['throughput_rps']:>18} {'(기준 없음)':>14}")
+            continue
+
+        p95_change = current["p95_ms"] / base["p95_ms"] - 1 if base["p95_ms"] else 0.0
+        rps_change = current["throughput_rps"] / base["throughput_rps"] - 1 if base["throughput_rps"] else 0.0
+        queries, base_queries = current["queries_per_request"], base["queries_per_request"]
+        print(
+            f"{name:<42} {base['p95_ms']:>7} → {current['p95_ms']:<7} ({p95_change:+.0%})"
+            f" {base['throughput_rps']:>7} → {current['throughput_rps']:<7} ({rps_change:+.0%})"
+            f" {base_queries} → {queries}"
+        )
+
+        if p95_change > max_latency_regression:
+            regressions.append(f"{name}: p95 {base['p95_ms']}ms → {current['p95_ms']}ms ({p95_change:+.0%})")
+        if name == "total" and rps_change < -max_throughput_regression:
+            regressions.append(
+                f"{name}: 처리량 {base['throughput_rps']} → {current['throughput_rps']} rps ({rps_change:+.0%})"
+            )
+        if queries is not None and base_queries is not None and queries > base_queries + QUERY_COUNT_TOLERANCE:
+            regressions.append(f"{name}: 요청당 쿼리 {base_queries} → {queries}")
+    return regressions
+
+
+class AppServer:
+    """벤치마크용 uvicorn 프로세스 (요청 제한 끔, SQL 계측 켬)."""
+
+    def __init__(self, port: int, workers: int):
+        self.port = port
+        self.workers = workers
+        self.process: Optional[subprocess.Popen[bytes]] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    async def start(self, timeout: float = 60) -> None:
+        env = {**os.environ, "RATE_LIMIT_ENABLED": "false", "SQL_INSTRUMENTATION_ENABLED": "true"}
+        self.process = subprocess.Popen(
+            [
+                sys.executable, "-m", "uvicorn", "app.main:app",
+                "--host", "127.0.0.1",
+                "--port", str(self.port),
+                "--workers", str(self.workers),
+                "--log-level", "warning",
+                "--no-access-log",
+            ],
+            cwd=BACKEND_DIR,
+            env=env,
+        )
+        deadline = time.monotonic() + timeout
+        async with httpx.AsyncClient(base_url=self.url) as client:
+            while time.monotonic() < deadline:
+                if self.process.poll() is not None:
+                    raise RuntimeError(f"앱 프로세스 종료 (exit code {self.process.returncode})")
+                try:
+                    if (await client.get("/health")).status_code == 200:
+                        return
+                except httpx.HTTPError:
+                    pass
+                await asyncio.sleep(0.5)
+        self.stop()
+        raise RuntimeError("앱 시작 대기 시간 초과")
+
+    def stop(self) -> None:
+        if self.process is not None and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+
+
+async def benchmark(args: argparse.Namespace) -> dict[str, Any]:
+    if args.url:
+        return await run_load(args, args.url)
+
+    server = AppServer(args.port, args.workers)
+    await server.start()
+    try:
+        return await run_load(args, server.url)
+    finally:
+        server.stop()
+
+
+def main() -> int:
+    """메인 함수."""
+    parser = argparse.ArgumentParser(description="HTTP 부하 테스트/벤치마크")
+    parser.add_argument("--url", help="이미 실행 중인 앱 주소 (없으면 uvicorn을 직접 실행)")
+    parser.add_argument("--port", type=int, default=8765, help="직접 실행할 앱 포트")
+    parser.add_argument("--workers", type=int, default=1, help="직접 실행할 앱 워커 수")
+    parser.add_argument("--scenario", action="append", choices=list(SCENARIOS), help="실행할 시나리오 (반복 지정, 기본: 전체)")
+    parser.add_argument("--concurrency", type=int, default=32, help="동시 가상 사용자 수")
+    parser.add_argument("--duration", type=float, default=30, help="측정 시간(초)")
+    parser.add_argument("--warmup", type=float, default=5, help="측정 전 워밍업 시간(초)")
+    parser.add_argument("--timeout", type=float, default=30, help="요청 타임아웃(초)")
+    parser.add_argument("--sessions", type=int, default=50, help="미리 로그인해 둘 고객 수")
+    parser.add_argument("--seed", type=int, default=42, help="시나리오 난수 seed")
+    parser.add_argument("--scale", type=float, default=1.0, help="데이터 생성 시 사용한 규모 배율")
+    parser.add_argument("--users", type=int, default=None, help="데이터 생성 시 사용한 사용자 수")
+    parser.add_argument("--managers", type=int, default=None, help="데이터 생성 시 사용한 매니저 수")
+    parser.add_argument("--today", type=date.fromisoformat, default=date.today(), help="예약/스케줄 기준일")
+    parser.add_argument("--output", type=Path, default=Path("benchmark-results.json"), help="결과 JSON 경로")
+    parser.add_argument("--baseline", type=Path, help="비교할 기준 결과 JSON")
+    parser.add_argument("--max-latency-regression", type=float, default=DEFAULT_MAX_LATENCY_REGRESSION)
+    parser.add_argument("--max-throughput-regression", type=float, default=DEFAULT_MAX_THROUGHPUT_REGRESSION)
+    args = parser.parse_args()
+
+    result = asyncio.run(benchmark(args))
+    args.output.write_text(json.dumps(result, ensure_ascii=False, indent=2))
+
+    print(f"\n{'요청':<42} {'건수':>8} {'오류':>6} {'rps':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'쿼리':>6}")
+    for name, stats in [("total", result["total"]), *result["endpoints"].items()]:
+        print(
+            f"{name:<42} {stats['requests']:>8} {stats['errors']:>6} {stats['throughput_rps']:>8}"
+            f" {stats['p50_ms']:>8} {stats['p95_ms']:>8} {stats['p99_ms']:>8}"
+            f" {stats['queries_per_request'] if stats['queries_per_request'] is not None else '-':>6}"
+        )
+    print(f"\n결과 저장: {args.output}")
+
+    if args.baseline:
+        regressions = compare(
+            result,
+            json.loads(args.baseline.read_text()),
+            args.max_latency_regression,
+            args.max_throughput_regression,
+        )
+        if regressions:
+            print(f"\n성능 저하 {len(regressions)}건")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print("\n기준 대비 성능 저하 없음")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
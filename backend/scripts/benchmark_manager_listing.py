@@ -0,0 +1,143 @@
+"""매니저 목록 조회 경로 비교 벤치마크.
+
+같은 페이지를 두 방식으로 조회/응답 생성/직렬화하여 페이지당 시간과 메모리
+(tracemalloc 최대 할당량)를 비교합니다.
+
+  orm        Manager 전체 행 + joinedload(Manager.user)로 ORM 객체 생성 후 응답 변환 (이전 방식)
+  projected  응답 컬럼만 Row로 조회 후 model_construct (현재 GET /managers/)
+
+사용법:
+  python scripts/benchmark_manager_listing.py
+  python scripts/benchmark_manager_listing.py --limit 10 --limit 100 --iterations 200
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+
+from app.api.v1.endpoints.managers import (
+    MANAGER_LIST_COLUMNS,
+    _build_manager_list_item,
+    _build_manager_response,
+)
+from app.db.session import async_session_maker, engine
+from app.models.manager import Manager, ManagerStatus
+from app.models.user import User
+from app.schemas.manager import ManagerListResponse
+
+Page = Callable[[AsyncSession, int], Awaitable[str]]
+
+
+async def orm_page(db: AsyncSession, limit: int) -> str:
+    result = await db.execute(
+        select(Manager)
+        .options(joinedload(Manager.user))
+        .where(Manager.status == ManagerStatus.ACTIVE.value)
+        .order_by(Manager.rating.desc())
+        .limit(limit)
+    )
+    managers = result.scalars().unique().all()
+    response = ManagerListResponse(
+        items=[_build_manager_response(manager) for manager in managers],
+        total=len(managers),
+        page=1,
+        limit=limit,
+    )
+    return response.model_dump_json()
+
+
+async def projected_page(db: AsyncSession, limit: int) -> str:
+    result = await db.execute(
+        select(*MANAGER_LIST_COLUMNS)
+        .outerjoin(User, User.id == Manager.user_id)
+        .where(Manager.status == ManagerStatus.ACTIVE.value)
+        .order_by(Manager.rating.desc())
+        .limit(limit)
+    )
+    rows = result.all()
+    response = ManagerListResponse(
+        items=[_build_manager_list_item(row) for row in rows],
+        total=len(rows),
+        page=1,
+        limit=limit,
+    )
+    return response.model_dump_json()
+
+
+PATHS: dict[str, Page] = {"orm": orm_page, "projected": projected_page}
+
+
+async def measure(page: Page, limit: int, iterations: int) -> dict[str, Any]:
+    """페이지당 소요 시간(ms)과 tracemalloc 최대 할당량(KiB)."""
+    # 워밍업 (prepared statement, 커넥션)
+    async with async_session_maker() as db:
+        body = await page(db, limit)
+
+    timings = []
+    async with async_session_maker() as db:
+        for _ in range(iterations):
+            started = time.perf_counter()
+            await page(db, limit)
+            timings.append(time.perf_counter() - started)
+            db.expunge_all()
+
+    # 메모리는 별도 측정 (tracemalloc 추적 비용이 시간에 섞이지 않도록)
+    peaks = []
+    async with async_session_maker() as db:
+        for _ in range(min(iterations, 20)):
+            tracemalloc.start()
+            await page(db, limit)
+            peaks.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+            db.expunge_all()
+
+    p95 = statistics.quantiles(timings, n=20)[18] if len(timings) >= 2 else timings[0]
+    return {
+        "p50_ms": statistics.median(timings) * 1000,
+        "p95_ms": p95 * 1000,
+        "peak_kib": statistics.median(peaks) / 1024,
+        "bytes": len(body),
+    }
+
+
+async def run(limits: list[int], iterations: int) -> None:
+    print(f"{'limit':>6} {'경로':<10} {'p50 ms':>9} {'p95 ms':>9} {'메모리 KiB':>11} {'응답 bytes':>11}")
+    for limit in limits:
+        bodies = {}
+        for name, page in PATHS.items():
+            async with async_session_maker() as db:
+                bodies[name] = await page(db, limit)
+            stats = await measure(page, limit, iterations)
+            print(
+                f"{limit:>6} {name:<10} {stats['p50_ms']:>9.2f} {stats['p95_ms']:>9.2f}"
+                f" {stats['peak_kib']:>11.1f} {stats['bytes']:>11}"
+            )
+        if bodies["orm"] != bodies["projected"]:
+            print(f"  경고: limit={limit} 응답 본문이 서로 다릅니다.")
+    await engine.dispose()
+
+
+def main() -> None:
+    """메인 함수."""
+    parser = argparse.ArgumentParser(description="매니저 목록 조회 경로 비교 벤치마크")
+    parser.add_argument("--limit", type=int, action="append", help="페이지 크기 (반복 지정, 기본: 10, 100)")
+    parser.add_argument("--iterations", type=int, default=100, help="경로/페이지 크기별 반복 횟수")
+    args = parser.parse_args()
+
+    asyncio.run(run(args.limit or [10, 100], args.iterations))
+
+
+if __name__ == "__main__":
+    main()
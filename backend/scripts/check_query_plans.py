@@ -0,0 +1,161 @@
+"""주요 조회 쿼리 실행 계획 검사 스크립트.
+
+대량 데이터가 적재된 DB에서 목록/조회 엔드포인트의 쿼리를 EXPLAIN하여,
+대상 테이블을 순차 스캔(Seq Scan)하는 쿼리가 있으면 실패합니다.
+데이터가 적은 DB에서는 플래너가 순차 스캔을 고를 수 있으므로 결과가 의미 없습니다.
+
+같은 쿼리는 tests/test_query_plans.py에서 enable_seqscan=off로도 검사합니다.
+테스트는 쿼리 조건이 인덱스를 쓸 수 있는지만 확인하고, 실제 데이터 분포에서
+플래너가 인덱스를 고르는지는 이 스크립트로 확인합니다.
+
+사용법:
+  python scripts/check_query_plans.py            # 위반이 있으면 종료 코드 1
+  python scripts/check_query_plans.py --analyze  # 대상 테이블 ANALYZE 후 검사
+"""
+
+import argparse
+import asyncio
+import json
+import re
+import sys
+import uuid
+from datetime import date
+from pathlib import Path
+from typing import Any, Iterator
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import Select, select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.db.session import engine, exclude_deleted
+from app.models.manager import Manager, ManagerSchedule, ManagerStatus
+from app.models.payment import Payment
+from app.models.reservation import Reservation, ReservationStatus
+from app.models.review import Review
+
+TABLES = ["reservations", "manager_schedules", "reviews", "payments", "managers"]
+# 월별 파티션 (reservations_p202610, payments_default 등)은 부모 테이블로 집계
+_PARTITION_SUFFIX = re.compile(r"_(?:p\d{6}|default)$")
+
+
+async def _sample(conn: AsyncConnection, column: Any) -> Any:
+    """쿼리 파라미터로 쓸 실제 값 (없으면 임의 UUID)."""
+    value = (await conn.execute(select(column).where(column.is_not(None)).limit(1))).scalar()
+    return value if value is not None else uuid.uuid4()
+
+
+async def build_queries(conn: AsyncConnection) -> dict[str, Select]:
+    """엔드포인트/서비스와 같은 형태의 쿼리."""
+    user_id = await _sample(conn, Reservation.user_id)
+    manager_user_id = await _sample(conn, Reservation.manager_id)
+    manager_id = await _sample(conn, ManagerSchedule.manager_id)
+    review_manager_id = await _sample(conn, Review.manager_id)
+    reservation_id = await _sample(conn, Payment.reservation_id)
+    reservation_date = (
+        await conn.execute(select(Payment.scheduled_date).where(Payment.reservation_id == reservation_id))
+    ).scalar() or date.today()
+    today = date.today()
+
+    return {
+        "중복 예약 확인": select(Reservation).where(
+            Reservation.manager_id == manager_user_id,
+            Reservation.scheduled_date == today,
+            Reservation.status.in_([
+                ReservationStatus.PENDING.value,
+                ReservationStatus.CONFIRMED.value,
+                ReservationStatus.IN_PROGRESS.value,
+            ]),
+        ),
+        "내 예약 목록": select(Reservation)
+        .where(Reservation.user_id == user_id)
+        .order_by(Reservation.created_at.desc())
+        .limit(20),
+        "매니저 날짜별 스케줄": select(ManagerSchedule).where(
+            ManagerSchedule.manager_id == manager_id,
+            ManagerSchedule.date == today,
+            ManagerSchedule.is_available == True,  # noqa: E712
+        ),
+        "매니저 리뷰 목록": select(Review)
+        .where(Review.manager_id == review_manager_id)
+        .order_by(Review.created_at.desc())
+        .limit(10),
+        "리뷰 중복 확인": select(Review).where(Review.reservation_id == reservation_id),
+        "예약 결제 조회": select(Payment).where(
+            Payment.reservation_id == reservation_id,
+            Payment.scheduled_date == reservation_date,
+        ),
+        "관리자 결제 목록": select(Payment).order_by(Payment.created_at.desc()).limit(20),
+        "매니저 목록 (평점순)": select(Manager)
+        .where(Manager.status == ManagerStatus.ACTIVE.value)
+        .order_by(Manager.rating.desc())
+        .limit(10),
+    }
+
+
+def _plan_nodes(plan: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _plan_nodes(child)
+
+
+async def explain(conn: AsyncConnection, query: Select) -> tuple[str, list[dict[str, Any]]]:
+    """쿼리의 SQL과 EXPLAIN 계획 노드 목록.
+
+    요청 경로와 같이 삭제된 행 제외 조건을 적용합니다 (부분 인덱스 사용 조건).
+    """
+    sql = str(
+        query.options(exclude_deleted()).compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+    result = await conn.execute(text(f"EXPLAIN (FORMAT JSON) {sql}"))
+    plan = result.scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return sql, list(_plan_nodes(plan[0]["Plan"]))
+
+
+async def seq_scan_violations(conn: AsyncConnection) -> list[str]:
+    """대상 테이블을 순차 스캔하는 쿼리 목록."""
+    violations = []
+    for name, query in (await build_queries(conn)).items():
+        sql, nodes = await explain(conn, query)
+        for node in nodes:
+            relation = _PARTITION_SUFFIX.sub("", node.get("Relation Name", ""))
+            if node["Node Type"] == "Seq Scan" and relation in TABLES:
+                violations.append(f"{name}: {node['Relation Name']} 순차 스캔\n  {sql}")
+    return violations
+
+
+async def check_plans(analyze: bool) -> list[str]:
+    """대상 테이블을 순차 스캔하는 쿼리 목록 (설정된 DB 기준)."""
+    async with engine.connect() as conn:
+        if analyze:
+            for table in TABLES:
+                await conn.execute(text(f"ANALYZE {table}"))
+        violations = await seq_scan_violations(conn)
+    await engine.dispose()
+    return violations
+
+
+def main() -> int:
+    """메인 함수."""
+    parser = argparse.ArgumentParser(description="주요 조회 쿼리 실행 계획 검사")
+    parser.add_argument("--analyze", action="store_true", help="검사 전 대상 테이블 ANALYZE")
+    args = parser.parse_args()
+
+    violations = asyncio.run(check_plans(args.analyze))
+    for violation in violations:
+        print(violation)
+    if violations:
+        print(f"\n순차 스캔 쿼리 {len(violations)}건")
+        return 1
+    print("모든 쿼리가 인덱스를 사용합니다.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""서비스 계층 커밋 검사 스크립트.
+
+요청 트랜잭션은 get_db에서 요청이 끝날 때 한 번만 커밋합니다. 서비스는 전달받은
+세션을 flush만 하고, 커밋 후 처리는 app.db.session.after_commit으로 등록해야 합니다.
+서비스가 직접 연 세션(`async with async_session_maker() as session`)과
+커넥션(`async with engine.connect() as conn`, `engine.begin()`)은 예외입니다.
+
+사용법:
+  python scripts/check_service_commits.py   # 위반이 있으면 종료 코드 1
+"""
+
+import ast
+import sys
+from pathlib import Path
+
+SERVICES_DIR = Path(__file__).parent.parent / "app" / "services"
+# 서비스가 직접 열어 커밋할 수 있는 세션/커넥션
+OWNED_FACTORIES = {"async_session_maker", "engine.connect", "engine.begin"}
+
+
+def _owned_sessions(func: ast.AST) -> set[str]:
+    """함수 안에서 직접 연 세션/커넥션 변수 이름."""
+    names = set()
+    for node in ast.walk(func):
+        if not isinstance(node, (ast.With, ast.AsyncWith)):
+            continue
+        for item in node.items:
+            call = item.context_expr
+            if (
+                isinstance(call, ast.Call)
+                and ast.unparse(call.func) in OWNED_FACTORIES
+                and isinstance(item.optional_vars, ast.Name)
+            ):
+                names.add(item.optional_vars.id)
+    return names
+
+
+def check_file(path: Path) -> list[str]:
+    """전달받은 세션을 커밋하는 위치 목록."""
+    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    violations = []
+    for func in ast.walk(tree):
+        if not isinstance(func, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        owned = _owned_sessions(func)
+        for node in ast.walk(func):
+            if not (
+                isinstance(node, ast.Call)
+                and isinstance(node.func, ast.Attribute)
+                and node.func.attr == "commit"
+            ):
+                continue
+            target = node.func.value
+            if isinstance(target, ast.Name) and target.id in owned:
+                continue
+            violations.append(
+                f"{path}:{node.lineno}: {func.name}()에서 {ast.unparse(target)}.commit() 호출"
+            )
+    return violations
+
+
+def main() -> int:
+    """메인 함수."""
+    violations = []
+    for path in sorted(SERVICES_DIR.glob("*.py")):
+        violations.extend(check_file(path))
+
+    for violation in violations:
+        print(violation)
+    if violations:
+        print(f"\n서비스는 커밋하지 않고 flush만 해야 합니다 ({len(violations)}건).")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,645 @@
+"""성능 측정용 대용량 합성 데이터 생성/적재 스크립트.
+
+사용자, 매니저, 매니저 스케줄, 예약, 결제, 리뷰, 게시글, 댓글을 만들어
+asyncpg COPY(copy_records_to_table)로 적재합니다. 같은 seed와 기준일이면
+항상 같은 데이터(ID 포함)가 만들어지므로 벤치마크 결과를 비교할 수 있습니다.
+
+분포는 실제 서비스처럼 치우치게 만듭니다 (--skew, Zipf 지수).
+- 일부 게시판/게시글에 글과 댓글이 몰림
+- 일부 지역(서울 강남 등)에 매니저가 몰리고, 일부 매니저에 예약이 몰림
+- 일부 사용자가 예약/글 작성을 대부분 함
+
+생성된 사용자의 휴대폰 번호는 010XXXXXXXX(사용자 번호 8자리)이고, 개발용
+인증번호로 로그인할 수 있습니다. 0번부터 매니저, 그 다음 1명이 관리자,
+나머지는 고객입니다.
+
+사용법:
+  python scripts/generate_dataset.py --truncate               # 기본 규모 (사용자 100만, 예약 1000만)
+  python scripts/generate_dataset.py --truncate --scale 0.01  # 1% 규모
+  python scripts/generate_dataset.py --truncate --seed 7 --skew 1.2 --reservations 2000000
+"""
+
+import argparse
+import asyncio
+import hashlib
+import itertools
+import random
+import sys
+import time as timer
+import uuid
+from collections.abc import Iterator, Sequence
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Optional
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+
+from app.db.session import engine
+from app.models.manager import ManagerGrade, ManagerStatus
+from app.models.payment import PaymentMethod, PaymentStatus
+from app.models.reservation import ReservationStatus, ServiceType
+from app.models.user import UserRole
+from app.services.partitioning import PartitionMaintenance, add_months, month_start
+from app.services.price import PriceService
+from scripts.seed_managers import (
+    AREAS,
+    BANK_NAMES,
+    CERTIFICATIONS,
+    FIRST_NAMES,
+    INTRODUCTIONS,
+    LAST_NAMES,
+)
+
+# 기본 규모 (--scale로 일괄 조정, 테이블별 옵션으로 개별 지정)
+DEFAULT_VOLUMES = {
+    "users": 1_000_000,
+    "managers": 50_000,
+    "reservations": 10_000_000,
+    "posts": 1_000_000,
+    "comments": 4_000_000,
+}
+# 매니저별 스케줄을 만드는 기간 (기준일부터)
+SCHEDULE_DAYS = 28
+# 예약 날짜 범위 (기준일 기준 과거/미래 일수)
+RESERVATION_HISTORY_DAYS = 730
+RESERVATION_FUTURE_DAYS = 60
+# 게시글 작성일 범위 (기준일 기준 과거 일수)
+POST_HISTORY_DAYS = 365
+# 삭제(soft delete)된 행 비율
+DELETED_RATIO = 0.02
+# 완료된 예약 중 리뷰가 달리는 비율
+REVIEW_RATIO = 0.4
+
+# 합성 게시판 (code, 이름). 앞쪽 게시판일수록 글이 많음
+BOARDS = [
+    ("free", "자유게시판"),
+    ("review", "동행 후기"),
+    ("qna", "질문과 답변"),
+    ("info", "병원 정보"),
+    ("local", "지역 소식"),
+    ("caregiver", "보호자 모임"),
+    ("manager-talk", "매니저 라운지"),
+    ("event", "이벤트"),
+]
+
+HOSPITALS = [
+    ("서울아산병원", "서울 송파구 올림픽로43길 88"),
+    ("삼성서울병원", "서울 강남구 일원로 81"),
+    ("서울대학교병원", "서울 종로구 대학로 101"),
+    ("세브란스병원", "서울 서대문구 연세로 50-1"),
+    ("서울성모병원", "서울 서초구 반포대로 222"),
+    ("분당서울대학교병원", "경기 성남시 분당구 구미로173번길 82"),
+    ("부산대학교병원", "부산 서구 구덕로 179"),
+    ("경북대학교병원", "대구 중구 동덕로 130"),
+    ("인하대학교병원", "인천 중구 인항로 27"),
+    ("충남대학교병원", "대전 중구 문화로 282"),
+]
+DEPARTMENTS = ["내과", "정형외과", "신경과", "안과", "이비인후과", "심장내과", "재활의학과", "종양내과", None]
+REVIEW_TEXTS = [
+    "친절하게 동행해 주셔서 편하게 진료받았습니다.",
+    "시간 약속을 잘 지켜주시고 설명도 꼼꼼히 해주셨어요.",
+    "어머니가 많이 안심하셨습니다. 다음에도 부탁드릴게요.",
+    "대기 시간이 길었는데 끝까지 잘 챙겨주셨습니다.",
+    "조금 늦으셨지만 전반적으로 만족합니다.",
+]
+POST_TITLES = [
+    "병원 동행 처음 이용해봤어요",
+    "대학병원 주차 팁 공유합니다",
+    "진료 예약 변경은 어떻게 하나요?",
+    "매니저님 덕분에 검사 잘 받았습니다",
+    "보호자 없이 병원 가기 괜찮을까요",
+    "요즘 대기 시간이 너무 길어요",
+]
+POST_BODY = "합성 데이터로 생성된 게시글 본문입니다. " * 8
+COMMENT_TEXTS = ["저도 궁금했어요", "좋은 정보 감사합니다", "도움이 됐어요!", "저희도 비슷했어요", "응원합니다"]
+
+COLUMNS = {
+    "users": (
+        "id", "email", "name", "phone", "role", "is_verified",
+        "created_at", "updated_at", "is_active", "is_deleted",
+    ),
+    "managers": (
+        "id", "user_id", "status", "grade", "rating", "total_services", "certifications",
+        "available_areas", "introduction", "bank_name", "bank_account", "is_volunteer",
+        "created_at", "updated_at", "is_active", "is_deleted",
+    ),
+    "manager_schedules": (
+        "id", "manager_id", "date", "start_time", "end_time", "is_available",
+        "created_at", "updated_at", "is_active", "is_deleted",
+    ),
+    "reservations": (
+        "id", "user_id", "manager_id", "service_type", "scheduled_date", "scheduled_time",
+        "estimated_hours", "hospital_name", "hospital_address", "hospital_department",
+        "status", "price", "created_at", "updated_at", "is_active", "is_deleted",
+    ),
+    "payments": (
+        "id", "reservation_id", "scheduled_date", "amount", "method", "status", "payment_key",
+        "paid_at", "refunded_at", "refund_amount", "created_at", "updated_at", "is_active", "is_deleted",
+    ),
+    "reviews": (
+        "id", "reservation_id", "user_id", "manager_id", "rating", "content",
+        "created_at", "updated_at", "is_active", "is_deleted",
+    ),
+    "posts": (
+        "id", "board_id", "author_id", "title", "content", "is_notice", "is_secret",
+        "view_count", "like_count", "comment_count", "is_answered",
+        "created_at", "updated_at", "is_active", "is_deleted",
+    ),
+    "comments": (
+        "id", "post_id", "parent_id", "author_id", "content", "is_secret", "like_count",
+        "created_at", "updated_at", "is_active", "is_deleted",
+    ),
+}
+# --truncate 대상 (참조하는 테이블이 먼저 비워지도록 CASCADE)
+GENERATED_TABLES = ["comments", "posts", "reviews", "payments", "reservations", "manager_schedules", "managers", "users"]
+
+Row = tuple[Any, ...]
+
+
+class Dataset:
+    """seed와 규모로 결정되는 합성 데이터.
+
+    테이블마다 f"{seed}:{table}"로 초기화한 난수 생성기를 따로 쓰므로 한 테이블의
+    규모를 바꿔도 다른 테이블 데이터는 바뀌지 않습니다. ID는 (seed, 테이블, 번호)의
+    해시라 다른 테이블 행을 참조할 때 번호만으로 ID를 다시 계산합니다.
+    """
+
+    def __init__(
+        self,
+        seed: int,
+        volumes: dict[str, int],
+        skew: float,
+        today: date,
+        board_ids: Sequence[uuid.UUID],
+    ):
+        self.seed = seed
+        self.volumes = volumes
+        self.skew = skew
+        self.today = today
+        self.now = datetime.combine(today, time(12), tzinfo=timezone.utc)
+        self.board_ids = list(board_ids)
+
+        self.managers = volumes["managers"]
+        self.admin_index = self.managers
+        # 고객 번호 범위 [customer_start, users)
+        self.customer_start = self.managers + 1
+        self.customers = volumes["users"] - self.customer_start
+        if self.customers <= 0:
+            raise ValueError("users는 managers보다 2 이상 커야 합니다.")
+
+        self._area_weights = self._zipf_cum_weights(sum(len(areas) for areas in AREAS.values()))
+        self._areas = list(itertools.chain.from_iterable(AREAS.values()))
+        self._customer_weights = self._zipf_cum_weights(self.customers)
+        self._manager_weights = self._zipf_cum_weights(self.managers)
+        self._board_weights = self._zipf_cum_weights(len(self.board_ids))
+        # 게시글별 댓글 수 (posts 생성 시 채움, comments 생성에 사용)
+        self._comment_counts: list[int] = []
+
+    # === 공통 ===
+
+    def _rng(self, table: str) -> random.Random:
+        return random.Random(f"{self.seed}:{table}")
+
+    def uuid_for(self, table: str, index: int) -> uuid.UUID:
+        """(seed, 테이블, 번호)로 정해지는 UUID."""
+        digest = hashlib.blake2b(f"{self.seed}:{table}:{index}".encode(), digest_size=16).digest()
+        return uuid.UUID(bytes=digest, version=4)
+
+    def _zipf_cum_weights(self, size: int) -> list[float]:
+        """순위 r의 가중치가 1 / r^skew인 누적 가중치 (skew 0이면 균등)."""
+        return list(itertools.accumulate(1.0 / (rank ** self.skew) for rank in range(1, size + 1)))
+
+    def _pick(self, rng: random.Random, cum_weights: list[float]) -> int:
+        return rng.choices(range(len(cum_weights)), cum_weights=cum_weights)[0]
+
+    def _timestamp(self, rng: random.Random, days_back: int) -> datetime:
+        return self.now - timedelta(seconds=rng.randrange(max(days_back, 1) * 86400))
+
+    @staticmethod
+    def _deleted(rng: random.Random) -> bool:
+        return rng.random() < DELETED_RATIO
+
+    def manager_user_index(self, rng: random.Random) -> int:
+        """예약이 몰리는 매니저일수록 자주 선택 (매니저 번호 = 사용자 번호)."""
+        return self._pick(rng, self._manager_weights)
+
+    def customer_index(self, rng: random.Random) -> int:
+        """활동이 많은 고객일수록 자주 선택."""
+        return self.customer_start + self._pick(rng, self._customer_weights)
+
+    # === 테이블별 행 ===
+
+    def users(self) -> Iterator[Row]:
+        rng = self._rng("users")
+        for index in range(self.volumes["users"]):
+            if index < self.managers:
+                role = UserRole.MANAGER.value
+            elif index == self.admin_index:
+                role = UserRole.ADMIN.value
+            else:
+                role = UserRole.CUSTOMER.value
+            created_at = self._timestamp(rng, 3 * 365)
+            yield (
+                self.uuid_for("users", index),
+                f"user{index}@example.com" if rng.random() < 0.6 else None,
+                f"{rng.choice(LAST_NAMES)}{rng.choice(FIRST_NAMES)}",
+                f"010{index:08d}",
+                role,
+                True,
+                created_at,
+                created_at,
+                True,
+                False,
+            )
+
+    def managers_rows(self) -> Iterator[Row]:
+        rng = self._rng("managers")
+        for index in range(self.managers):
+            # 인기 지역을 주 활동 지역으로 두고 1~3개 지역 선택
+            areas = {self._areas[self._pick(rng, self._area_weights)] for _ in range(rng.randint(1, 3))}
+            grade = rng.choices(
+                [ManagerGrade.NEW.value, ManagerGrade.REGULAR.value, ManagerGrade.PREMIUM.value],
+                weights=[0.3, 0.5, 0.2],
+            )[0]
+            status = rng.choices(
+                [ManagerStatus.ACTIVE.value, ManagerStatus.PENDING.value, ManagerStatus.INACTIVE.value],
+                weights=[0.9, 0.05, 0.05],
+            )[0]
+            created_at = self._timestamp(rng, 3 * 365)
+            yield (
+                self.uuid_for("managers", index),
+                self.uuid_for("users", index),
+                status,
+                grade,
+                # 평점/서비스 수는 리뷰 적재 후 다시 계산
+                Decimal("0.0"),
+                0,
+                rng.sample(CERTIFICATIONS, rng.randint(1, 3)),
+                sorted(areas),
+                rng.choice(INTRODUCTIONS),
+                rng.choice(BANK_NAMES),
+                f"{rng.randint(100, 999)}-{rng.randint(10, 99)}-{rng.randint(100000, 999999)}",
+                rng.random() < 0.05,
+                created_at,
+                created_at,
+                True,
+                self._deleted(rng),
+            )
+
+    def manager_schedules(self) -> Iterator[Row]:
+        rng = self._rng("manager_schedules")
+        index = 0
+        for manager in range(self.managers):
+            manager_id = self.uuid_for("managers", manager)
+            for day in range(SCHEDULE_DAYS):
+                if rng.random() < 0.3:
+                    continue
+                start_hour = rng.randint(7, 14)
+                yield (
+                    self.uuid_for("manager_schedules", index),
+                    manager_id,
+                    self.today + timedelta(days=day),
+                    time(start_hour),
+                    time(start_hour + rng.randint(3, 8)),
+                    rng.random() < 0.8,
+                    self.now,
+                    self.now,
+                    True,
+                    False,
+                )
+                index += 1
+
+    def _reservation_status(self, rng: random.Random, scheduled_date: date) -> str:
+        if scheduled_date > self.today:
+            return rng.choices(
+                [ReservationStatus.PENDING.value, ReservationStatus.CONFIRMED.value, ReservationStatus.CANCELLED.value],
+                weights=[0.3, 0.6, 0.1],
+            )[0]
+        if scheduled_date == self.today:
+            return rng.choice([ReservationStatus.CONFIRMED.value, ReservationStatus.IN_PROGRESS.value])
+        return rng.choices(
+            [ReservationStatus.COMPLETED.value, ReservationStatus.CANCELLED.value],
+            weights=[0.85, 0.15],
+        )[0]
+
+    def reservations(self) -> Iterator[tuple[Row, Optional[Row], Optional[Row]]]:
+        """(예약, 결제, 리뷰) 행. 결제/리뷰는 예약 상태에 따라 없을 수 있음."""
+        rng = self._rng("reservations")
+        service_types = [service_type.value for service_type in ServiceType]
+        for index in range(self.volumes["reservations"]):
+            reservation_id = self.uuid_for("reservations", index)
+            user_index = self.customer_index(rng)
+            scheduled_date = self.today + timedelta(
+                days=rng.randint(-RESERVATION_HISTORY_DAYS, RESERVATION_FUTURE_DAYS)
+            )
+            status = self._reservation_status(rng, scheduled_date)
+            # 대기 중인 예약의 절반은 매니저 미배정
+            manager_index = None
+            if status != ReservationStatus.PENDING.value or rng.random() < 0.5:
+                manager_index = self.manager_user_index(rng)
+            service_type = rng.choice(service_types)
+            scheduled_time = time(rng.randint(7, 19), rng.choice([0, 30]))
+            hours = Decimal(rng.choice(["2.0", "3.0", "4.0", "5.5", "8.0"]))
+            price = PriceService.calculate_base_price(service_type, hours)
+            if PriceService.is_night_or_weekend(scheduled_date, scheduled_time):
+                price += price * PriceService.NIGHT_WEEKEND_SURCHARGE_RATE
+            hospital_name, hospital_address = rng.choice(HOSPITALS)
+            created_at = datetime.combine(scheduled_date, time(9), tzinfo=timezone.utc) - timedelta(
+                days=rng.randint(1, 30)
+            )
+            deleted = self._deleted(rng)
+
+            reservation = (
+                reservation_id,
+                self.uuid_for("users", user_index),
+                self.uuid_for("users", manager_index) if manager_index is not None else None,
+                service_type,
+                scheduled_date,
+                scheduled_time,
+                hours,
+                hospital_name,
+                hospital_address,
+                rng.choice(DEPARTMENTS),
+                status,
+                price.quantize(Decimal("1")),
+                created_at,
+                created_at,
+                True,
+                deleted,
+            )
+
+            payment = None
+            if status != ReservationStatus.PENDING.value or rng.random() < 0.5:
+                if status == ReservationStatus.PENDING.value:
+                    payment_status = PaymentStatus.PENDING.value
+                elif status == ReservationStatus.CANCELLED.value:
+                    payment_status = PaymentStatus.REFUNDED.value
+                else:
+                    payment_status = PaymentStatus.COMPLETED.value
+                paid_at = created_at + timedelta(minutes=rng.randint(1, 60))
+                refunded = payment_status == PaymentStatus.REFUNDED.value
+                payment = (
+                    self.uuid_for("payments", index),
+                    reservation_id,
+                    scheduled_date,
+                    reservation[11],
+                    rng.choice([method.value for method in PaymentMethod]),
+                    payment_status,
+                    f"pk_{index}" if payment_status != PaymentStatus.PENDING.value else None,
+                    paid_at if payment_status != PaymentStatus.PENDING.value else None,
+                    paid_at + timedelta(days=1) if refunded else None,
+                    reservation[11] if refunded else None,
+                    created_at,
+                    created_at,
+                    True,
+                    deleted,
+                )
+
+            review = None
+            if status == ReservationStatus.COMPLETED.value and manager_index is not None and rng.random() < REVIEW_RATIO:
+                reviewed_at = datetime.combine(scheduled_date, time(20), tzinfo=timezone.utc) + timedelta(
+                    days=rng.randint(0, 7)
+                )
+                review = (
+                    self.uuid_for("reviews", index),
+                    reservation_id,
+                    self.uuid_for("users", user_index),
+                    self.uuid_for("users", manager_index),
+                    # API(ReviewCreate)와 같이 1~5 정수 평점
+                    rng.choices([5, 4, 3, 2, 1], weights=[55, 25, 10, 6, 4])[0],
+                    rng.choice(REVIEW_TEXTS),
+                    reviewed_at,
+                    reviewed_at,
+                    True,
+                    self._deleted(rng),
+                )
+
+            yield reservation, payment, review
+
+    def posts(self) -> Iterator[Row]:
+        rng = self._rng("posts")
+        mean_comments = self.volumes["comments"] / max(self.volumes["posts"], 1)
+        self._comment_counts = []
+        for index in range(self.volumes["posts"]):
+            # 파레토(1.5) 평균이 3이므로 게시글당 평균 댓글 수가 mean_comments에 가깝게 맞춰짐
+            comment_count = min(int(rng.paretovariate(1.5) * mean_comments / 3), 5000)
+            self._comment_counts.append(comment_count)
+            created_at = self._timestamp(rng, POST_HISTORY_DAYS)
+            yield (
+                self.uuid_for("posts", index),
+                self.board_ids[self._pick(rng, self._board_weights)],
+                self.uuid_for("users", self.customer_index(rng)),
+                rng.choice(POST_TITLES),
+                POST_BODY,
+                False,
+                rng.random() < 0.02,
+                int(rng.paretovariate(1.2) * 10) + comment_count * 5,
+                int(rng.paretovariate(1.5)) - 1,
+                comment_count,
+                False,
+                created_at,
+                created_at,
+                True,
+                self._deleted(rng),
+            )
+
+    def comments(self) -> Iterator[Row]:
+        """posts()가 정한 게시글별 댓글 수만큼 생성 (posts 다음에 호출)."""
+        rng = self._rng("comments")
+        index = 0
+        for post_index, count in enumerate(self._comment_counts):
+            post_id = self.uuid_for("posts", post_index)
+            first_comment = index
+            for position in range(count):
+                comment_id = self.uuid_for("comments", index)
+                # 20%는 같은 게시글의 앞선 댓글에 대한 답글
+                parent_id = None
+                if position and rng.random() < 0.2:
+                    parent_id = self.uuid_for("comments", rng.randrange(first_comment, index))
+                created_at = self._timestamp(rng, POST_HISTORY_DAYS)
+                yield (
+                    comment_id,
+                    post_id,
+                    parent_id,
+                    self.uuid_for("users", self.customer_index(rng)),
+                    rng.choice(COMMENT_TEXTS),
+                    False,
+                    int(rng.paretovariate(2.0)) - 1,
+                    created_at,
+                    created_at,
+                    True,
+                    False,
+                )
+                index += 1
+
+
+def _batches(rows: Iterator[Any], size: int) -> Iterator[list[Any]]:
+    while batch := list(itertools.islice(rows, size)):
+        yield batch
+
+
+class Loader:
+    """asyncpg COPY 적재와 진행 상황 출력."""
+
+    def __init__(self, connection: Any, batch_size: int):
+        self.connection = connection
+        self.batch_size = batch_size
+        self.counts: dict[str, int] = {}
+
+    async def copy(self, table: str, records: list[Row]) -> None:
+        if not records:
+            return
+        await self.connection.copy_records_to_table(table, records=records, columns=COLUMNS[table])
+        self.counts[table] = self.counts.get(table, 0) + len(records)
+
+    async def load(self, table: str, rows: Iterator[Row]) -> None:
+        started = timer.perf_counter()
+        for batch in _batches(rows, self.batch_size):
+            await self.copy(table, batch)
+            print(f"  {table}: {self.counts[table]:,}", end="\r", flush=True)
+        elapsed = timer.perf_counter() - started
+        print(f"  {table}: {self.counts.get(table, 0):,}행 ({elapsed:.1f}초)")
+
+    async def load_reservations(self, rows: Iterator[tuple[Row, Optional[Row], Optional[Row]]]) -> None:
+        """예약 배치를 적재한 뒤 같은 배치의 결제/리뷰 적재 (결제 외래 키 순서)."""
+        started = timer.perf_counter()
+        for batch in _batches(rows, self.batch_size):
+            await self.copy("reservations", [reservation for reservation, _, _ in batch])
+            await self.copy("payments", [payment for _, payment, _ in batch if payment])
+            await self.copy("reviews", [review for _, _, review in batch if review])
+            print(f"  reservations: {self.counts['reservations']:,}", end="\r", flush=True)
+        elapsed = timer.perf_counter() - started
+        for table in ("reservations", "payments", "reviews"):
+            print(f"  {table}: {self.counts.get(table, 0):,}행", end="")
+        print(f" ({elapsed:.1f}초)")
+
+
+async def _ensure_boards(conn: Any) -> list[uuid.UUID]:
+    """합성 게시판이 없으면 만들고 BOARDS 순서대로 ID 반환."""
+    for sort_order, (code, name) in enumerate(BOARDS, start=10):
+        await conn.execute(
+            text(
+                "INSERT INTO boards (id, code, name, read_permission, write_permission, comment_permission, "
+                "use_category, use_notice, use_secret, use_attachment, use_like, sort_order, is_active, is_deleted) "
+                "VALUES (gen_random_uuid(), :code, :name, 'public', 'member', 'member', "
+                "false, true, true, true, true, :sort_order, true, false) "
+                "ON CONFLICT (code) DO NOTHING"
+            ),
+            {"code": code, "name": name, "sort_order": sort_order},
+        )
+    result = await conn.execute(
+        text("SELECT code, id FROM boards WHERE code = ANY(:codes)"),
+        {"codes": [code for code, _ in BOARDS]},
+    )
+    ids = dict(result.all())
+    return [ids[code] for code, _ in BOARDS]
+
+
+async def generate(args: argparse.Namespace) -> None:
+    volumes = {
+        table: getattr(args, table) if getattr(args, table) is not None else max(int(count * args.scale), 1)
+        for table, count in DEFAULT_VOLUMES.items()
+    }
+    volumes["users"] = max(volumes["users"], volumes["managers"] + 2)
+    print(f"seed={args.seed} skew={args.skew} 기준일={args.today} 규모={volumes}")
+
+    async with engine.connect() as conn:
+        if args.truncate:
+            await conn.execute(text(f"TRUNCATE {', '.join(GENERATED_TABLES)} CASCADE"))
+        board_ids = await _ensure_boards(conn)
+        # 과거 예약이 DEFAULT 파티션에 쌓이지 않도록 예약 기간 전체의 월별 파티션 생성
+        first_month = month_start(args.today - timedelta(days=RESERVATION_HISTORY_DAYS))
+        last_month = add_months(month_start(args.today + timedelta(days=RESERVATION_FUTURE_DAYS)), 1)
+        await PartitionMaintenance.create_partitions(conn, first_month, last_month)
+        await conn.commit()
+
+        dataset = Dataset(
+            seed=args.seed,
+            volumes=volumes,
+            skew=args.skew,
+            today=args.today,
+            board_ids=board_ids,
+        )
+
+        raw = await conn.get_raw_connection()
+        loader = Loader(raw.driver_connection, args.batch_size)
+        started = timer.perf_counter()
+        async with raw.driver_connection.transaction():
+            await raw.driver_connection.execute("SET LOCAL synchronous_commit = off")
+            await loader.load("users", dataset.users())
+            await loader.load("managers", dataset.managers_rows())
+            await loader.load("manager_schedules", dataset.manager_schedules())
+            await loader.load_reservations(dataset.reservations())
+            await loader.load("posts", dataset.posts())
+            await loader.load("comments", dataset.comments())
+
+            # 매니저 리뷰 집계/서비스 수를 적재된 리뷰/완료 예약으로 계산
+            await raw.driver_connection.execute(
+                """
+                UPDATE managers SET
+                    rating = COALESCE(review_stats.rating, 0),
+                    reviews_count = COALESCE(review_stats.reviews_count, 0),
+                    rating_sum = COALESCE(review_stats.rating_sum, 0),
+                    rating_1_count = COALESCE(review_stats.rating_1_count, 0),
+                    rating_2_count = COALESCE(review_stats.rating_2_count, 0),
+                    rating_3_count = COALESCE(review_stats.rating_3_count, 0),
+                    rating_4_count = COALESCE(review_stats.rating_4_count, 0),
+                    rating_5_count = COALESCE(review_stats.rating_5_count, 0),
+                    total_services = COALESCE(service_stats.completed, 0)
+                FROM managers AS m
+                LEFT JOIN (
+                    SELECT
+                        manager_id,
+                        round(avg(rating), 1) AS rating,
+                        count(*) AS reviews_count,
+                        sum(rating) AS rating_sum,
+                        count(*) FILTER (WHERE rating = 1) AS rating_1_count,
+                        count(*) FILTER (WHERE rating = 2) AS rating_2_count,
+                        count(*) FILTER (WHERE rating = 3) AS rating_3_count,
+                        count(*) FILTER (WHERE rating = 4) AS rating_4_count,
+                        count(*) FILTER (WHERE rating = 5) AS rating_5_count
+                    FROM reviews
+                    WHERE NOT is_deleted GROUP BY manager_id
+                ) AS review_stats ON review_stats.manager_id = m.user_id
+                LEFT JOIN (
+                    SELECT manager_id, count(*) AS completed FROM reservations
+                    WHERE status = 'completed' AND NOT is_deleted GROUP BY manager_id
+                ) AS service_stats ON service_stats.manager_id = m.user_id
+                WHERE managers.id = m.id
+                """
+            )
+
+        print("ANALYZE...")
+        for table in GENERATED_TABLES:
+            await raw.driver_connection.execute(f"ANALYZE {table}")
+    await engine.dispose()
+    print(f"완료 ({timer.perf_counter() - started:.1f}초): {loader.counts}")
+
+
+def main() -> None:
+    """메인 함수."""
+    parser = argparse.ArgumentParser(description="성능 측정용 합성 데이터 생성/적재")
+    parser.add_argument("--seed", type=int, default=42, help="난수 seed (같은 seed/기준일이면 같은 데이터)")
+    parser.add_argument("--scale", type=float, default=1.0, help="기본 규모 배율")
+    parser.add_argument("--skew", type=float, default=1.0, help="Zipf 지수 (0이면 균등 분포)")
+    parser.add_argument(
+        "--today",
+        type=date.fromisoformat,
+        default=date.today(),
+        help="기준일 YYYY-MM-DD (기본: 오늘)",
+    )
+    parser.add_argument("--batch-size", type=int, default=20000, help="COPY 한 번에 보낼 행 수")
+    parser.add_argument("--truncate", action="store_true", help="적재 전 대상 테이블 비우기")
+    for table in DEFAULT_VOLUMES:
+        parser.add_argument(f"--{table}", type=int, default=None, help=f"{table} 행 수 (--scale 무시)")
+    args = parser.parse_args()
+
+    asyncio.run(generate(args))
+
+
+if __name__ == "__main__":
+    main()
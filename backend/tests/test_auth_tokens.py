@@ -0,0 +1,117 @@
+"""토큰 갱신(rotation), 재사용 감지, 로그아웃 폐기와 폐기 필터 테스트."""
+import time
+import uuid
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core import revocation as revocation_module
+from app.core.revocation import (
+    _BUCKET_SECONDS,
+    InMemoryRevocationStore,
+    TimeBucketedBloomFilter,
+    TokenRevocation,
+)
+from app.core.security import create_token_pair
+from tests.conftest import create_user
+
+ME = "/api/v1/users/me"
+REFRESH = "/api/v1/auth/refresh"
+LOGOUT = "/api/v1/auth/logout"
+
+
+@pytest.fixture(autouse=True)
+def token_revocation(monkeypatch: pytest.MonkeyPatch) -> TokenRevocation:
+    """테스트마다 비어 있는 메모리 폐기 목록."""
+    revocation = TokenRevocation(InMemoryRevocationStore())
+    monkeypatch.setattr(revocation_module, "_token_revocation", revocation)
+    return revocation
+
+
+def _bearer(access_token: str) -> dict[str, str]:
+    return {"Authorization": f"Bearer {access_token}"}
+
+
+async def _login(db: AsyncSession) -> tuple[str, str]:
+    user = await create_user(db)
+    return create_token_pair(str(user.id))
+
+
+async def test_refresh_token_works_once(db: AsyncSession, client: AsyncClient):
+    _, refresh_token = await _login(db)
+
+    first = await client.post(REFRESH, json={"refresh_token": refresh_token})
+    assert first.status_code == 200
+    assert first.json()["refresh_token"] != refresh_token
+
+    second = await client.post(REFRESH, json={"refresh_token": refresh_token})
+    assert second.status_code == 401
+
+
+async def test_refresh_token_reuse_revokes_login_session(db: AsyncSession, client: AsyncClient):
+    access_token, refresh_token = await _login(db)
+    rotated = (await client.post(REFRESH, json={"refresh_token": refresh_token})).json()
+    assert (await client.get(ME, headers=_bearer(rotated["access_token"]))).status_code == 200
+
+    # 탈취된 이전 refresh 토큰 재사용 -> 같은 로그인 세션의 토큰 전부 폐기
+    reused = await client.post(REFRESH, json={"refresh_token": refresh_token})
+    assert reused.status_code == 401
+
+    assert (await client.get(ME, headers=_bearer(rotated["access_token"]))).status_code == 401
+    assert (await client.get(ME, headers=_bearer(access_token))).status_code == 401
+    response = await client.post(REFRESH, json={"refresh_token": rotated["refresh_token"]})
+    assert response.status_code == 401
+
+
+async def test_logout_revokes_access_and_refresh_tokens(db: AsyncSession, client: AsyncClient):
+    access_token, refresh_token = await _login(db)
+    assert (await client.get(ME, headers=_bearer(access_token))).status_code == 200
+
+    assert (await client.post(LOGOUT, headers=_bearer(access_token))).status_code == 200
+
+    assert (await client.get(ME, headers=_bearer(access_token))).status_code == 401
+    response = await client.post(REFRESH, json={"refresh_token": refresh_token})
+    assert response.status_code == 401
+
+
+async def test_filtered_revocation_check_has_no_false_negatives(monkeypatch: pytest.MonkeyPatch):
+    # 용량을 넘겨 거짓 양성이 많은 작은 필터에서도 폐기된 항목은 모두 감지
+    monkeypatch.setattr(revocation_module.settings, "TOKEN_REVOCATION_FILTER_CAPACITY", 64)
+    revocation = TokenRevocation(InMemoryRevocationStore())
+    expires_at = time.time() + 3600
+    revoked = [uuid.uuid4().hex for _ in range(1000)]
+    for token_id in revoked:
+        await revocation.revoke(token_id, expires_at)
+
+    for token_id in revoked:
+        assert await revocation.is_revoked(token_id)
+    # 필터에 걸린 폐기되지 않은 항목은 저장소 조회로 걸러짐
+    assert not any([await revocation.is_revoked(uuid.uuid4().hex) for _ in range(200)])
+
+
+def test_expired_filter_buckets_are_pruned():
+    bloom = TimeBucketedBloomFilter(capacity_per_bucket=100, error_rate=0.01)
+    now = time.time()
+    bloom.add("expired", now - _BUCKET_SECONDS)
+    bloom.add("current", now)
+    bloom.add("future", now + 3 * _BUCKET_SECONDS)
+
+    bloom.prune(now)
+
+    assert not bloom.might_contain("expired")
+    assert bloom.might_contain("current")
+    assert bloom.might_contain("future")
+    assert len(bloom._buckets) == 2
+
+
+async def test_memory_store_drops_expired_buckets_on_revoke():
+    store = InMemoryRevocationStore()
+    now = time.time()
+    await store.revoke("expired", now - _BUCKET_SECONDS)
+    assert not await store.is_revoked("expired")
+
+    await store.revoke("current", now + 60)
+
+    assert await store.is_revoked("current")
+    assert len(store._buckets) == 1
@@ -0,0 +1,41 @@
+"""라우트별 DB 세션 통계 테스트."""
+from fastapi import Request
+
+from app.db.metrics import current_route, db_route_stats
+from app.db.replica import get_read_db
+from app.db.session import get_db
+
+
+class _Route:
+    path = "/api/v1/things/{id}"
+
+
+def _request() -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/api/v1/things/1",
+            "headers": [],
+            "query_string": b"",
+            "route": _Route(),
+        }
+    )
+
+
+def _requests(route: str) -> int:
+    return db_route_stats.snapshot().get(route, {}).get("requests", 0)
+
+
+async def test_read_and_write_sessions_record_route_requests():
+    route = "GET /api/v1/things/{id}"
+    before = _requests(route)
+
+    # 쿼리를 실행하지 않으므로 커넥션은 체크아웃되지 않음
+    for dependency in (get_db, get_read_db):
+        generator = dependency(_request())
+        await generator.__anext__()
+        assert current_route.get() == route
+        await generator.aclose()
+
+    assert _requests(route) == before + 2
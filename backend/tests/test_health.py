@@ -0,0 +1,36 @@
+"""운영 지표 엔드포인트 권한 테스트."""
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.security import create_access_token
+from app.models.user import UserRole
+from tests.conftest import create_user
+
+
+async def _headers(db: AsyncSession, role: UserRole) -> dict[str, str]:
+    user = await create_user(db, role=role)
+    return {"Authorization": f"Bearer {create_access_token(str(user.id))}"}
+
+
+async def test_rate_limit_metrics_require_admin(db: AsyncSession, client: AsyncClient):
+    path = "/api/v1/health/rate-limits"
+
+    assert (await client.get(path)).status_code == 401
+    response = await client.get(path, headers=await _headers(db, UserRole.CUSTOMER))
+    assert response.status_code == 403
+
+    response = await client.get(path, headers=await _headers(db, UserRole.ADMIN))
+    assert response.status_code == 200
+    assert isinstance(response.json(), dict)
+
+
+async def test_db_metrics_require_admin(db: AsyncSession, client: AsyncClient):
+    path = "/api/v1/health/db"
+
+    assert (await client.get(path)).status_code == 401
+    response = await client.get(path, headers=await _headers(db, UserRole.CUSTOMER))
+    assert response.status_code == 403
+
+    response = await client.get(path, headers=await _headers(db, UserRole.ADMIN))
+    assert response.status_code == 200
+    assert "primary" in response.json()["pools"]
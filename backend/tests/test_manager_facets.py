@@ -0,0 +1,156 @@
+"""매니저 검색 패싯 인덱스 테스트."""
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+import app.services.manager_facets as manager_facets
+from app.models.manager import ManagerStatus
+from app.services.manager_facets import EXPERT_MIN_SERVICES, ManagerFacetIndex
+
+
+def _manager(
+    areas: list[str],
+    certifications: tuple[str, ...] = (),
+    total_services: int = 0,
+    is_volunteer: bool = False,
+    status: str = ManagerStatus.ACTIVE.value,
+    **overrides,
+) -> SimpleNamespace:
+    values = {
+        "id": uuid.uuid4(),
+        "status": status,
+        "is_deleted": False,
+        "available_areas": list(areas),
+        "certifications": list(certifications),
+        "total_services": total_services,
+        "is_volunteer": is_volunteer,
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+class _FakeSession:
+    """reseed 조회 결과를 돌려주고, 조회 도중의 변경을 흉내 내는 세션."""
+
+    def __init__(self, rows, during_query):
+        self._rows = rows
+        self._during_query = during_query
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, _query):
+        self._during_query()
+        return SimpleNamespace(all=lambda: self._rows)
+
+
+async def _loaded_index(monkeypatch: pytest.MonkeyPatch, *managers) -> ManagerFacetIndex:
+    index = ManagerFacetIndex()
+    monkeypatch.setattr(
+        manager_facets, "async_session_maker", lambda: _FakeSession(list(managers), lambda: None)
+    )
+    await index.reseed()
+    return index
+
+
+def test_counts_is_none_until_first_reseed():
+    index = ManagerFacetIndex()
+    index.update(_manager(["강남구"]))
+
+    assert index.counts() is None
+
+
+async def test_facet_counts_ignore_their_own_filter(monkeypatch):
+    index = await _loaded_index(
+        monkeypatch,
+        _manager(["강남구", "서초구"], ["요양보호사"], total_services=EXPERT_MIN_SERVICES),
+        _manager(["강남구"], ["간호조무사"]),
+        _manager(["송파구"], ["요양보호사"], is_volunteer=True),
+    )
+
+    counts = index.counts(area="강남구", certification="요양보호사")
+
+    assert counts.total == 1
+    # 지역 패싯: 자격증 조건만 적용 (다른 지역 수도 표시)
+    assert counts.areas == {"강남구": 1, "서초구": 1, "송파구": 1}
+    # 자격증 패싯: 지역 조건만 적용
+    assert counts.certifications == {"요양보호사": 1, "간호조무사": 1}
+    assert counts.types == {"expert": 1}
+    assert index.counts(area="없는 지역").total == 0
+
+
+async def test_update_and_remove_reuse_slots(monkeypatch):
+    first = _manager(["강남구"])
+    second = _manager(["서초구"])
+    index = await _loaded_index(monkeypatch, first, second)
+
+    index.remove(first.id)
+    # 비트가 모두 꺼진 값은 패싯에서 제거
+    assert index.counts().areas == {"서초구": 1}
+
+    third = _manager(["송파구"], is_volunteer=True)
+    index.update(third)
+    assert index._slots[third.id] == 0
+    assert index.counts().areas == {"서초구": 1, "송파구": 1}
+
+    # 수정은 이전 값을 지우고 다시 배정
+    second.available_areas = ["강남구"]
+    index.update(second)
+    assert index.counts().areas == {"강남구": 1, "송파구": 1}
+    assert sorted(index._slots.values()) == [0, 1]
+
+    # 비활성/삭제된 매니저는 제외
+    second.status = ManagerStatus.INACTIVE.value
+    index.update(second)
+    third.is_deleted = True
+    index.update(third)
+    assert index.counts().total == 0
+    assert index._areas == {}
+    # 이미 제외된 매니저는 무시
+    index.remove(third.id)
+    assert sorted(index._free_slots) == [0, 1]
+
+
+async def test_reseed_replays_updates_applied_during_query(monkeypatch):
+    index = ManagerFacetIndex()
+    kept = _manager(["강남구"])
+    deactivated = _manager(["서초구"])
+    created = _manager(["송파구"], total_services=EXPERT_MIN_SERVICES)
+
+    def during_query():
+        index.update(_manager(["마포구"], id=kept.id))
+        index.update(_manager(["서초구"], id=deactivated.id, status=ManagerStatus.INACTIVE.value))
+        index.update(created)
+
+    monkeypatch.setattr(
+        manager_facets,
+        "async_session_maker",
+        lambda: _FakeSession([kept, deactivated], during_query),
+    )
+
+    assert await index.reseed() == 2
+    counts = index.counts()
+    assert counts.areas == {"마포구": 1, "송파구": 1}
+    assert counts.types == {"new": 1, "expert": 1}
+
+    # 재적재가 끝난 뒤의 변경은 기록하지 않는다
+    index.update(_manager(["강남구"]))
+    assert index._reseed_updates is None
+
+
+async def test_reseed_failure_keeps_previous_counts(monkeypatch):
+    index = await _loaded_index(monkeypatch, _manager(["강남구"]))
+
+    def failing_session():
+        raise RuntimeError("db down")
+
+    monkeypatch.setattr(manager_facets, "async_session_maker", failing_session)
+    with pytest.raises(RuntimeError):
+        await index.reseed()
+
+    assert index._reseed_updates is None
+    assert index.counts().areas == {"강남구": 1}
@@ -0,0 +1,200 @@
+"""게시글/댓글 일괄 관리 테스트 (PostgreSQL)."""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import select, update
+
+import app.services.moderation as moderation
+from app.core.board_constants import ModerationAction, ModerationJobStatus, ModerationTarget
+from app.core.board_exceptions import BoardException
+from app.models.board import BoardCategory, Comment, ModerationJob, Post
+from app.models.user import UserRole
+from app.schemas.board import BulkModerationRequest
+from app.services.moderation import ModerationService, resume_moderation_job
+from app.services.trending import TrendingTracker
+from tests.conftest import create_board, create_post, create_user
+
+_posts = Post.__table__
+_comments = Comment.__table__
+
+
+@pytest.fixture
+def tracker(monkeypatch) -> TrendingTracker:
+    tracker = TrendingTracker()
+    monkeypatch.setattr(moderation, "trending_tracker", tracker)
+    return tracker
+
+
+async def _post_flags(db, post_ids):
+    result = await db.execute(
+        select(_posts.c.id, _posts.c.is_deleted, _posts.c.category_id, _posts.c.updated_by)
+        .where(_posts.c.id.in_(post_ids))
+    )
+    return {row.id: row for row in result.all()}
+
+
+async def _comment_count(db, post_id) -> int:
+    result = await db.execute(select(_posts.c.comment_count).where(_posts.c.id == post_id))
+    return result.scalar_one()
+
+
+async def test_moderate_posts_delete_and_restore_return_changed_ids(db):
+    admin = await create_user(db, UserRole.ADMIN)
+    author = await create_user(db)
+    other = await create_user(db)
+    board = await create_board(db)
+    live = [await create_post(db, board, author) for _ in range(2)]
+    deleted = await create_post(db, board, author, is_deleted=True)
+    untouched = await create_post(db, board, other)
+
+    condition = _posts.c.author_id == author.id
+    deleted_ids = await ModerationService.moderate_posts(
+        db, ModerationAction.DELETE, condition, admin.id
+    )
+    assert set(deleted_ids) == {post.id for post in live}
+
+    flags = await _post_flags(db, [post.id for post in (*live, deleted, untouched)])
+    assert all(flags[post.id].is_deleted for post in (*live, deleted))
+    assert all(flags[post.id].updated_by == admin.id for post in live)
+    assert not flags[untouched.id].is_deleted
+
+    # 이미 삭제된 게시글은 다시 변경되지 않는다
+    assert await ModerationService.moderate_posts(
+        db, ModerationAction.DELETE, condition, admin.id
+    ) == []
+
+    restored_ids = await ModerationService.moderate_posts(
+        db, ModerationAction.RESTORE, condition, admin.id
+    )
+    assert set(restored_ids) == {post.id for post in (*live, deleted)}
+
+
+async def test_moderate_posts_move_only_within_category_board(db):
+    admin = await create_user(db, UserRole.ADMIN)
+    author = await create_user(db)
+    board = await create_board(db)
+    other_board = await create_board(db)
+    category = BoardCategory(board_id=board.id, name="분류")
+    db.add(category)
+    await db.flush()
+    same_board = await create_post(db, board, author)
+    cross_board = await create_post(db, other_board, author)
+
+    moved = await ModerationService.moderate_posts(
+        db,
+        ModerationAction.MOVE,
+        _posts.c.author_id == author.id,
+        admin.id,
+        category,
+    )
+
+    assert moved == [same_board.id]
+    flags = await _post_flags(db, [same_board.id, cross_board.id])
+    assert flags[same_board.id].category_id == category.id
+    assert flags[cross_board.id].category_id is None
+
+
+async def test_moderate_comments_adjusts_comment_count_in_one_statement(db):
+    admin = await create_user(db, UserRole.ADMIN)
+    author = await create_user(db)
+    board = await create_board(db)
+    post = await create_post(db, board, author, comment_count=2)
+    other_post = await create_post(db, board, author, comment_count=1)
+    comments = [
+        Comment(post_id=post.id, author_id=author.id, content="a"),
+        Comment(post_id=post.id, author_id=author.id, content="b"),
+        Comment(post_id=post.id, author_id=author.id, content="c", is_deleted=True),
+        Comment(post_id=other_post.id, author_id=author.id, content="d"),
+    ]
+    db.add_all(comments)
+    await db.flush()
+
+    condition = _comments.c.author_id == author.id
+    assert await ModerationService.moderate_comments(
+        db, ModerationAction.DELETE, condition, admin.id
+    ) == 3
+    assert await _comment_count(db, post.id) == 0
+    assert await _comment_count(db, other_post.id) == 0
+
+    assert await ModerationService.moderate_comments(
+        db, ModerationAction.RESTORE, condition, admin.id
+    ) == 4
+    assert await _comment_count(db, post.id) == 3
+    assert await _comment_count(db, other_post.id) == 1
+
+
+async def test_moderate_comments_never_makes_comment_count_negative(db):
+    admin = await create_user(db, UserRole.ADMIN)
+    author = await create_user(db)
+    board = await create_board(db)
+    post = await create_post(db, board, author, comment_count=0)
+    db.add(Comment(post_id=post.id, author_id=author.id, content="a"))
+    await db.flush()
+
+    assert await ModerationService.moderate_comments(
+        db, ModerationAction.DELETE, _comments.c.post_id == post.id, admin.id
+    ) == 1
+    assert await _comment_count(db, post.id) == 0
+
+
+async def test_apply_updates_trending_after_commit(db, tracker):
+    admin = await create_user(db, UserRole.ADMIN)
+    author = await create_user(db)
+    board = await create_board(db)
+    post = await create_post(db, board, author)
+    notice = await create_post(db, board, author, is_notice=True)
+    await db.commit()
+    tracker.add(post)
+
+    def request(action: ModerationAction) -> BulkModerationRequest:
+        return BulkModerationRequest(
+            target=ModerationTarget.POST, action=action, ids=[post.id, notice.id]
+        )
+
+    condition = _posts.c.id.in_([post.id, notice.id])
+    await ModerationService.apply(db, request(ModerationAction.DELETE), condition, admin.id)
+    # 커밋 전에는 순위 집계를 바꾸지 않는다
+    assert post.id in tracker._posts
+    await db.commit()
+    assert post.id not in tracker._posts
+
+    await ModerationService.apply(db, request(ModerationAction.RESTORE), condition, admin.id)
+    assert post.id not in tracker._posts
+    await db.commit()
+    assert set(tracker._posts) == {post.id}
+
+
+async def test_resume_claims_failed_or_stale_jobs_only(db):
+    admin = await create_user(db, UserRole.ADMIN)
+    author = await create_user(db)
+
+    def job(status: ModerationJobStatus) -> ModerationJob:
+        return ModerationJob(
+            target=ModerationTarget.POST.value,
+            action=ModerationAction.DELETE.value,
+            author_id=author.id,
+            status=status.value,
+            created_by=admin.id,
+            updated_by=admin.id,
+        )
+
+    failed = job(ModerationJobStatus.FAILED)
+    running = job(ModerationJobStatus.RUNNING)
+    stale = job(ModerationJobStatus.RUNNING)
+    completed = job(ModerationJobStatus.COMPLETED)
+    db.add_all([failed, running, stale, completed])
+    await db.flush()
+    await db.execute(
+        update(ModerationJob)
+        .where(ModerationJob.id == stale.id)
+        .values(updated_at=datetime.now(timezone.utc) - timedelta(hours=1))
+    )
+
+    for resumable in (failed, stale):
+        resumed = await resume_moderation_job(db, resumable.id, admin.id)
+        assert resumed.status == ModerationJobStatus.RUNNING.value
+        assert resumed.error is None
+
+    for not_resumable in (running, completed):
+        with pytest.raises(BoardException):
+            await resume_moderation_job(db, not_resumable.id, admin.id)
@@ -0,0 +1,63 @@
+"""예약/결제 월별 파티션 테스트."""
+from datetime import date, time
+from decimal import Decimal
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.reservation import Reservation, ReservationStatus
+from app.services.partitioning import PartitionMaintenance, add_months, month_start, partition_month
+from tests.conftest import create_user
+
+
+def test_add_months_crosses_year_boundaries():
+    assert add_months(date(2026, 10, 1), 3) == date(2027, 1, 1)
+    assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+    assert add_months(date(2026, 3, 1), -27) == date(2023, 12, 1)
+    assert add_months(date(2026, 5, 31), 0) == date(2026, 5, 1)
+
+
+def test_partition_month_parses_monthly_partitions_only():
+    assert partition_month("reservations", "reservations_p202610") == date(2026, 10, 1)
+    assert partition_month("payments", "payments_p202512") == date(2025, 12, 1)
+    assert partition_month("reservations", "reservations_default") is None
+    assert partition_month("reservations", "reservations_p20261") is None
+    assert partition_month("reservations", "payments_p202610") is None
+
+
+async def _reservation(db: AsyncSession, scheduled_date: date, status: ReservationStatus) -> None:
+    user = await create_user(db)
+    db.add(
+        Reservation(
+            user_id=user.id,
+            service_type="hospital",
+            scheduled_date=scheduled_date,
+            scheduled_time=time(10, 0),
+            estimated_hours=Decimal("2.0"),
+            hospital_name="테스트 병원",
+            hospital_address="서울",
+            status=status.value,
+            price=Decimal("30000"),
+        )
+    )
+    await db.flush()
+
+
+async def test_archivable_months_skips_recent_and_open_months(db: AsyncSession):
+    # 테스트 DB에는 이번 달 기준 12개월 전부터 3개월 후까지 파티션이 있음
+    today = month_start(date.today())
+    await _reservation(db, add_months(today, -10), ReservationStatus.CONFIRMED)
+    await _reservation(db, add_months(today, -9), ReservationStatus.COMPLETED)
+    # 보관 기간 안의 진행 중 예약은 결과와 무관
+    await _reservation(db, add_months(today, -2), ReservationStatus.PENDING)
+
+    months = await PartitionMaintenance.archivable_months(
+        await db.connection(), retention_months=6, today=today
+    )
+
+    assert months == [
+        add_months(today, -12),
+        add_months(today, -11),
+        add_months(today, -9),
+        add_months(today, -8),
+        add_months(today, -7),
+    ]
@@ -0,0 +1,72 @@
+"""주요 목록 엔드포인트의 쿼리 예산 테스트 (행 수에 따라 쿼리가 늘지 않는지)."""
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.instrumentation import assert_max_queries
+from app.models.board import Comment
+from app.models.manager import Manager, ManagerStatus
+from app.models.user import UserRole
+from tests.conftest import create_board, create_post, create_user
+
+
+async def test_post_list_query_budget(db: AsyncSession, client: AsyncClient):
+    board = await create_board(db)
+    for _ in range(15):
+        await create_post(db, board, await create_user(db))
+    for _ in range(2):
+        await create_post(db, board, await create_user(db), is_notice=True)
+
+    # 게시판 설정 + 개수 + 목록(작성자 조인) + 공지 (캐시 적재 전)
+    with assert_max_queries(4):
+        response = await client.get(f"/api/v1/boards/{board.code}/posts")
+
+    body = response.json()
+    assert len(body["items"]) == 15
+    assert len(body["notices"]) == 2
+
+    # 게시판 설정/공지 캐시 적재 후에는 개수 + 목록만
+    with assert_max_queries(2):
+        await client.get(f"/api/v1/boards/{board.code}/posts")
+
+
+async def test_comment_list_query_budget(db: AsyncSession, client: AsyncClient):
+    board = await create_board(db)
+    author = await create_user(db)
+    post = await create_post(db, board, author)
+    for _ in range(5):
+        comment = Comment(post_id=post.id, author_id=author.id, content="댓글")
+        db.add(comment)
+        await db.flush()
+        reply = Comment(post_id=post.id, parent_id=comment.id, author_id=author.id, content="답글")
+        db.add(reply)
+        await db.flush()
+        # 답글의 답글
+        db.add(Comment(post_id=post.id, parent_id=reply.id, author_id=author.id, content="답글"))
+    await db.flush()
+    url = f"/api/v1/boards/{board.code}/posts/{post.id}/comments"
+    # 세션에 남은 댓글 객체 대신 조회 결과로 응답하도록
+    db.expire_all()
+
+    # 게시판 설정 + 게시글 + 댓글(작성자 조인), 답글 수와 깊이에 무관
+    with assert_max_queries(3):
+        response = await client.get(url)
+
+    assert response.status_code == 200
+    comments = response.json()
+    assert len(comments) == 5
+    assert all(len(comment["replies"][0]["replies"]) == 1 for comment in comments)
+    assert comments[0]["replies"][0]["replies"][0]["replies"] == []
+
+
+async def test_manager_list_query_budget(db: AsyncSession, client: AsyncClient):
+    for _ in range(12):
+        user = await create_user(db, role=UserRole.MANAGER)
+        db.add(Manager(user_id=user.id, status=ManagerStatus.ACTIVE.value))
+    await db.flush()
+
+    # 개수 + 목록(사용자 조인)
+    with assert_max_queries(2):
+        response = await client.get("/api/v1/managers/", params={"limit": 20})
+
+    assert response.status_code == 200
+    assert len(response.json()["items"]) >= 12
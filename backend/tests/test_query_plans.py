@@ -0,0 +1,62 @@
+"""쿼리 계획 테스트.
+
+빈 테스트 DB에서는 플래너가 순차 스캔을 고르므로 enable_seqscan을 끄고
+쿼리 조건이 (부분) 인덱스의 WHERE 절과 맞는지(인덱스를 쓸 수 있는지)만 확인합니다.
+대량 데이터에서 플래너가 실제로 인덱스를 고르는지는 scripts/check_query_plans.py로 확인합니다.
+"""
+import uuid
+from typing import Any, Dict, List
+
+import pytest
+from sqlalchemy import Select, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from app.models.board import Post
+from app.models.user import User
+from app.services.board import POST_LIST_COLUMNS, PostService
+from scripts import check_query_plans
+
+
+@pytest.fixture
+async def conn(db: AsyncSession) -> AsyncConnection:
+    """순차 스캔을 끈 테스트 트랜잭션 연결."""
+    connection = await db.connection()
+    await connection.execute(text("SET LOCAL enable_seqscan = off"))
+    return connection
+
+
+async def explain(conn: AsyncConnection, query: Select) -> List[Dict[str, Any]]:
+    _, nodes = await check_query_plans.explain(conn, query)
+    return nodes
+
+
+def _index_names(nodes: List[Dict[str, Any]]) -> List[str]:
+    return [node["Index Name"] for node in nodes if "Index Name" in node]
+
+
+async def test_notices_query_uses_partial_notice_index(conn: AsyncConnection):
+    nodes = await explain(conn, PostService.notices_query(uuid.uuid4()))
+
+    assert "ix_posts_board_id_created_at_notices" in _index_names(nodes)
+
+
+async def test_post_listing_query_uses_partial_listing_index(conn: AsyncConnection):
+    # PostService.list_posts(is_notice=False)의 목록 쿼리
+    query = (
+        select(*POST_LIST_COLUMNS)
+        .join(User, User.id == Post.author_id)
+        .where(Post.board_id == uuid.uuid4(), Post.is_notice == False)  # noqa: E712
+        .order_by(Post.created_at.desc())
+        .limit(20)
+    )
+
+    nodes = await explain(conn, query)
+
+    assert "ix_posts_board_id_created_at_listing" in _index_names(nodes)
+
+
+async def test_endpoint_queries_do_not_seq_scan(conn: AsyncConnection):
+    # scripts/check_query_plans.py와 같은 쿼리 목록 (예약/스케줄/리뷰/결제/매니저)
+    violations = await check_query_plans.seq_scan_violations(conn)
+
+    assert violations == []
@@ -0,0 +1,161 @@
+"""토큰 버킷 요청 제한 테스트.
+
+Redis 백엔드의 Lua 스크립트는 fakeredis(lupa)로 실행합니다.
+"""
+import math
+
+import pytest
+from fastapi import HTTPException
+
+from app.core import rate_limit as rate_limit_module
+from app.core.rate_limit import (
+    InMemoryTokenBucketBackend,
+    RateLimiter,
+    RateLimitRule,
+    RedisTokenBucketBackend,
+    TokenBucketBackend,
+)
+
+# 5회 연속 허용, 10초에 5개 충전 (2초에 1개)
+RULE = RateLimitRule(name="test", capacity=5, period_seconds=10)
+
+
+class FakeClock:
+    """time.monotonic / time.time 대체 (수동으로 진행)."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limit_module, "time", fake)
+    return fake
+
+
+@pytest.fixture
+def redis_client():
+    """Lua 스크립트를 실행할 수 있는 메모리 Redis (fakeredis, lupa 필요)."""
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    return fakeredis.FakeAsyncRedis()
+
+
+@pytest.fixture(params=["memory", "redis"])
+def backend(request: pytest.FixtureRequest, clock: FakeClock) -> TokenBucketBackend:
+    if request.param == "redis":
+        return RedisTokenBucketBackend(request.getfixturevalue("redis_client"))
+    return InMemoryTokenBucketBackend()
+
+
+async def test_burst_up_to_capacity_then_reject(backend: TokenBucketBackend):
+    for _ in range(RULE.capacity):
+        assert await backend.consume("user", RULE) == 0
+
+    # 토큰 0개 -> 1개가 찰 때까지 2초
+    assert await backend.consume("user", RULE) == pytest.approx(2.0)
+    # 다른 키는 별도 버킷
+    assert await backend.consume("other", RULE) == 0
+
+
+async def test_tokens_refill_with_elapsed_time(backend: TokenBucketBackend, clock: FakeClock):
+    for _ in range(RULE.capacity):
+        await backend.consume("user", RULE)
+
+    clock.now += 1
+    assert await backend.consume("user", RULE) == pytest.approx(1.0)
+    clock.now += 1
+    assert await backend.consume("user", RULE) == 0
+    assert await backend.consume("user", RULE) > 0
+
+
+async def test_refill_is_capped_at_capacity(backend: TokenBucketBackend, clock: FakeClock):
+    await backend.consume("user", RULE)
+    clock.now += 3600
+
+    for _ in range(RULE.capacity):
+        assert await backend.consume("user", RULE) == 0
+    assert await backend.consume("user", RULE) > 0
+
+
+async def test_rejected_requests_do_not_consume_tokens(backend: TokenBucketBackend, clock: FakeClock):
+    for _ in range(RULE.capacity):
+        await backend.consume("user", RULE)
+    for _ in range(10):
+        await backend.consume("user", RULE)
+
+    # 거부된 요청과 무관하게 2초 뒤 1개 허용
+    clock.now += 2
+    assert await backend.consume("user", RULE) == 0
+
+
+async def test_redis_bucket_key_expires_after_full_refill(redis_client, clock: FakeClock):
+    backend = RedisTokenBucketBackend(redis_client)
+
+    await backend.consume("user", RULE)
+
+    key = f"{RedisTokenBucketBackend.KEY_PREFIX}user"
+    assert await redis_client.ttl(key) == math.ceil(RULE.period_seconds) + 1
+
+
+async def test_memory_shard_evicts_least_recently_used_bucket(clock: FakeClock):
+    backend = InMemoryTokenBucketBackend(shard_count=1, max_keys_per_shard=2)
+    for _ in range(RULE.capacity):
+        await backend.consume("a", RULE)
+    await backend.consume("b", RULE)
+    # a를 다시 사용 -> b가 가장 오래 사용하지 않은 버킷
+    assert await backend.consume("a", RULE) > 0
+
+    await backend.consume("c", RULE)
+
+    assert list(backend._shards[0]) == ["a", "c"]
+    # 제거되지 않은 a는 상태 유지
+    assert await backend.consume("a", RULE) > 0
+
+
+async def test_memory_shards_are_bounded_independently(clock: FakeClock):
+    backend = InMemoryTokenBucketBackend(shard_count=4, max_keys_per_shard=3)
+
+    for index in range(100):
+        await backend.consume(f"user-{index}", RULE)
+
+    assert all(len(shard) == 3 for shard in backend._shards)
+
+
+async def test_rate_limiter_rejects_with_retry_after_and_counts(clock: FakeClock):
+    limiter = RateLimiter(InMemoryTokenBucketBackend(), {"login": "2/60", "signup": "1/3600"})
+
+    await limiter.hit("login", "1.2.3.4")
+    await limiter.hit("login", "1.2.3.4")
+    with pytest.raises(HTTPException) as exc_info:
+        await limiter.hit("login", "1.2.3.4")
+
+    assert exc_info.value.status_code == 429
+    assert exc_info.value.headers["Retry-After"] == "30"
+    # 설정에 없는 규칙은 제한하지 않음
+    for _ in range(10):
+        await limiter.hit("unknown", "1.2.3.4")
+    assert limiter.metrics() == {
+        "login": {"capacity": 2, "period_seconds": 60.0, "rejected": 1},
+        "signup": {"capacity": 1, "period_seconds": 3600.0, "rejected": 0},
+    }
+
+
+async def test_rate_limiter_allows_requests_when_backend_fails():
+    class BrokenBackend(TokenBucketBackend):
+        async def consume(self, key: str, rule: RateLimitRule) -> float:
+            raise ConnectionError("redis down")
+
+    limiter = RateLimiter(BrokenBackend(), {"login": "1/60"})
+
+    await limiter.hit("login", "1.2.3.4")
+    await limiter.hit("login", "1.2.3.4")
+
+    assert limiter.metrics()["login"]["rejected"] == 0
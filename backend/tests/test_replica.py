@@ -0,0 +1,161 @@
+"""읽기 복제본 라우팅과 조회 전용 세션 테스트.
+
+복제본 대신 테스트 DB에 접속하는 엔진과, 접속할 수 없는 주소의 엔진을 사용합니다.
+"""
+import time
+from collections.abc import AsyncIterator
+
+import pytest
+from fastapi import Request, Response
+from sqlalchemy import select, text, update
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.db import replica as replica_module
+from app.db.replica import (
+    PRIMARY_STICKY_COOKIE,
+    ReplicaRouter,
+    get_read_db,
+    read_your_writes_middleware,
+)
+from app.db.session import ReadOnlySessionError
+from app.models.user import User, UserRole
+from tests.conftest import TEST_DATABASE_URL
+
+# 접속이 거부되는 주소 (복제본 장애)
+UNREACHABLE_URL = "postgresql+asyncpg://postgres@127.0.0.1:1/unreachable"
+
+
+def _request(cookies: dict[str, str] | None = None) -> Request:
+    cookie = "; ".join(f"{name}={value}" for name, value in (cookies or {}).items())
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/api/v1/managers/",
+            "headers": [(b"cookie", cookie.encode())] if cookie else [],
+            "query_string": b"",
+        }
+    )
+
+
+@pytest.fixture
+async def router_factory(
+    pg_engine: AsyncEngine, monkeypatch: pytest.MonkeyPatch
+) -> AsyncIterator:
+    """복제본 URL 목록으로 라우터를 만들어 get_read_db에 설정."""
+    routers: list[ReplicaRouter] = []
+
+    def factory(urls: list[str]) -> ReplicaRouter:
+        router = ReplicaRouter(urls)
+        monkeypatch.setattr(replica_module, "_replica_router", router)
+        routers.append(router)
+        return router
+
+    yield factory
+    for router in routers:
+        await router.dispose()
+
+
+async def _read_session(request: Request) -> tuple[AsyncSession, AsyncIterator[AsyncSession]]:
+    generator = get_read_db(request)
+    return await generator.__anext__(), generator
+
+
+def test_candidates_round_robin_over_available_replicas():
+    router = ReplicaRouter([UNREACHABLE_URL, UNREACHABLE_URL, UNREACHABLE_URL])
+    first, second, third = router.replicas
+
+    assert router.candidates() == [first, second, third]
+    assert router.candidates() == [second, third, first]
+
+    second.mark_down()
+    assert router.candidates() == [third, first]
+    assert router.candidates() == [first, third]
+
+
+async def test_read_db_fails_over_to_next_replica(router_factory):
+    router = router_factory([UNREACHABLE_URL, TEST_DATABASE_URL])
+    down, healthy = router.replicas
+
+    session, generator = await _read_session(_request())
+    try:
+        assert (await session.execute(text("SELECT 1"))).scalar() == 1
+        assert session.bind.engine is healthy.engine
+    finally:
+        await generator.aclose()
+
+    assert not down.available
+    assert down.failures == 1
+    # 제외된 복제본은 재시도 시간 전까지 시도하지 않음
+    assert router.candidates() == [healthy]
+
+
+async def test_read_db_falls_back_to_primary_when_no_replica_connects(router_factory):
+    router = router_factory([UNREACHABLE_URL, UNREACHABLE_URL])
+
+    session, generator = await _read_session(_request())
+    try:
+        assert session.bind.pool is replica_module.engine.pool
+    finally:
+        await generator.aclose()
+
+    assert all(not replica.available for replica in router.replicas)
+
+
+async def test_recent_writer_reads_from_primary(router_factory):
+    router = router_factory([TEST_DATABASE_URL])
+
+    async def committed(request: Request) -> Response:
+        request.state.db_committed = True
+        return Response()
+
+    response = await read_your_writes_middleware(_request(), committed)
+    sticky_until = response.headers["set-cookie"].split(";")[0].split("=")[1]
+    assert float(sticky_until) > time.time()
+
+    request = _request({PRIMARY_STICKY_COOKIE: sticky_until})
+    assert router.reads_from_primary(request)
+    session, generator = await _read_session(request)
+    try:
+        assert session.bind.pool is replica_module.engine.pool
+    finally:
+        await generator.aclose()
+
+    expired = _request({PRIMARY_STICKY_COOKIE: str(int(time.time()) - 1)})
+    assert not router.reads_from_primary(expired)
+
+
+async def test_read_session_rejects_writes(router_factory):
+    router_factory([TEST_DATABASE_URL])
+
+    # flush 시점에 거부
+    session, generator = await _read_session(_request())
+    session.add(User(name="조회", phone="01000000000", role=UserRole.CUSTOMER.value))
+    with pytest.raises(ReadOnlySessionError):
+        await session.flush()
+    await generator.aclose()
+
+    # flush하지 않은 변경은 요청이 끝날 때 거부 (조용히 버려지지 않음)
+    session, generator = await _read_session(_request())
+    session.add(User(name="조회", phone="01000000000", role=UserRole.CUSTOMER.value))
+    with pytest.raises(ReadOnlySessionError):
+        await generator.__anext__()
+
+    # ORM DML 문도 거부
+    session, generator = await _read_session(_request())
+    with pytest.raises(ReadOnlySessionError):
+        await session.execute(update(User).values(name="변경"))
+    await generator.aclose()
+
+
+async def test_read_session_transaction_is_read_only(router_factory):
+    router_factory([TEST_DATABASE_URL])
+
+    session, generator = await _read_session(_request())
+    try:
+        await session.execute(select(User.id).limit(1))
+        with pytest.raises(DBAPIError, match="read-only transaction"):
+            await session.execute(text("UPDATE users SET name = name"))
+    finally:
+        await generator.aclose()
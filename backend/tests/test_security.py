@@ -0,0 +1,117 @@
+"""비밀번호 해싱과 비밀글 열람 권한 테스트."""
+import asyncio
+import time
+import uuid
+
+import pytest
+
+from app.core.board_exceptions import BoardException
+from app.core.principal import UserPrincipal
+from app.core.security import (
+    create_secret_post_grant,
+    decode_token,
+    get_password_hash,
+    verify_password_async,
+    verify_secret_post_grant,
+)
+from app.models.board import Post
+from app.services.board import PostService
+
+# bcrypt 검증 1회는 100ms 이상이므로, 이벤트 루프에서 실행하면 지연이 이 값을 크게 넘는다
+MAX_EVENT_LOOP_LAG_SECONDS = 0.05
+
+
+@pytest.fixture(scope="module")
+def password_hash() -> str:
+    return get_password_hash("secret-1234")
+
+
+def _user(role: str = "user") -> UserPrincipal:
+    return UserPrincipal(id=uuid.uuid4(), name="테스트", role=role, is_active=True)
+
+
+def _secret_post(password_hash: str, author_id: uuid.UUID | None = None) -> Post:
+    return Post(
+        id=uuid.uuid4(),
+        author_id=author_id or uuid.uuid4(),
+        is_secret=True,
+        secret_password=password_hash,
+    )
+
+
+async def test_verify_password_async_does_not_block_event_loop(password_hash):
+    """동시 bcrypt 검증 중에도 이벤트 루프의 다른 작업이 지연되지 않는다."""
+    max_lag = 0.0
+    done = asyncio.Event()
+
+    async def measure_lag():
+        nonlocal max_lag
+        interval = 0.005
+        while not done.is_set():
+            started = time.perf_counter()
+            await asyncio.sleep(interval)
+            max_lag = max(max_lag, time.perf_counter() - started - interval)
+
+    monitor = asyncio.create_task(measure_lag())
+    try:
+        started = time.perf_counter()
+        results = await asyncio.gather(
+            *[verify_password_async("secret-1234", password_hash) for _ in range(8)]
+        )
+        elapsed = time.perf_counter() - started
+    finally:
+        done.set()
+        await monitor
+
+    assert all(results)
+    # 검증 자체는 이벤트 루프 지연 허용치보다 오래 걸려야 측정이 의미가 있다
+    assert elapsed > MAX_EVENT_LOOP_LAG_SECONDS
+    assert max_lag < MAX_EVENT_LOOP_LAG_SECONDS
+
+
+async def test_verify_password_async_rejects_wrong_password(password_hash):
+    assert not await verify_password_async("wrong-password", password_hash)
+
+
+def test_secret_post_grant_does_not_expose_password_hash(password_hash):
+    post_id = uuid.uuid4()
+    grant = create_secret_post_grant(post_id, password_hash)
+
+    payload = decode_token(grant)
+    assert payload["sub"] == str(post_id)
+    assert payload["pwh"] not in password_hash
+    assert password_hash[-16:] not in grant
+    assert verify_secret_post_grant(grant, post_id, password_hash)
+
+
+def test_secret_post_grant_is_bound_to_post_and_password(password_hash):
+    post_id = uuid.uuid4()
+    grant = create_secret_post_grant(post_id, password_hash)
+
+    assert not verify_secret_post_grant(grant, uuid.uuid4(), password_hash)
+    assert not verify_secret_post_grant(grant, post_id, get_password_hash("changed-5678"))
+    assert not verify_secret_post_grant("not-a-token", post_id, password_hash)
+
+
+async def test_secret_post_grant_issued_only_after_password_verification(password_hash):
+    author = _user()
+    post = _secret_post(password_hash, author_id=author.id)
+
+    # 작성자, 관리자는 비밀번호를 보내도 열람 권한을 발급하지 않는다
+    assert await PostService.check_secret_post_access(post, author, "secret-1234") is None
+    assert await PostService.check_secret_post_access(post, _user("admin"), "secret-1234") is None
+
+    grant = await PostService.check_secret_post_access(post, _user(), "secret-1234")
+    assert grant and verify_secret_post_grant(grant, post.id, password_hash)
+
+    # 유효한 열람 권한으로 접근하면 새로 발급하지 않는다
+    assert await PostService.check_secret_post_access(post, None, None, grant) is None
+
+
+async def test_secret_post_access_denied_without_valid_password(password_hash):
+    post = _secret_post(password_hash)
+
+    with pytest.raises(BoardException):
+        await PostService.check_secret_post_access(post, _user(), "wrong-password")
+    with pytest.raises(BoardException):
+        await PostService.check_secret_post_access(post, None, None, "forged-grant")
@@ -0,0 +1,33 @@
+"""서비스 계층 커밋 검사 (scripts/check_service_commits.py) 테스트."""
+from pathlib import Path
+
+import pytest
+
+from scripts.check_service_commits import SERVICES_DIR, check_file
+
+
+@pytest.mark.parametrize("path", sorted(SERVICES_DIR.glob("*.py")), ids=lambda path: path.name)
+def test_services_do_not_commit_request_sessions(path: Path):
+    assert check_file(path) == []
+
+
+def test_check_file_allows_only_owned_sessions_and_connections(tmp_path: Path):
+    path = tmp_path / "service.py"
+    path.write_text(
+        "async def owned_session():\n"
+        "    async with async_session_maker() as session:\n"
+        "        await session.commit()\n"
+        "\n"
+        "async def owned_connection():\n"
+        "    async with engine.connect() as conn:\n"
+        "        await conn.commit()\n"
+        "\n"
+        "async def request_session(db):\n"
+        "    await db.commit()\n",
+        encoding="utf-8",
+    )
+
+    violations = check_file(path)
+
+    assert len(violations) == 1
+    assert "request_session()에서 db.commit()" in violations[0]
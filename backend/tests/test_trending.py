@@ -0,0 +1,136 @@
+"""인기글 순위 테스트."""
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+import app.services.trending as trending
+from app.models.board import Post
+from app.models.user import User
+from app.schemas.board import PostListItem
+from app.services.trending import TrendingTracker
+
+BOARD_ID = uuid.uuid4()
+
+
+def _item(**overrides) -> PostListItem:
+    values = {
+        "id": uuid.uuid4(),
+        "board_id": BOARD_ID,
+        "category_id": None,
+        "author_id": uuid.uuid4(),
+        "author_name": "작성자",
+        "title": "제목",
+        "is_notice": False,
+        "is_secret": False,
+        "view_count": 0,
+        "like_count": 0,
+        "comment_count": 0,
+        "is_answered": False,
+        "created_at": datetime.now(timezone.utc) - timedelta(hours=1),
+    }
+    values.update(overrides)
+    return PostListItem(**values)
+
+
+class _FakeSession:
+    """reseed 조회 결과를 돌려주고, 조회 도중의 변경을 흉내 내는 세션."""
+
+    def __init__(self, rows, during_query):
+        self._rows = rows
+        self._during_query = during_query
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, _query):
+        self._during_query()
+        return SimpleNamespace(all=lambda: self._rows)
+
+
+def test_add_post_ranks_after_rerank():
+    tracker = TrendingTracker()
+    author = User(id=uuid.uuid4(), name="작성자")
+    post = Post(
+        id=uuid.uuid4(),
+        board_id=BOARD_ID,
+        author_id=author.id,
+        author=author,
+        title="새 글",
+        is_notice=False,
+        is_secret=False,
+        is_answered=False,
+        created_at=datetime.now(timezone.utc),
+    )
+
+    tracker.add(post)
+    assert tracker.top(BOARD_ID, 10) == []
+
+    tracker.rerank()
+    [item] = tracker.top(BOARD_ID, 10)
+    assert item.id == post.id
+    assert item.author_name == "작성자"
+    assert item.view_count == 0
+
+
+def test_add_ignores_notices():
+    tracker = TrendingTracker()
+    tracker.add(_item(is_notice=True))
+    tracker.rerank()
+    assert tracker.top(BOARD_ID, 10) == []
+
+
+def test_rerank_orders_by_score_and_drops_expired():
+    tracker = TrendingTracker()
+    popular = _item(view_count=100)
+    quiet = _item(view_count=1)
+    expired = _item(view_count=1000, created_at=datetime.now(timezone.utc) - timedelta(days=30))
+    for item in (quiet, popular, expired):
+        tracker.add(item)
+
+    tracker.apply_delta(quiet.id, views=1)
+    tracker.rerank()
+
+    assert [item.id for item in tracker.top(BOARD_ID, 10)] == [popular.id, quiet.id]
+
+
+async def test_reseed_replays_changes_applied_during_query(monkeypatch):
+    tracker = TrendingTracker()
+    kept = _item(view_count=10)
+    removed = _item(view_count=10)
+    created = _item(view_count=0)
+
+    def during_query():
+        tracker.apply_delta(kept.id, views=5)
+        tracker.remove(removed.id)
+        tracker.add(created)
+
+    rows = [kept.model_copy(), removed.model_copy()]
+    monkeypatch.setattr(
+        trending, "async_session_maker", lambda: _FakeSession(rows, during_query)
+    )
+
+    assert await tracker.reseed() == 2
+    top = {item.id: item for item in tracker.top(BOARD_ID, 10)}
+    assert set(top) == {kept.id, created.id}
+    assert top[kept.id].view_count == 15
+
+    # 재적재가 끝난 뒤의 변경은 기록하지 않는다
+    tracker.apply_delta(kept.id, views=1)
+    assert tracker._reseed_changes is None
+
+
+async def test_reseed_failure_stops_recording(monkeypatch):
+    tracker = TrendingTracker()
+
+    def failing_session():
+        raise RuntimeError("db down")
+
+    monkeypatch.setattr(trending, "async_session_maker", failing_session)
+    with pytest.raises(RuntimeError):
+        await tracker.reseed()
+    assert tracker._reseed_changes is None
@@ -0,0 +1,171 @@
+"""휴대폰 인증번호 저장소와 인증/회원가입/로그인 흐름 테스트."""
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.rate_limit import InMemoryTokenBucketBackend, RateLimiter, get_rate_limiter
+from app.main import app as api_app
+from app.services import verification as verification_module
+from app.services.verification import (
+    VERIFICATION_CODE_TTL_SECONDS,
+    InMemoryVerificationStore,
+    VerificationRecord,
+    get_verification_store,
+)
+
+PHONE = "01012345678"
+
+
+class FakeClock:
+    """time.monotonic 대체 (수동으로 진행)."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    fake = FakeClock()
+    monkeypatch.setattr(verification_module, "time", fake)
+    return fake
+
+
+@pytest.fixture
+def store(clock: FakeClock) -> InMemoryVerificationStore:
+    return InMemoryVerificationStore(max_size=100)
+
+
+@pytest.fixture
+def auth_client(client: AsyncClient, store: InMemoryVerificationStore) -> AsyncClient:
+    """로컬 인증번호 저장소와 새 요청 제한기를 쓰는 API 클라이언트."""
+    limiter = RateLimiter(InMemoryTokenBucketBackend(), settings.RATE_LIMIT_RULES)
+    api_app.dependency_overrides[get_verification_store] = lambda: store
+    api_app.dependency_overrides[get_rate_limiter] = lambda: limiter
+    return client
+
+
+async def test_store_expires_records_after_ttl(store, clock):
+    await store.set(PHONE, VerificationRecord(code="123456"), ttl_seconds=60)
+
+    clock.now += 59
+    assert (await store.get(PHONE)).code == "123456"
+    clock.now += 1
+    assert await store.get(PHONE) is None
+    assert len(store) == 0
+
+
+async def test_store_returns_copies(store):
+    await store.set(PHONE, VerificationRecord(code="123456"), ttl_seconds=60)
+
+    record = await store.get(PHONE)
+    record.verified = True
+
+    assert not (await store.get(PHONE)).verified
+
+
+async def test_store_evicts_soonest_expiring_over_max_size(clock):
+    store = InMemoryVerificationStore(max_size=2)
+    await store.set("01000000001", VerificationRecord(code="111111"), ttl_seconds=300)
+    await store.set("01000000002", VerificationRecord(code="222222"), ttl_seconds=100)
+    # 덮어쓴 항목은 새 만료 시각 기준 (이전 힙 원소는 무시)
+    await store.set("01000000002", VerificationRecord(code="222222"), ttl_seconds=600)
+    await store.set("01000000003", VerificationRecord(code="333333"), ttl_seconds=200)
+
+    # 만료가 가장 임박한 항목(방금 넣은 3번)부터 제거
+    assert len(store) == 2
+    assert await store.get("01000000001") is not None
+    assert await store.get("01000000002") is not None
+    assert await store.get("01000000003") is None
+
+
+async def test_store_drops_expired_entries_on_write(store, clock):
+    for index in range(5):
+        await store.set(f"0100000000{index}", VerificationRecord(code="000001"), ttl_seconds=10)
+    clock.now += 11
+
+    await store.set(PHONE, VerificationRecord(code="123456"), ttl_seconds=10)
+
+    assert len(store) == 1
+
+
+async def _send_code(client: AsyncClient, store: InMemoryVerificationStore, phone: str) -> str:
+    response = await client.post("/api/v1/auth/send-code", json={"phone": phone})
+    assert response.status_code == 200
+    return (await store.get(phone)).code
+
+
+async def test_register_and_login_with_sent_codes(
+    db: AsyncSession, auth_client: AsyncClient, store: InMemoryVerificationStore
+):
+    code = await _send_code(auth_client, store, PHONE)
+    response = await auth_client.post(
+        "/api/v1/auth/verify-code", json={"phone": PHONE, "code": code}
+    )
+    verification_token = response.json()["verification_token"]
+    assert verification_token
+
+    response = await auth_client.post(
+        "/api/v1/auth/register",
+        json={"phone": PHONE, "name": "홍길동", "verification_token": verification_token},
+    )
+    assert response.status_code == 201
+    assert response.json()["user"]["phone"] == PHONE
+    # 인증 상태는 가입 후 삭제 (같은 토큰으로 다시 가입 불가)
+    assert await store.get(PHONE) is None
+
+    code = await _send_code(auth_client, store, PHONE)
+    response = await auth_client.post("/api/v1/auth/login", json={"phone": PHONE, "code": code})
+    assert response.status_code == 200
+    assert response.json()["access_token"]
+    assert await store.get(PHONE) is None
+
+
+async def test_verify_code_rejects_wrong_and_expired_codes(
+    auth_client: AsyncClient, store: InMemoryVerificationStore, clock: FakeClock
+):
+    code = await _send_code(auth_client, store, PHONE)
+    wrong = "111111" if code != "111111" else "222222"
+
+    response = await auth_client.post("/api/v1/auth/verify-code", json={"phone": PHONE, "code": wrong})
+    assert response.status_code == 400
+
+    clock.now += VERIFICATION_CODE_TTL_SECONDS
+    response = await auth_client.post("/api/v1/auth/verify-code", json={"phone": PHONE, "code": code})
+    assert response.status_code == 400
+    assert "만료" in response.json()["detail"]
+
+
+async def test_register_requires_verified_token(
+    auth_client: AsyncClient, store: InMemoryVerificationStore
+):
+    await _send_code(auth_client, store, PHONE)
+
+    response = await auth_client.post(
+        "/api/v1/auth/register",
+        json={"phone": PHONE, "name": "홍길동", "verification_token": "forged"},
+    )
+
+    assert response.status_code == 400
+
+
+async def test_verify_code_attempts_are_limited_per_phone(
+    auth_client: AsyncClient, store: InMemoryVerificationStore
+):
+    code = await _send_code(auth_client, store, PHONE)
+    wrong = "111111" if code != "111111" else "222222"
+    attempts = int(settings.RATE_LIMIT_RULES["auth_verify_code_phone"].split("/")[0])
+
+    for _ in range(attempts):
+        response = await auth_client.post(
+            "/api/v1/auth/verify-code", json={"phone": PHONE, "code": wrong}
+        )
+        assert response.status_code == 400
+
+    # 한도를 넘으면 맞는 인증번호도 거부
+    response = await auth_client.post("/api/v1/auth/verify-code", json={"phone": PHONE, "code": code})
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) > 0